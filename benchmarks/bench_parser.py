@@ -0,0 +1,85 @@
+# benchmarks/bench_parser.py
+
+"""
+Micro-benchmark for the RouterOS print parser.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_parser.py [files] [routes]
+"""
+
+import sys
+import time
+
+from network_automation.platforms.mikrotik_routeros.parser import (
+    parse_as_value,
+    parse_detail,
+    parse_table,
+)
+
+
+def file_print_detail(count: int) -> str:
+    lines = ["Flags: X - disabled"]
+    for i in range(count):
+        lines.append(
+            f' {i}   name="flash/backups/nauto_device {i}.backup" type=backup '
+            f"size={i % 900}.{i % 10}KiB last-modified=2025-12-26 20:00:{i % 60:02d}"
+        )
+    return "\n".join(lines)
+
+
+def route_print_terse(count: int) -> str:
+    return "\n".join(
+        f" {i} DAb dst-address={i >> 16 & 255}.{i >> 8 & 255}.{i & 255}.0/24 "
+        f"routing-table=main gateway=192.0.2.{i % 250 + 1} distance=20 scope=40 "
+        f"target-scope=10 immediate-gw=ether1"
+        for i in range(count)
+    )
+
+
+def route_print_as_value(count: int) -> str:
+    return ";".join(
+        f".id=*{i:x};dst-address={i >> 16 & 255}.{i >> 8 & 255}.{i & 255}.0/24;"
+        f"gateway=192.0.2.{i % 250 + 1};distance=20"
+        for i in range(count)
+    )
+
+
+def route_print_table(count: int) -> str:
+    lines = [
+        "Columns: DST-ADDRESS, GATEWAY, DISTANCE",
+        "#     DST-ADDRESS        GATEWAY        DISTANCE",
+    ]
+    for i in range(count):
+        dst = f"{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}.0/24"
+        lines.append(f"{i:<5} {dst:<18} 192.0.2.{i % 250 + 1:<6} 20")
+    return "\n".join(lines)
+
+
+def bench(name: str, func, output: str, records: int, repeat: int = 5):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(output)
+        best = min(best, time.perf_counter() - started)
+
+    assert len(result) == records, (name, len(result))
+
+    print(
+        f"{name:<28} {records:>9} records  {best * 1000:9.1f} ms  "
+        f"{records / best / 1000:8.0f}k rec/s  "
+        f"{len(output) / best / 1_000_000:6.1f} MB/s"
+    )
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    routes = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+
+    bench("/file print detail", parse_detail, file_print_detail(files), files)
+    bench("/ip route print terse", parse_detail, route_print_terse(routes), routes)
+    bench("/ip route print as-value", parse_as_value, route_print_as_value(routes), routes)
+    bench("/ip route print (table)", parse_table, route_print_table(routes), routes)
+
+
+if __name__ == "__main__":
+    main()
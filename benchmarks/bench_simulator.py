@@ -0,0 +1,69 @@
+# benchmarks/bench_simulator.py
+
+"""
+End-to-end client benchmark against the in-process RouterOS simulator.
+
+Measures the real Netmiko/Paramiko path: connect, command round trips
+(sequential vs. batched) and SFTP throughput, under injected latency
+and bandwidth.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_simulator.py [latency_s] [bandwidth_Bps] [commands]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from network_automation.platforms.mikrotik_routeros.client import MikrotikRouterOS
+from network_automation.platforms.mikrotik_routeros.simulator import (
+    RouterOSSimulator,
+    SimulatedRouter,
+)
+
+MIB = 1024 ** 2
+
+
+def timed(name: str, func, unit: str = "", amount: float = 0.0):
+    started = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - started
+
+    rate = f"  {amount / seconds:8.1f} {unit}/s" if amount else ""
+    print(f"{name:<34} {seconds * 1000:9.1f} ms{rate}")
+
+
+def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.02
+    bandwidth = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    commands = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    router = SimulatedRouter(files={"big.bin": bytes(8 * MIB)})
+
+    print(f"latency={latency}s bandwidth={bandwidth or 'unlimited'} B/s")
+
+    with RouterOSSimulator(router, latency=latency, bandwidth=bandwidth) as sim, \
+            tempfile.TemporaryDirectory() as tmp:
+        client = MikrotikRouterOS(**sim.client_params(connect_retries=1))
+        batch = ["/system resource print"] * commands
+
+        local = Path(tmp) / "up.bin"
+        local.write_bytes(bytes(8 * MIB))
+
+        timed("connect + disconnect", lambda: (client.connect(), client.disconnect()))
+
+        with client:
+            timed(f"{commands} commands, sequential", lambda: client.run(batch))
+            timed(f"{commands} commands, batched", lambda: client.run(batch, batch=True))
+            timed(
+                "download 8 MiB",
+                lambda: client.download(files=["big.bin"], local_dir=tmp),
+                "MiB",
+                8,
+            )
+            timed("upload 8 MiB", lambda: client.upload(files=[local]), "MiB", 8)
+
+
+if __name__ == "__main__":
+    main()
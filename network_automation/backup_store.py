@@ -0,0 +1,261 @@
+# network_automation/backup_store.py
+
+"""
+Content-addressed backup repository.
+
+Artifacts (binary backups, text exports) are stored once per SHA-256
+content hash under objects/. Every device has an append-only index
+(index/<host>.jsonl) of timestamp -> hash rows, so an unchanged night
+costs one index row instead of another copy.
+
+Layout:
+    <root>/objects/<hash[:2]>/<hash>
+    <root>/index/<quoted host>.jsonl  (host percent-encoded, no "/" or ":")
+    <root>/tmp/            (in-flight downloads)
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+from network_automation.transfer import file_checksum
+
+# gc() removes tmp/ files older than this (left by crashed runs)
+STALE_TEMP_SECONDS = 86400.0
+
+
+class BackupStore:
+    """
+    Deduplicating store of backup artifacts with per-device history.
+
+    Safe to share between threads: commits, retention and gc() are
+    serialized, so gc() never sees an object without its index row.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+        for sub in ("objects", "index", "tmp"):
+            (self.root / sub).mkdir(parents=True, exist_ok=True)
+
+    # -------------------------------------------------------
+    # Objects
+    # -------------------------------------------------------
+
+    def object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    def temp_path(self) -> Path:
+        """Return a fresh path to download an artifact into."""
+        return self.root / "tmp" / uuid.uuid4().hex
+
+    @contextmanager
+    def staged(self):
+        """
+        Yield a fresh temp path; remove whatever is left there on exit.
+
+        commit() moves the file away, so only failed downloads or
+        commits leave something to clean up.
+        """
+        path = self.temp_path()
+        try:
+            yield path
+        finally:
+            path.unlink(missing_ok=True)
+
+    def commit(
+        self,
+        host: str,
+        kind: str,
+        temp_path: str | Path,
+        digest: str | None = None,
+        *,
+        name: str | None = None,
+        timestamp: datetime | None = None,
+    ) -> dict:
+        """
+        Move a finished artifact into the store and index it.
+
+        If an object with the same hash exists, the temporary file is
+        discarded. digest is computed from the file when not given.
+        Returns the index entry plus "stored" (True if a new object
+        was written).
+        """
+
+        temp_path = Path(temp_path)
+        digest = digest or file_checksum(temp_path)
+        target = self.object_path(digest)
+
+        # Object and index row are written under one lock, so gc()
+        # cannot remove the object before it is referenced
+        with self._lock:
+            stored = not target.exists()
+
+            if stored:
+                target.parent.mkdir(exist_ok=True)
+                os.replace(temp_path, target)
+            else:
+                temp_path.unlink()
+
+            entry = self._append(host, kind, digest, name, timestamp)
+
+        return {**entry, "stored": stored}
+
+    def record(
+        self,
+        host: str,
+        kind: str,
+        digest: str,
+        *,
+        name: str | None = None,
+        timestamp: datetime | None = None,
+    ) -> dict:
+        """
+        Index an object that is already in the store, without a file.
+
+        Used for artifacts known to be unchanged that were not fetched
+        again. Raises FileNotFoundError if the object is gone.
+        """
+
+        with self._lock:
+            if not self.object_path(digest).exists():
+                raise FileNotFoundError(self.object_path(digest))
+
+            entry = self._append(host, kind, digest, name, timestamp)
+
+        return {**entry, "stored": False}
+
+    def _append(self, host, kind, digest, name, timestamp) -> dict:
+        """Append an index row for an existing object (lock held)."""
+        entry = {
+            "timestamp": (timestamp or datetime.now(timezone.utc)).isoformat(),
+            "kind": kind,
+            "name": name,
+            "hash": digest,
+            "size": self.object_path(digest).stat().st_size,
+        }
+
+        with open(self._index_path(host), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+        return entry
+
+    # -------------------------------------------------------
+    # Index
+    # -------------------------------------------------------
+
+    def _index_path(self, host: str) -> Path:
+        # Percent-encode so "/", ".." or IPv6 ":" stay one file in index/
+        return self.root / "index" / f"{quote(host, safe='')}.jsonl"
+
+    def history(self, host: str, kind: str | None = None) -> list[dict]:
+        """Return index entries of host, oldest first."""
+        path = self._index_path(host)
+        if not path.exists():
+            return []
+
+        with open(path, encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+
+        if kind is not None:
+            entries = [e for e in entries if e["kind"] == kind]
+
+        return entries
+
+    def latest(self, host: str, kind: str) -> dict | None:
+        entries = self.history(host, kind)
+        return entries[-1] if entries else None
+
+    # -------------------------------------------------------
+    # Retention
+    # -------------------------------------------------------
+
+    def apply_retention(
+        self,
+        host: str,
+        *,
+        keep_last: int | None = None,
+        keep_days: float | None = None,
+    ) -> int:
+        """
+        Drop old index entries of host.
+
+        Per kind, an entry is kept if it is among the keep_last newest
+        or younger than keep_days. Objects are only deleted by gc().
+        Returns the number of entries removed.
+        """
+
+        with self._lock:
+            entries = self.history(host)
+            if not entries:
+                return 0
+
+            kept = self._retained(entries, keep_last, keep_days)
+
+            path = self._index_path(host)
+            temp = path.with_suffix(".tmp")
+            with open(temp, "w", encoding="utf-8") as f:
+                for entry in kept:
+                    f.write(json.dumps(entry) + "\n")
+            os.replace(temp, path)
+
+        return len(entries) - len(kept)
+
+    @staticmethod
+    def _retained(entries, keep_last, keep_days) -> list[dict]:
+        cutoff = None
+        if keep_days is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=keep_days)
+
+        kept = []
+        for kind in dict.fromkeys(e["kind"] for e in entries):
+            of_kind = [e for e in entries if e["kind"] == kind]
+
+            for position, entry in enumerate(reversed(of_kind)):
+                if keep_last is not None and position < keep_last:
+                    kept.append(entry)
+                elif cutoff and datetime.fromisoformat(entry["timestamp"]) >= cutoff:
+                    kept.append(entry)
+                elif keep_last is None and cutoff is None:
+                    kept.append(entry)
+
+        kept.sort(key=lambda e: e["timestamp"])
+        return kept
+
+    def gc(self) -> int:
+        """
+        Delete objects no longer referenced by any index. Returns count.
+
+        Runs under the store lock, so it is safe while backups are in
+        flight (their downloads live in tmp/ until commit()). tmp/
+        files older than STALE_TEMP_SECONDS are removed as well; they
+        are not counted.
+        """
+        removed = 0
+        cutoff = time.time() - STALE_TEMP_SECONDS
+
+        for path in (self.root / "tmp").iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+        with self._lock:
+            referenced = set()
+            for path in (self.root / "index").glob("*.jsonl"):
+                referenced.update(e["hash"] for e in self.history(unquote(path.stem)))
+
+            for path in (self.root / "objects").glob("*/*"):
+                if path.name not in referenced:
+                    path.unlink()
+                    removed += 1
+
+        return removed
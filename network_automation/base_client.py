@@ -1,8 +1,13 @@
 # network_automation/base_client.py
 
+import hashlib
 import logging
 import time
+from network_automation.cache import CommandCache
 from network_automation.context import ExecutionContext
+from network_automation.facts import FactsStore
+from network_automation.pool import ConnectionPool
+from network_automation.spans import NULL_SPAN, Span
 from netmiko import ConnectHandler, NetmikoTimeoutException, NetmikoAuthenticationException
 
 
@@ -20,6 +25,9 @@ class BaseClient:
         context: ExecutionContext | None = None,
         connect_retries: int = 1,
         connect_delay: int = 1,
+        pool: ConnectionPool | None = None,
+        command_cache: CommandCache | None = None,
+        facts_store: FactsStore | None = None,
     ):
         # Execution context (always present)
         self.context = context or ExecutionContext()
@@ -31,20 +39,162 @@ class BaseClient:
         self.connect_retries = connect_retries
         self.connect_delay = connect_delay
 
+        # Optional shared pool of idle connections
+        self.pool = pool
+
+        # Optional cache of read-only command output (see send_command())
+        self.command_cache = command_cache
+
+        # Optional persistent store of device facts (arch, version)
+        self.facts_store = facts_store
+
         # Netmiko connection handle
         self.conn = None
 
+        # Lazily opened SFTP handle bound to self.conn (see get_sftp())
+        self._sftp = None
+        self._sftp_conn = None
+
+        # Nesting depth of active sessions (see session())
+        self._session_depth = 0
+
+        # Receiver of timing spans of the running workflow (see span())
+        self._recorder = None
+
+    # -------------------------------------------------------
+    # Session handling (shared)
+    # -------------------------------------------------------
+
+    @property
+    def in_session(self) -> bool:
+        """True while a persistent session is open."""
+        return self._session_depth > 0
+
+    def __enter__(self):
+        """
+        Open a persistent session.
+
+        Inside the session, workflows reuse the open connection and
+        skip teardown. The connection is closed when the session exits.
+        """
+        if not self.in_session:
+            self.connect()
+        self._session_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._session_depth -= 1
+        if not self.in_session:
+            self.disconnect()
+        return False
+
+    def session(self):
+        """Return the client as a session context manager."""
+        return self
+
+    # -------------------------------------------------------
+    # Timing spans (shared)
+    # -------------------------------------------------------
+
+    def attach_result(self, recorder):
+        """
+        Send spans to recorder (usually the workflow's OperationResult).
+
+        Returns the previous recorder, to be restored with
+        detach_result() when the workflow ends.
+        """
+        previous = self._recorder
+        self._recorder = recorder
+        return previous
+
+    def detach_result(self, previous):
+        self._recorder = previous
+
+    def span(self, name: str, target: str | None = None):
+        """
+        Time one phase (connect, command, transfer, ...).
+
+        The span goes to the attached result, the context tracer and
+        the context metrics registry. Returns a shared no-op context
+        manager when there is none of them.
+        """
+        tracer = self.context.tracer
+        metrics = self.context.metrics
+
+        if tracer is None:
+            if self._recorder is None and metrics is None:
+                return NULL_SPAN
+            return Span(name, target, self._recorder, metrics=metrics)
+
+        attributes = {"host": self.device.get("host")}
+        if self.context.job_id is not None:
+            attributes["job_id"] = self.context.job_id
+
+        return Span(name, target, self._recorder, tracer, attributes, metrics)
+
+    # -------------------------------------------------------
+    # Metrics (shared)
+    # -------------------------------------------------------
+
+    def count(self, name: str, amount: float = 1.0, **labels):
+        """Increment a counter of the context metrics registry, if any."""
+        if self.context.metrics is not None:
+            self.context.metrics.inc(name, amount, **labels)
+
+    def observe(self, name: str, value: float, **labels):
+        """Observe a histogram of the context metrics registry, if any."""
+        if self.context.metrics is not None:
+            self.context.metrics.observe(name, value, **labels)
+
     # -------------------------------------------------------
     # Connection handling (shared)
     # -------------------------------------------------------
 
+    @property
+    def pool_key(self) -> tuple:
+        """
+        Connection pool key: host, port, username and credentials.
+
+        Passwords enter the key only as a SHA-256 digest, so clients with
+        different passwords never share a session.
+        """
+        if self.device.get("use_keys"):
+            auth = ("key", self.device.get("key_file"))
+        else:
+            password = self.device.get("password") or ""
+            auth = ("password", hashlib.sha256(password.encode()).hexdigest())
+
+        return (
+            self.device.get("host"),
+            self.device.get("port"),
+            self.device.get("username"),
+            auth,
+        )
+
     def connect(self):
         """
         Establish a Netmiko connection with retry logic.
 
         Expects subclass to define:
           - self.device (Netmiko connection parameters)
+
+        Inside a session an open connection is reused.
+        With a pool, a live idle connection is reused when available.
         """
+        if self.in_session and self.conn is not None:
+            return
+
+        if self.pool is not None:
+            conn = self.pool.acquire(self.pool_key)
+            if conn is not None:
+                self.logger.info("Reusing pooled connection.")
+                self.conn = conn
+                return
+
+        with self.span("connect"):
+            self._connect_with_retries()
+
+    def _connect_with_retries(self):
         attempt = 1
 
         while attempt <= self.connect_retries:
@@ -53,19 +203,25 @@ class BaseClient:
             )
 
             try:
+                started = time.perf_counter()
                 self.conn = ConnectHandler(**self.device)
                 self.logger.info("Connected successfully.")
+                self.count("nauto_connect_attempts_total", outcome="success")
+                self.observe("nauto_connect_seconds", time.perf_counter() - started)
                 return
 
             except NetmikoTimeoutException:
                 self.logger.warning("Connection timeout. Device may be offline.")
+                self.count("nauto_connect_attempts_total", outcome="timeout")
 
             except NetmikoAuthenticationException:
                 self.logger.error("Authentication failed.")
+                self.count("nauto_connect_attempts_total", outcome="auth")
                 raise
 
             except Exception as exc:
                 self.logger.error(f"Unexpected connection error: {exc}")
+                self.count("nauto_connect_attempts_total", outcome="error")
 
             if attempt < self.connect_retries:
                 self.logger.info(
@@ -80,10 +236,99 @@ class BaseClient:
         )
 
     def disconnect(self):
-        """Close Netmiko connection if open."""
+        """
+        Close Netmiko connection if open.
+
+        Inside a session this is a no-op; the session owns teardown.
+        With a pool, the connection is returned to the pool instead.
+        """
+        if self.in_session:
+            return
+
+        self.close_sftp()
+
+        if self.conn and self.pool is not None:
+            self.pool.release(self.pool_key, self.conn)
+            self.conn = None
+            return
+
         if self.conn:
             try:
                 self.conn.disconnect()
             except Exception:
                 pass
             self.conn = None
+
+    # -------------------------------------------------------
+    # Command execution (shared)
+    # -------------------------------------------------------
+
+    def is_read_only(self, command: str) -> bool:
+        """
+        Return True if command does not change device state.
+
+        Only read-only commands are cached. Platforms override this;
+        by default nothing is considered read-only.
+        """
+        return False
+
+    def send_command(self, command: str, **kwargs) -> str:
+        """
+        Send a command on the active connection.
+
+        With a command cache, output of read-only commands sent without
+        extra arguments is served from the cache while fresh. Any other
+        command invalidates the cache before it is sent.
+        """
+        cache = self.command_cache
+
+        if cache is not None and not self.is_read_only(command):
+            cache.invalidate()
+            cache = None
+
+        if cache is None or kwargs:
+            with self.span("command", command):
+                return self.conn.send_command(command, **kwargs)
+
+        output = cache.get(command)
+        if output is None:
+            with self.span("command", command):
+                output = self.conn.send_command(command)
+            cache.put(command, output)
+
+        return output
+
+    def invalidate_cache(self):
+        """Drop cached command output after a state change."""
+        if self.command_cache is not None:
+            self.command_cache.invalidate()
+
+    # -------------------------------------------------------
+    # SFTP handling (shared)
+    # -------------------------------------------------------
+
+    def get_sftp(self):
+        """
+        Return the SFTP handle for the active connection.
+
+        The handle is opened on first use and shared by all transfer
+        helpers until disconnect (or a new connection) invalidates it.
+        """
+        if self._sftp is not None and self._sftp_conn is not self.conn:
+            self.close_sftp()
+
+        if self._sftp is None:
+            self._sftp = self.conn.remote_conn_pre.open_sftp()
+            self._sftp_conn = self.conn
+
+        return self._sftp
+
+    def close_sftp(self):
+        """Close the cached SFTP handle if open."""
+        if self._sftp is not None:
+            try:
+                self._sftp.close()
+            except Exception:
+                pass
+            self._sftp = None
+            self._sftp_conn = None
@@ -0,0 +1,60 @@
+# network_automation/cache.py
+
+"""
+Per-device cache of read-only command output.
+
+Entries expire after a TTL. Clients invalidate the whole cache on any
+mutating operation, so cached output never outlives a change made
+through the same client.
+"""
+
+import time
+
+
+class CommandCache:
+    """
+    TTL cache keyed by command string.
+
+    One cache belongs to one client (device); it is not shared
+    between threads.
+    """
+
+    def __init__(self, ttl: float = 30.0):
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, str]] = {}
+
+        # Counters for diagnostics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, command: str) -> str | None:
+        """Return cached output, or None if missing or expired."""
+        entry = self._entries.get(command)
+
+        if entry is not None:
+            stored_at, output = entry
+            if time.monotonic() - stored_at <= self.ttl:
+                self.hits += 1
+                return output
+            del self._entries[command]
+
+        self.misses += 1
+        return None
+
+    def put(self, command: str, output: str):
+        self._entries[command] = (time.monotonic(), output)
+
+    def invalidate(self):
+        """Drop all entries."""
+        if self._entries:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
@@ -19,3 +19,9 @@ class ExecutionContext:
     job_id: str | None = None
     dry_run: bool = False
     metadata: dict[str, Any] = field(default_factory=dict)
+
+    # Optional tracer receiving client spans (see network_automation.tracing)
+    tracer: Any | None = None
+
+    # Optional metrics registry (see network_automation.metrics)
+    metrics: Any | None = None
@@ -0,0 +1,108 @@
+# network_automation/facts.py
+
+"""
+Persistent device facts store.
+
+Keeps the last known architecture and version of each host in a local
+SQLite database, so planners can skip devices that are already up to
+date without logging in.
+"""
+
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS facts (
+    host TEXT PRIMARY KEY,
+    arch TEXT,
+    version TEXT,
+    last_seen REAL NOT NULL
+)
+"""
+
+
+class FactsStore:
+    """
+    SQLite-backed host -> (arch, version, last_seen) store.
+
+    path is required: the database is created there if missing.
+    Safe to share between the worker threads of one process.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+    def update(
+        self,
+        host: str,
+        *,
+        arch: str | None,
+        version: str | None,
+        seen_at: float | None = None,
+    ):
+        """Record facts read from a device."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO facts (host, arch, version, last_seen) "
+                "VALUES (?, ?, ?, ?)",
+                (host, arch, version, seen_at or time.time()),
+            )
+            self._db.commit()
+
+    def get(self, host: str, *, max_age: float | None = None) -> dict | None:
+        """
+        Return facts for host, or None if unknown.
+
+        With max_age (seconds), facts older than that are treated as
+        unknown.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT arch, version, last_seen FROM facts WHERE host = ?",
+                (host,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        arch, version, last_seen = row
+        if max_age is not None and time.time() - last_seen > max_age:
+            return None
+
+        return {
+            "host": host,
+            "arch": arch,
+            "version": version,
+            "last_seen": last_seen,
+        }
+
+    def all(self, *, max_age: float | None = None) -> dict[str, dict]:
+        """Return host -> facts for all (fresh) hosts."""
+        query = "SELECT host, arch, version, last_seen FROM facts"
+        params = ()
+
+        if max_age is not None:
+            query += " WHERE last_seen >= ?"
+            params = (time.time() - max_age,)
+
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+
+        return {
+            host: {
+                "host": host,
+                "arch": arch,
+                "version": version,
+                "last_seen": last_seen,
+            }
+            for host, arch, version, last_seen in rows
+        }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,183 @@
+# network_automation/fleet.py
+
+"""
+Fleet execution helpers.
+
+Run one client operation against many devices with bounded concurrency.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from itertools import islice
+
+from network_automation.factory import get_client
+from network_automation.results import OperationResult
+from network_automation.sinks import ResultSink
+
+# Client API methods that may be dispatched by the fleet executor
+FLEET_OPERATIONS = (
+    "info",
+    "backup",
+    "run",
+    "upgrade",
+    "upload",
+    "download",
+)
+
+
+def _run_device(params: dict, operation: str, args: tuple, kwargs: dict):
+    """
+    Run a single operation for one device.
+
+    Never raises: failures are recorded in the returned OperationResult.
+    """
+
+    params = dict(params)
+    host = params.get("host")
+    # Failures report the time spent before they happened
+    started_at = datetime.now(timezone.utc)
+
+    try:
+        client = get_client(**params)
+        result = getattr(client, operation)(
+            *args,
+            return_result=True,
+            **kwargs,
+        )
+
+    except Exception as exc:
+        result = OperationResult(
+            success=False,
+            operation=operation,
+            started_at=started_at,
+        )
+        result.errors.append(str(exc))
+        result.mark_finished()
+
+    result.metadata.setdefault("host", host)
+    return result
+
+
+def iter_fleet(
+    devices,
+    operation: str,
+    *args,
+    max_workers: int = 16,
+    sink: ResultSink | None = None,
+    **kwargs,
+):
+    """
+    Run a client operation against many devices, yielding results.
+
+    - devices: iterable of get_client() parameter dicts
+    - operation: client API method name (e.g. "info", "backup", "run")
+    - args / kwargs: forwarded to the client operation
+    - sink: optional ResultSink receiving every result as it completes
+
+    Results are yielded in completion order, one per device.
+    Per-device failures never abort the batch.
+    """
+
+    if operation not in FLEET_OPERATIONS:
+        raise ValueError(f"Unsupported fleet operation: {operation}")
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+
+    devices = iter(devices)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+
+        def submit(batch):
+            return {
+                pool.submit(_run_device, params, operation, args, kwargs)
+                for params in batch
+            }
+
+        # Keep a bounded window of pending work so that large
+        # (or lazily generated) fleets are never fully materialized.
+        pending = submit(islice(devices, max_workers * 2))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                result = future.result()
+                if sink is not None:
+                    sink.put(result)
+                yield result
+
+            pending |= submit(islice(devices, len(done)))
+
+
+def run_fleet(
+    devices,
+    operation: str,
+    *args,
+    max_workers: int = 16,
+    **kwargs,
+) -> list[OperationResult]:
+    """
+    Run a client operation against many devices.
+
+    Returns one OperationResult per device, in completion order.
+    """
+
+    return list(
+        iter_fleet(
+            devices,
+            operation,
+            *args,
+            max_workers=max_workers,
+            **kwargs,
+        )
+    )
+
+
+def run_fleet_to_sink(
+    devices,
+    operation: str,
+    sink: ResultSink,
+    *args,
+    max_workers: int = 16,
+    **kwargs,
+) -> OperationResult:
+    """
+    Run a client operation against many devices, writing results to sink.
+
+    Per-device results are only written to the sink (memory stays flat);
+    returns a single summary OperationResult (devices, succeeded, failed).
+    """
+
+    summary = OperationResult(
+        success=True,
+        operation=f"{operation}_fleet",
+    )
+    summary.mark_started()
+
+    succeeded = failed = 0
+    for result in iter_fleet(
+        devices,
+        operation,
+        *args,
+        max_workers=max_workers,
+        sink=sink,
+        **kwargs,
+    ):
+        if result.success:
+            succeeded += 1
+        else:
+            failed += 1
+
+    summary.mark_finished()
+    summary.success = failed == 0
+    summary.metadata.update(
+        {
+            "devices": succeeded + failed,
+            "succeeded": succeeded,
+            "failed": failed,
+        }
+    )
+    summary.message = f"{succeeded}/{succeeded + failed} devices succeeded"
+
+    return summary
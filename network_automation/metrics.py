@@ -0,0 +1,315 @@
+# network_automation/metrics.py
+
+"""
+Metrics registry.
+
+Counters and histograms of the client hot paths, rendered in the
+Prometheus text exposition format. A registry is set on
+ExecutionContext.metrics and shared by all clients of a worker pool;
+without one nothing is recorded.
+
+Library metrics:
+    nauto_connect_seconds           histogram
+    nauto_connect_attempts_total    counter {outcome}
+    nauto_command_seconds           histogram
+    nauto_transfer_seconds          histogram
+    nauto_transfer_bytes_total      counter {direction}
+    nauto_reconnect_wait_seconds    histogram
+    nauto_upgrades_total            counter {outcome}
+"""
+
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Prometheus text format version 0.0.4
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds (command round trips up to reboot waits)
+DEFAULT_BUCKETS = (
+    0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+# Span name -> histogram fed with its duration (see spans.Span)
+# (connect latency is observed per successful attempt, not per span,
+# so retries and backoff sleeps are not counted as latency)
+PHASE_HISTOGRAMS = {
+    "command": "nauto_command_seconds",
+    "transfer": "nauto_transfer_seconds",
+    "reconnect_wait": "nauto_reconnect_wait_seconds",
+}
+
+
+class _Metric:
+    """Named series keyed by label values."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _labels(self, key: tuple) -> dict:
+        return dict(zip(self.labelnames, key))
+
+
+class Counter(_Metric):
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(self.labelnames, labels), 0.0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+
+        for key, value in items:
+            yield self.name, self._labels(key), value
+
+
+class Histogram(_Metric):
+    """Cumulative bucket histogram with optional labels."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = _label_key(self.labelnames, labels)
+
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # bucket counts, then sum and count
+                series = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, **labels) -> int:
+        series = self._values.get(_label_key(self.labelnames, labels))
+        return series[-1] if series else 0
+
+    def sum(self, **labels) -> float:
+        series = self._values.get(_label_key(self.labelnames, labels))
+        return series[-2] if series else 0.0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._values.items())
+
+        for key, series in items:
+            labels = self._labels(key)
+
+            for bound, count in zip(self.buckets, series):
+                yield f"{self.name}_bucket", {**labels, "le": _number(bound)}, count
+            yield f"{self.name}_bucket", {**labels, "le": "+Inf"}, series[-1]
+            yield f"{self.name}_sum", labels, series[-2]
+            yield f"{self.name}_count", labels, series[-1]
+
+
+class MetricsRegistry:
+    """
+    Named counters and histograms; thread-safe.
+
+    The library metrics are registered up front; applications may add
+    their own with counter() / histogram().
+    """
+
+    def __init__(self, *, buckets: tuple = DEFAULT_BUCKETS):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+        self.histogram(
+            "nauto_connect_seconds",
+            "Latency of successful SSH connect attempts (excludes retries).",
+            buckets=buckets,
+        )
+        self.counter(
+            "nauto_connect_attempts_total",
+            "SSH connect attempts by outcome (success, timeout, auth, error).",
+            ("outcome",),
+        )
+        self.histogram("nauto_command_seconds", "Device command latency.", buckets=buckets)
+        self.histogram("nauto_transfer_seconds", "SFTP file transfer time.", buckets=buckets)
+        self.counter(
+            "nauto_transfer_bytes_total",
+            "Bytes moved over SFTP by direction (upload, download).",
+            ("direction",),
+        )
+        self.histogram(
+            "nauto_reconnect_wait_seconds",
+            "Time from reboot until the device accepted SSH again.",
+            buckets=buckets,
+        )
+        self.counter(
+            "nauto_upgrades_total",
+            "Finished firmware upgrades by outcome (success, skipped, failed).",
+            ("outcome",),
+        )
+
+    # -------------------------------------------------------
+    # Registration / lookup
+    # -------------------------------------------------------
+
+    def counter(self, name: str, help: str = "", labelnames: tuple = ()) -> Counter:
+        return self._register(Counter, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str = "",
+        labelnames: tuple = (),
+        *,
+        buckets: tuple = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, help, labelnames, buckets)
+
+    def _register(self, cls, name, *args):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args)
+            elif type(metric) is not cls:
+                raise ValueError(f"Metric {name} already registered as {metric.kind}")
+            return metric
+
+    def get(self, name: str):
+        return self._metrics[name]
+
+    # -------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------
+
+    def inc(self, name: str, amount: float = 1.0, **labels):
+        self._metrics[name].inc(amount, **labels)
+
+    def observe(self, name: str, value: float, **labels):
+        self._metrics[name].observe(value, **labels)
+
+    def observe_phase(self, phase: str, seconds: float):
+        """Feed a span duration into its histogram, if it has one."""
+        name = PHASE_HISTOGRAMS.get(phase)
+        if name is not None:
+            self._metrics[name].observe(seconds)
+
+    # -------------------------------------------------------
+    # Exposition
+    # -------------------------------------------------------
+
+    def render(self) -> str:
+        """Return all metrics in Prometheus text format."""
+        lines = []
+
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_number(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str):
+        """
+        Write render() to path atomically.
+
+        Suitable for the node_exporter textfile collector.
+        """
+        temp = f"{path}.tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(temp, path)
+
+    def serve(self, port: int = 0, addr: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serve /metrics over HTTP from a daemon thread.
+
+        Returns the server; server.server_address holds the bound port
+        and server.shutdown() stops it.
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((addr, port), Handler)
+        server.daemon_threads = True
+
+        threading.Thread(
+            target=server.serve_forever,
+            name="metrics-http",
+            daemon=True,
+        ).start()
+
+        return server
+
+
+# -------------------------------------------------------
+# Formatting helpers
+# -------------------------------------------------------
+
+def _label_key(labelnames: tuple, labels: dict) -> tuple:
+    if labels.keys() != set(labelnames):
+        raise ValueError(f"Expected labels {labelnames}, got {tuple(labels)}")
+    return tuple(str(labels[name]) for name in labelnames)
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
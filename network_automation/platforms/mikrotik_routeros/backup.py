@@ -4,7 +4,28 @@
 Mikrotik RouterOS backup helpers.
 """
 
+import gzip
+import hashlib
+import io
+import os
+from contextlib import contextmanager, nullcontext
+
+from network_automation.backup_store import BackupStore
+
 from network_automation.results import OperationResult
+from network_automation.platforms.mikrotik_routeros.parser import parse_detail
+from network_automation.platforms.mikrotik_routeros.stream import (
+    stream_command,
+    write_lines,
+)
+from network_automation.transfer import get_file
+
+# Text export compression -> file suffix
+EXPORT_SUFFIXES = {
+    "gzip": ".rsc.gz",
+    "zstd": ".rsc.zst",
+    None: ".rsc",
+}
 
 def cleanup_old_backups(client):
     """
@@ -14,31 +35,225 @@ def cleanup_old_backups(client):
     """
     client.logger.info("Cleaning up old network_automation backups on device")
 
-    output = client.conn.send_command(
-        '/file print detail where name~"nauto_.*.backup"'
-    )
+    with client.span("cleanup"):
+        output = client.send_command(
+            '/file print detail where name~"nauto_.*.backup"'
+        )
+
+        for record in parse_detail(output, typed=False):
+            filename = record.get("name")
+
+            # The device-side regex matches anywhere in the path
+            if not filename or not filename.rsplit("/", 1)[-1].startswith("nauto_"):
+                continue
+
+            client.logger.info("Removing old backup file: %s", filename)
+            client.send_command(
+                f'/file remove "{filename}"'
+            )
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError(
+            "zstd export requires the 'zstandard' package "
+            "(pip install network-automation[zstd])"
+        ) from None
+    return zstandard
+
+
+@contextmanager
+def open_export(path: str, compression: str | None):
+    """
+    Open a text file for writing with the given compression.
+
+    gzip output carries no timestamp or file name, so identical
+    exports produce identical files (see BackupStore).
+    """
 
-    for line in output.splitlines():
-        if "name=" not in line:
-            continue
+    if compression == "gzip":
+        with open(path, "wb") as raw, gzip.GzipFile(
+            filename="",
+            mode="wb",
+            fileobj=raw,
+            mtime=0,
+        ) as gz, io.TextIOWrapper(gz, encoding="utf-8") as f:
+            yield f
+        return
 
-        # RouterOS format: name=nauto_xxx.backup
-        parts = line.split()
-        name_part = next(
-            (p for p in parts if p.startswith("name=")),
-            None,
+    if compression == "zstd":
+        with _import_zstandard().open(path, "wt", encoding="utf-8") as f:
+            yield f
+        return
+
+    if compression is None:
+        with open(path, "w", encoding="utf-8") as f:
+            yield f
+        return
+
+    raise ValueError(f"Unsupported export compression: {compression}")
+
+
+def _strip_export_header(lines):
+    """Drop the leading "# <date> by RouterOS <version>" line."""
+
+    lines = iter(lines)
+    for line in lines:
+        if not (line.startswith("# ") and " by RouterOS " in line):
+            yield line
+            break
+
+    yield from lines
+
+
+def export_config(client, path: str, *, compression: str | None = "gzip") -> dict:
+    """
+    Stream `/export` output into a (compressed) local file.
+
+    - no connect/disconnect
+    - output is never held in memory as a whole
+    - the timestamp header is dropped so unchanged configs compare equal
+    - returns export metadata (path, lines, bytes, compressed_bytes)
+    """
+
+    client.logger.info("Exporting configuration to %s", path)
+
+    with client.span("export"), open_export(path, compression) as f:
+        lines, size = write_lines(
+            _strip_export_header(stream_command(client, "/export")),
+            f,
         )
 
-        if not name_part:
-            continue
+    return {
+        "path": str(path),
+        "compression": compression,
+        "lines": lines,
+        "bytes": size,
+        "compressed_bytes": os.path.getsize(path),
+    }
+
+
+def _save_and_download(client, name: str, *, download_dir: str, store, result):
+    """Create the binary backup on the device and fetch it."""
 
-        filename = name_part.split("=", 1)[1]
+    cleanup_old_backups(client)
 
-        client.logger.info("Removing old backup file: %s", filename)
-        client.conn.send_command(
-            f'/file remove "{filename}"'
+    backup_name = f"nauto_{name}"
+    backup_file = f"{backup_name}.backup"
+    logical_file = f"{name}.backup"
+
+    client.logger.info(f"Creating backup '{backup_file}'")
+
+    client.send_command(
+        f"/system backup save name={backup_name}",
+        expect_string=r"\[.*\]",
+    )
+
+    # ---- download backup file via Paramiko SFTP ----
+    # (store downloads are staged in its tmp/ and removed on failure)
+    if store is not None:
+        staging = store.staged()
+    else:
+        staging = nullcontext(f"{download_dir.rstrip('/')}/{logical_file}")
+
+    with staging as local_path:
+        client.logger.info(f"Downloading backup to {local_path}")
+
+        digest = hashlib.sha256()
+        with client.span("transfer", backup_file):
+            stats = get_file(
+                client.get_sftp(),
+                backup_file,
+                local_path,
+                block_size=client.sftp_block_size,
+                max_requests=client.sftp_max_requests,
+                digest=digest,
+            )
+        client.count(
+            "nauto_transfer_bytes_total",
+            stats.bytes,
+            direction="download",
         )
 
+        if store is not None:
+            entry = store.commit(
+                client.host,
+                "backup",
+                local_path,
+                digest.hexdigest(),
+                name=logical_file,
+            )
+            local_path = str(store.object_path(entry["hash"]))
+            result.metadata.setdefault("store", {})["backup"] = entry
+
+    result.metadata["local_path"] = local_path
+    result.metadata["sha256"] = digest.hexdigest()
+    result.metadata["transfer"] = stats.as_dict()
+    result.message = f"Backup '{backup_file}' created and downloaded"
+
+
+def _export(client, name: str, *, download_dir: str, store, compression, result):
+    """Stream /export into download_dir or the store."""
+
+    suffix = EXPORT_SUFFIXES[compression]
+
+    if store is not None:
+        staging = store.staged()
+    else:
+        staging = nullcontext(f"{download_dir.rstrip('/')}/{name}{suffix}")
+
+    with staging as export_path:
+        export_meta = export_config(client, export_path, compression=compression)
+
+        if store is not None:
+            entry = store.commit(
+                client.host,
+                "export",
+                export_path,
+                name=f"{name}{suffix}",
+            )
+            export_meta["path"] = str(store.object_path(entry["hash"]))
+            result.metadata.setdefault("store", {})["export"] = entry
+
+    result.metadata["export"] = export_meta
+
+
+def _reuse_backup(client, name: str, *, store, previous_export, result) -> bool:
+    """
+    Index the last stored backup again if the export did not change.
+
+    Returns False (nothing recorded) when there is no earlier export
+    and backup to compare with.
+    """
+
+    latest = store.latest(client.host, "backup")
+    current = result.metadata["store"]["export"]
+
+    if (
+        previous_export is None
+        or latest is None
+        or previous_export["hash"] != current["hash"]
+        or not store.object_path(latest["hash"]).exists()
+    ):
+        return False
+
+    entry = store.record(
+        client.host,
+        "backup",
+        latest["hash"],
+        name=f"{name}.backup",
+    )
+    result.metadata["store"]["backup"] = entry
+    result.metadata["local_path"] = str(store.object_path(entry["hash"]))
+    result.metadata["sha256"] = entry["hash"]
+    result.metadata["skipped"] = True
+    result.message = f"Configuration unchanged; kept backup {entry['hash'][:12]}"
+
+    client.logger.info("Export unchanged — skipping binary backup download")
+    return True
+
 
 def run_backup(
     client,
@@ -46,6 +261,10 @@ def run_backup(
     *,
     return_result: bool = False,
     download_dir: str = ".",
+    export: bool = False,
+    export_compression: str | None = "gzip",
+    store: BackupStore | None = None,
+    incremental: bool = False,
 ):
     """
     Run backup on RouterOS and optionally download the backup file.
@@ -53,50 +272,92 @@ def run_backup(
     Behavior:
     - Creates a .backup file on the device
     - Downloads it locally via Paramiko SFTP
+    - With export=True, also streams `/export` into a compressed
+      text file in download_dir (same session, same result)
+    - With store, artifacts go into the content-addressed BackupStore
+      instead of download_dir; unchanged content is stored only once.
+      RouterOS encrypts .backup files with a fresh salt on every save,
+      so in practice only exports deduplicate.
+    - With incremental=True (needs export and store), the export runs
+      first; if it matches the last stored export, no .backup is
+      created or downloaded and the last stored one is indexed again
+      (metadata["skipped"] is True). Changes the export does not show
+      (users, certificates) are then not captured.
     - Raises exceptions on failure
     - Optionally returns OperationResult
     """
 
+    if export and export_compression not in EXPORT_SUFFIXES:
+        raise ValueError(f"Unsupported export compression: {export_compression}")
+    if export and export_compression == "zstd":
+        # Fail before the device does any work
+        _import_zstandard()
+    if incremental and not (export and store is not None):
+        raise ValueError("incremental backup requires export=True and a store")
+
     result = OperationResult(
         success=True,
         operation="backup",
         metadata={
             "backup_name": name,
+            "remote_file": f"{name}.backup",
         },
     )
 
     result.mark_started()
+    previous = client.attach_result(result)
 
     try:
         client.connect()
 
-        cleanup_old_backups(client)
+        if incremental:
+            previous_export = store.latest(client.host, "export")
+            _export(
+                client,
+                name,
+                download_dir=download_dir,
+                store=store,
+                compression=export_compression,
+                result=result,
+            )
 
-        backup_name = f"nauto_{name}"
-        backup_file = f"{backup_name}.backup"
-        logical_file = f"{name}.backup"
+            if not _reuse_backup(
+                client,
+                name,
+                store=store,
+                previous_export=previous_export,
+                result=result,
+            ):
+                _save_and_download(
+                    client,
+                    name,
+                    download_dir=download_dir,
+                    store=store,
+                    result=result,
+                )
+                result.message += " with configuration export"
 
-        client.logger.info(f"Creating backup '{backup_file}'")
+            return result if return_result else None
 
-        client.conn.send_command(
-            f"/system backup save name={backup_name}",
-            expect_string=r"\[.*\]",
+        _save_and_download(
+            client,
+            name,
+            download_dir=download_dir,
+            store=store,
+            result=result,
         )
 
-        result.metadata["remote_file"] = logical_file
-
-        # ---- download backup file via Paramiko SFTP ----
-        local_path = f"{download_dir.rstrip('/')}/{logical_file}"
-        client.logger.info(f"Downloading backup to {local_path}")
-
-        sftp = client.conn.remote_conn_pre.open_sftp()
-        try:
-            sftp.get(backup_file, local_path)
-        finally:
-            sftp.close()
-
-        result.metadata["local_path"] = local_path
-        result.message = f"Backup '{backup_file}' created and downloaded"
+        # ---- text export for diffing ----
+        if export:
+            _export(
+                client,
+                name,
+                download_dir=download_dir,
+                store=store,
+                compression=export_compression,
+                result=result,
+            )
+            result.message += " with configuration export"
 
         return result if return_result else None
 
@@ -108,5 +369,6 @@ def run_backup(
     finally:
         result.mark_finished()
         client.disconnect()
+        client.detach_result(previous)
 
 
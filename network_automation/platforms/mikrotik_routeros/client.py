@@ -2,12 +2,27 @@
 
 import time
 from netmiko import ConnectHandler
+from network_automation.backup_store import BackupStore
 from network_automation.base_client import BaseClient
+from network_automation.cache import CommandCache
 from network_automation.context import ExecutionContext
+from network_automation.facts import FactsStore
+from network_automation.pool import ConnectionPool
+from network_automation.probe import PROBE_READY, PROBE_SSH, next_delay, probe_ssh
+from network_automation.transfer import DEFAULT_BLOCK_SIZE, DEFAULT_MAX_REQUESTS
 from network_automation.platforms.mikrotik_routeros.backup import run_backup
 from network_automation.platforms.mikrotik_routeros.download import run_download
-from network_automation.platforms.mikrotik_routeros.info import get_info
+from network_automation.platforms.mikrotik_routeros.info import get_info, read_info
+from network_automation.platforms.mikrotik_routeros.run import read_only_command
 from network_automation.platforms.mikrotik_routeros.run import run as run_helper
+from network_automation.platforms.mikrotik_routeros.stream import run_stream
+from network_automation.platforms.mikrotik_routeros.upgrade import (
+    UpgradeState,
+    fail_upgrade,
+    start_upgrade,
+    upgrade_result,
+    upgrade_step,
+)
 from network_automation.platforms.mikrotik_routeros.upgrade import upgrade as upgrade_helper
 from network_automation.platforms.mikrotik_routeros.upload import run_upload
 
@@ -35,15 +50,30 @@ class MikrotikRouterOS(BaseClient):
         connect_delay=2,
         reconnect_timeout=300,
         reconnect_delay=10,
+        probe_timeout=3,
+        sftp_block_size: int = DEFAULT_BLOCK_SIZE,
+        sftp_max_requests: int = DEFAULT_MAX_REQUESTS,
+        resume_upload: bool = False,
+        verify_checksum: bool = False,
+        command_cache_ttl: float | None = None,
         log_file=None,  # deprecated, kept for backward compatibility
         *,
         context: ExecutionContext | None = None,
+        pool: ConnectionPool | None = None,
+        facts_store: FactsStore | None = None,
     ):
         # Initialize shared BaseClient state (context, logger, retry config)
         super().__init__(
             context=context,
             connect_retries=connect_retries,
             connect_delay=connect_delay,
+            pool=pool,
+            command_cache=(
+                CommandCache(command_cache_ttl)
+                if command_cache_ttl
+                else None
+            ),
+            facts_store=facts_store,
         )
 
         # Legacy parameter kept for backward compatibility
@@ -76,12 +106,28 @@ class MikrotikRouterOS(BaseClient):
         # Reconnect-after-reboot configuration
         self.reconnect_timeout = reconnect_timeout
         self.reconnect_delay = reconnect_delay
+        self.probe_timeout = probe_timeout
+
+        # SFTP transfer tuning (per site)
+        self.sftp_block_size = sftp_block_size
+        self.sftp_max_requests = sftp_max_requests
+
+        # Offline firmware upload behavior
+        self.resume_upload = resume_upload
+        self.verify_checksum = verify_checksum
 
         # Runtime state
         self.arch = None
         self.current_version = None
         self.firmware_file = None
 
+    # -------------------------------------------------------
+    # Command execution
+    # -------------------------------------------------------
+
+    def is_read_only(self, command: str) -> bool:
+        return read_only_command(command)
+
     # -------------------------------------------------------
     # System info
     # -------------------------------------------------------
@@ -95,6 +141,9 @@ class MikrotikRouterOS(BaseClient):
         self.logger.info(f"Architecture: {self.arch}")
         self.logger.info(f"Current version: {self.current_version}")
 
+    def info(self, *, return_result: bool = False):
+        return read_info(self, return_result=return_result)
+
     # -------------------------------------------------------
     # Backup
     # -------------------------------------------------------
@@ -105,12 +154,20 @@ class MikrotikRouterOS(BaseClient):
         *,
         return_result: bool = False,
         download_dir: str = ".",
+        export: bool = False,
+        export_compression: str | None = "gzip",
+        store: BackupStore | None = None,
+        incremental: bool = False,
     ):
         return run_backup(
             self,
             name,
             return_result=return_result,
             download_dir=download_dir,
+            export=export,
+            export_compression=export_compression,
+            store=store,
+            incremental=incremental,
         )
 
     # -------------------------------------------------------
@@ -120,7 +177,22 @@ class MikrotikRouterOS(BaseClient):
     def reboot(self):
         """Perform a stable reboot for RouterOS 7.x."""
         self.logger.info("Rebooting device...")
+        self.invalidate_cache()
+
+        with self.span("reboot"):
+            self._confirm_reboot()
+
+        # SSH connection is closed immediately after reboot
+        self.close_sftp()
 
+        try:
+            self.conn.disconnect()
+        except Exception:
+            pass
+
+        self.conn = None
+
+    def _confirm_reboot(self):
         out = self.conn.send_command_timing("/system reboot")
 
         if "[y/n" in out.lower():
@@ -136,16 +208,66 @@ class MikrotikRouterOS(BaseClient):
                 )
                 self.conn.send_command_timing("y")
 
-        # SSH connection is closed immediately after reboot
+    def probe_reconnect(self) -> str:
+        """
+        Run one staged reachability probe.
+
+        Stages, cheapest first:
+          1. TCP connect
+          2. SSH banner read
+          3. full Netmiko login + CLI probe
+
+        Returns the furthest stage reached (see network_automation.probe).
+        On PROBE_READY the new connection is stored in self.conn.
+        """
+
+        stage = probe_ssh(
+            self.host,
+            self.device["port"],
+            timeout=self.probe_timeout,
+        )
+
+        if stage != PROBE_SSH:
+            return stage
+
+        conn = None
         try:
-            self.conn.disconnect()
+            # ---- attempt SSH connection ----
+            conn = ConnectHandler(**self.device)
+
+            # ---- give RouterOS time to initialize CLI ----
+            time.sleep(1.0)
+
+            # ---- probe CLI readiness (bounded, must not hang) ----
+            out = conn.send_command(
+                "/system resource print",
+                delay_factor=2,
+                read_timeout=10,
+            )
+
+            if "version" in out.lower():
+                self.conn = conn
+                return PROBE_READY   # SUCCESS → do NOT disconnect
+
         except Exception:
+            # retry silently; heartbeat will indicate progress
             pass
 
-        self.conn = None
+        # ---- cleanup only failed attempt ----
+        if conn:
+            try:
+                conn.disconnect()
+            except Exception:
+                pass
+
+        return stage
 
     def wait_for_reconnect(self):
         """Wait until RouterOS is reachable via SSH and CLI is ready."""
+        with self.span("reconnect_wait"):
+            return self._wait_for_reconnect()
+
+    def _wait_for_reconnect(self):
 
         self.logger.info(
             "Waiting for %s to reconnect...",
@@ -154,6 +276,7 @@ class MikrotikRouterOS(BaseClient):
 
         start = time.time()
         last_log = start
+        delay = 0.0
 
         while True:
             elapsed = time.time() - start
@@ -164,51 +287,34 @@ class MikrotikRouterOS(BaseClient):
                     f"{self.reconnect_timeout} seconds."
                 )
 
-            conn = None
-            try:
-                # ---- attempt SSH connection ----
-                conn = ConnectHandler(**self.device)
+            stage = self.probe_reconnect()
 
-                # ---- give RouterOS time to initialize CLI ----
-                time.sleep(1.0)
-
-                # ---- probe CLI readiness (bounded, must not hang) ----
-                out = conn.send_command(
-                    "/system resource print",
-                    delay_factor=2,
-                    read_timeout=10,
+            if stage == PROBE_READY:
+                self.logger.info(
+                    "Device fully online (SSH + CLI ready)."
                 )
-
-                if "version" in out.lower():
-                    self.logger.info(
-                        "Device fully online (SSH + CLI ready)."
-                    )
-                    self.conn = conn
-                    return conn   # SUCCESS → do NOT disconnect
-
-            except Exception:
-                # retry silently; heartbeat will indicate progress
-                pass
-
-            # ---- cleanup only failed attempt ----
-            if conn:
-                try:
-                    conn.disconnect()
-                except Exception:
-                    pass
+                return self.conn
 
             # ---- heartbeat INFO every 60s ----
             now = time.time()
             if now - last_log > 60:
                 self.logger.info(
                     "Still waiting for %s to reconnect "
-                    "(%ds elapsed)",
+                    "(%ds elapsed, last probe: %s)",
                     self.host,
                     int(elapsed),
+                    stage,
                 )
                 last_log = now
 
-            time.sleep(self.reconnect_delay)
+            # ---- adaptive backoff ----
+            delay = next_delay(
+                stage,
+                delay,
+                min_delay=min(1.0, self.reconnect_delay),
+                max_delay=self.reconnect_delay,
+            )
+            time.sleep(delay)
 
     # -------------------------------------------------------
     # Final version check
@@ -229,14 +335,59 @@ class MikrotikRouterOS(BaseClient):
     def upgrade(self, *, return_result: bool = False):
         return upgrade_helper(self, return_result=return_result)
 
+    # -------------------------------------------------------
+    # Resumable upgrade (state machine)
+    # -------------------------------------------------------
+
+    def start_upgrade(self) -> UpgradeState:
+        return start_upgrade(self)
+
+    def resume_upgrade(self, data: dict) -> UpgradeState:
+        return UpgradeState.from_dict(data)
+
+    def upgrade_step(self, state: UpgradeState) -> UpgradeState:
+        return upgrade_step(self, state)
+
+    def fail_upgrade(self, state: UpgradeState, exc: Exception) -> UpgradeState:
+        return fail_upgrade(self, state, exc)
+
+    def upgrade_result(self, state: UpgradeState):
+        return upgrade_result(state)
+
     # -------------------------------------------------------
     # Run arbitrary commands
     # -------------------------------------------------------
 
-    def run(self, commands, *, return_result: bool = False):
+    def run(
+        self,
+        commands,
+        *,
+        structured: bool = False,
+        batch: bool = False,
+        return_result: bool = False,
+    ):
         return run_helper(
             self,
             commands,
+            structured=structured,
+            batch=batch,
+            return_result=return_result,
+        )
+
+    def stream(
+        self,
+        command: str,
+        *,
+        sink=None,
+        return_result: bool = False,
+    ):
+        """
+        Stream command output line by line (or into sink).
+        """
+        return run_stream(
+            self,
+            command,
+            sink=sink,
             return_result=return_result,
         )
 
@@ -249,6 +400,8 @@ class MikrotikRouterOS(BaseClient):
         *,
         files: list[str],
         remote_dir: str = "/",
+        resume: bool = False,
+        verify_checksum: bool = False,
         return_result: bool = False,
     ):
         """
@@ -258,6 +411,8 @@ class MikrotikRouterOS(BaseClient):
             self,
             files=files,
             remote_dir=remote_dir,
+            resume=resume,
+            verify_checksum=verify_checksum,
             return_result=return_result,
         )
 
@@ -270,6 +425,7 @@ class MikrotikRouterOS(BaseClient):
         *,
         files: list[str],
         local_dir: str,
+        incremental: bool = False,
         return_result: bool = False,
     ):
         """
@@ -279,6 +435,7 @@ class MikrotikRouterOS(BaseClient):
             self,
             files=files,
             local_dir=local_dir,
+            incremental=incremental,
             return_result=return_result,
         )
 
@@ -2,47 +2,87 @@
 
 from pathlib import Path
 from network_automation.results import OperationResult
+from network_automation.spans import traced
+from network_automation.transfer import (
+    TransferStats,
+    get_file,
+    load_manifest,
+    remote_unchanged,
+    save_manifest,
+)
 
 
 # -------------------------------------------------------
 # Helper (pure logic)
 # -------------------------------------------------------
 
+@traced("download_files")
 def download_files(
     client,
     *,
     files: list[str],
     local_dir: str,
+    incremental: bool = False,
 ):
     """
     Download files from device via SFTP.
 
     - no connect/disconnect
     - raises exceptions on failure
+    - returns aggregated TransferStats
+
+    incremental: skip files whose remote size and mtime match the last
+    successful pull recorded in local_dir (see MANIFEST_NAME)
     """
 
     local_dir = Path(local_dir)
     local_dir.mkdir(parents=True, exist_ok=True)
 
-    sftp = client.conn.remote_conn_pre.open_sftp()
+    sftp = client.get_sftp()
+    stats = TransferStats()
+    manifest = load_manifest(local_dir) if incremental else None
 
-    try:
-        for filename in files:
-            local_path = local_dir / filename
+    for filename in files:
+        local_path = local_dir / filename
+
+        if incremental:
+            attrs = sftp.stat(filename)
+
+            if remote_unchanged(manifest.get(filename), attrs, local_path):
+                client.logger.info("Unchanged, skipping: %s", filename)
+                stats.skipped += 1
+                continue
+
+        client.logger.info(
+            "Downloading %s → %s",
+            filename,
+            local_path,
+        )
 
-            client.logger.info(
-                "Downloading %s → %s",
+        with client.span("transfer", filename):
+            file_stats = get_file(
+                sftp,
                 filename,
                 local_path,
+                block_size=client.sftp_block_size,
+                max_requests=client.sftp_max_requests,
             )
 
-            sftp.get(
-                filename,
-                str(local_path),
-            )
+        stats.add(file_stats)
+        client.count(
+            "nauto_transfer_bytes_total",
+            file_stats.bytes,
+            direction="download",
+        )
 
-    finally:
-        sftp.close()
+        if incremental:
+            manifest[filename] = {
+                "size": attrs.st_size,
+                "mtime": attrs.st_mtime,
+            }
+            save_manifest(local_dir, manifest)
+
+    return stats
 
 
 # -------------------------------------------------------
@@ -54,6 +94,7 @@ def run_download(
     *,
     files: list[str],
     local_dir: str,
+    incremental: bool = False,
     return_result: bool = False,
 ):
     result = OperationResult(
@@ -66,16 +107,27 @@ def run_download(
     )
 
     result.mark_started()
+    previous = client.attach_result(result)
 
     client.connect()
     try:
-        download_files(
+        stats = download_files(
             client,
             files=files,
             local_dir=local_dir,
+            incremental=incremental,
         )
 
+        result.metadata["transfer"] = stats.as_dict()
         result.message = "Files downloaded successfully"
+
+        if incremental:
+            result.metadata["skipped"] = stats.skipped == len(files)
+            if stats.skipped:
+                result.message = (
+                    f"Files downloaded successfully "
+                    f"({stats.skipped} unchanged, skipped)"
+                )
         return result if return_result else None
 
     except Exception as exc:
@@ -86,3 +138,4 @@ def run_download(
     finally:
         result.mark_finished()
         client.disconnect()
+        client.detach_result(previous)
@@ -4,48 +4,32 @@
 Mikrotik device information helpers.
 """
 
-import re
-
 from network_automation.results import OperationResult
+from network_automation.platforms.mikrotik_routeros.parser import parse_properties
+# Re-exported for existing imports
+from network_automation.versions import is_newer_version, normalize_version  # noqa: F401
 
 
 def get_info(client):
     """Read system architecture and version."""
     client.logger.info("Reading system info...")
 
-    output = client.conn.send_command("/system resource print")
+    output = client.send_command("/system resource print")
 
-    arch = None
-    version = None
+    resource = parse_properties(output, typed=False)
 
-    for line in output.splitlines():
-        line = line.strip()
-        if line.startswith("architecture-name:"):
-            arch = line.split(":", 1)[1].strip()
-        elif line.startswith("version:"):
-            version = line.split(":", 1)[1].strip()
+    arch = resource.get("architecture-name")
+    version = resource.get("version")
 
     if not arch:
         raise ValueError("Architecture not found in system resource output.")
     if not version:
         raise ValueError("Version not found in system resource output.")
 
-    return arch, version
-
-def normalize_version(v):
-    """Normalize RouterOS version string to tuple."""
-    v = v.strip().lower()
-    m = re.search(r"\d+(?:\.\d+){0,2}", v)
-    if not m:
-        raise ValueError(f"Cannot extract numeric version from: {v}")
-    parts = m.group(0).split(".")
-    parts += ["0"] * (3 - len(parts))
-    return tuple(int(p) for p in parts)
+    if client.facts_store is not None:
+        client.facts_store.update(client.host, arch=arch, version=version)
 
-
-def is_newer_version(current_version, new_version):
-    """Return True if new_version > current_version."""
-    return normalize_version(new_version) > normalize_version(current_version)
+    return arch, version
 
 
 def read_info(client, *, return_result: bool = False):
@@ -61,6 +45,7 @@ def read_info(client, *, return_result: bool = False):
     )
 
     result.mark_started()
+    previous = client.attach_result(result)
 
     client.connect()
     try:
@@ -84,3 +69,4 @@ def read_info(client, *, return_result: bool = False):
     finally:
         result.mark_finished()
         client.disconnect()
+        client.detach_result(previous)
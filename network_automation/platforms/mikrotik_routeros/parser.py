@@ -0,0 +1,274 @@
+# network_automation/platforms/mikrotik_routeros/parser.py
+
+"""
+Mikrotik RouterOS CLI output parser.
+
+Turns `print`, `print detail` / `print terse` and `print as-value`
+output into lists of records (dicts). Sizes such as `12.5MiB` are
+converted to bytes.
+"""
+
+import re
+
+# -------------------------------------------------------
+# Patterns (compiled once; hot paths use finditer/match only)
+# -------------------------------------------------------
+
+# "key=value" inside a detail/terse record. Unquoted values may contain
+# spaces (e.g. last-modified=2025-01-25 12:40:02) and run until the
+# next "key=" token.
+_DETAIL_PAIR = re.compile(
+    r'([\w.\-/]+)=("(?:[^"\\]|\\.)*"|[^ ]*(?: (?![\w.\-/]+=)[^ ]+)*)'
+)
+
+# "key=value" inside as-value output, separated by ";" or newlines
+_AS_VALUE_TOKEN = re.compile(r'([^=;\s]+)=("(?:[^"\\]|\\.)*"|[^;\n]*)')
+
+# Record start in detail/terse output: index, optional flags
+_RECORD_START = re.compile(r"\s*(\d+)\s+(?:([A-Za-z*+]+)\s+)?(.*)")
+
+# "key: value" lines of singleton menus (/system resource print)
+_PROPERTY = re.compile(r"\s*([\w.\-/]+):\s?(.*)")
+
+# Sizes with binary/decimal units
+_SIZE = re.compile(r"(\d+(?:\.\d+)?)\s?(B|KiB|MiB|GiB|TiB|kB|KB|MB|GB|TB)")
+
+_UNITS = {
+    "B": 1,
+    "KiB": 1024,
+    "MiB": 1024 ** 2,
+    "GiB": 1024 ** 3,
+    "TiB": 1024 ** 4,
+    "kB": 1000,
+    "KB": 1000,
+    "MB": 1000 ** 2,
+    "GB": 1000 ** 3,
+    "TB": 1000 ** 4,
+}
+
+_HEADER_PREFIXES = ("Flags:", "Columns:")
+
+
+# -------------------------------------------------------
+# Values
+# -------------------------------------------------------
+
+def parse_size(value: str) -> int | None:
+    """
+    Convert a RouterOS size string to bytes.
+
+    Returns None if value is not a size.
+    """
+
+    m = _SIZE.fullmatch(value)
+    if not m:
+        return None
+    return int(float(m.group(1)) * _UNITS[m.group(2)])
+
+
+def _value(raw: str, typed: bool):
+    if raw[:1] == '"':
+        return raw[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+
+    # Only digits followed by a unit can be a size: cheap pre-check
+    if typed and raw[:1].isdigit() and raw[-1:] == "B":
+        size = parse_size(raw)
+        if size is not None:
+            return size
+
+    return raw
+
+
+# -------------------------------------------------------
+# Formats
+# -------------------------------------------------------
+
+def parse_detail(output: str, *, typed: bool = True) -> list[dict]:
+    """
+    Parse `print detail` or `print terse` output.
+
+    Each record starts with its index (and optional flags), followed by
+    key=value pairs that may continue on indented lines. A `;;;` line
+    is stored as the record comment. Index and flags are stored as
+    `.index` and `.flags`.
+    """
+
+    records = []
+    record = None
+
+    for line in output.splitlines():
+        m = _RECORD_START.match(line)
+
+        if m:
+            record = {".index": int(m.group(1))}
+            if m.group(2):
+                record[".flags"] = m.group(2)
+            records.append(record)
+            rest = m.group(3)
+
+        elif record is None:
+            # Header lines before the first record
+            continue
+
+        else:
+            rest = line.strip()
+            if not rest:
+                continue
+
+        if rest.startswith(";;;"):
+            record["comment"] = rest[3:].strip()
+            continue
+
+        _parse_pairs(rest, record, typed)
+
+    return records
+
+
+def _parse_pairs(text: str, record: dict, typed: bool):
+    """Parse `key=value key=value` pairs of one line into record."""
+
+    pairs = _DETAIL_PAIR.findall(text)
+
+    # Fast path: nothing to unquote or convert
+    if not typed and '"' not in text:
+        record.update(pairs)
+        return
+
+    for key, raw in pairs:
+        record[key] = _value(raw, typed)
+
+
+def parse_as_value(output: str, *, typed: bool = True) -> list[dict]:
+    """
+    Parse `print as-value` output.
+
+    Pairs are separated by ";" or newlines. A new record starts at
+    every `.id` key, or when a key repeats within the current record.
+    """
+
+    records = []
+    record = None
+
+    for key, raw in _AS_VALUE_TOKEN.findall(output):
+        if record is None or key in record or (key == ".id" and record):
+            record = {}
+            records.append(record)
+        record[key] = _value(raw, typed)
+
+    return records
+
+
+def parse_properties(output: str, *, typed: bool = True) -> dict:
+    """
+    Parse `key: value` output of singleton menus.
+
+    Indented lines without a key continue the previous value.
+    """
+
+    record = {}
+    last_key = None
+
+    for line in output.splitlines():
+        m = _PROPERTY.match(line)
+
+        if m:
+            last_key = m.group(1)
+            record[last_key] = m.group(2).strip()
+
+        elif last_key and line.strip():
+            record[last_key] = f"{record[last_key]} {line.strip()}"
+
+    if typed:
+        for key, raw in record.items():
+            record[key] = _value(raw, True)
+
+    return record
+
+
+def parse_table(output: str, *, typed: bool = True) -> list[dict]:
+    """
+    Parse tabular `print` output.
+
+    Columns are located by the positions of the names in the header
+    line (the line starting with "#"). Keys are lowercased header names.
+    """
+
+    lines = output.splitlines()
+
+    header_at = next(
+        (i for i, line in enumerate(lines) if line.lstrip().startswith("#")),
+        None,
+    )
+    if header_at is None:
+        return []
+
+    header = lines[header_at]
+    columns = [
+        (m.start(), m.group(0).lower())
+        for m in re.finditer(r"\S+", header)
+    ]
+    columns[0] = (columns[0][0], ".index")
+
+    bounds = [
+        (start, columns[i + 1][0] if i + 1 < len(columns) else None, name)
+        for i, (start, name) in enumerate(columns)
+    ]
+
+    records = []
+    for line in lines[header_at + 1:]:
+        if not line.strip() or line.startswith(_HEADER_PREFIXES):
+            continue
+
+        record = {}
+        for start, end, name in bounds:
+            raw = line[start:end].strip()
+            if raw:
+                record[name] = _value(raw, typed)
+
+        # Index column may also carry flags ("0 R")
+        index, _, flags = str(record.get(".index", "")).partition(" ")
+        if index.isdigit():
+            record[".index"] = int(index)
+            if flags.strip():
+                record[".flags"] = flags.strip()
+
+        records.append(record)
+
+    return records
+
+
+def parse_print(output: str, *, typed: bool = True) -> list[dict]:
+    """
+    Parse any supported `print` output into a list of records.
+
+    The format is detected from the first meaningful line:
+    as-value, detail/terse, table, or key: value properties
+    (returned as a single record).
+    """
+
+    for line in output.splitlines():
+        stripped = line.strip()
+
+        if not stripped or stripped.startswith(_HEADER_PREFIXES):
+            continue
+
+        if stripped.startswith("#"):
+            return parse_table(output, typed=typed)
+
+        m = _RECORD_START.fullmatch(line)
+        if m and ("=" in m.group(3) or m.group(3).startswith(";;;")):
+            return parse_detail(output, typed=typed)
+
+        if _AS_VALUE_TOKEN.match(stripped) and (
+            ";" in stripped or stripped.startswith(".id=")
+        ):
+            return parse_as_value(output, typed=typed)
+
+        if _PROPERTY.match(line):
+            props = parse_properties(output, typed=typed)
+            return [props] if props else []
+
+        # Unknown first line (e.g. a stray prompt echo): keep looking
+        continue
+
+    return []
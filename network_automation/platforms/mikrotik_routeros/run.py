@@ -4,42 +4,205 @@
 Mikrotik RouterOS command execution helpers.
 """
 
+import re
+
+from network_automation.platforms.mikrotik_routeros.parser import parse_print
 from network_automation.results import OperationResult
+from network_automation.spans import traced
+
+# Output-format arguments of `print`; commands using one are left as-is
+_PRINT_FORMATS = {"as-value", "terse", "detail"}
+
+_PRINT_WORD = re.compile(r"(?<!\S)print(?!\S)")
+
+# Batch mode: marker printed after each command, and read timeout for
+# the whole batch
+BATCH_MARKER = "NAUTO-MARK"
+BATCH_READ_TIMEOUT = 60.0
+
+# RouterOS CLI prompt ("[admin@R1] > ")
+_PROMPT = r"\].*>"
+
+
+def structured_command(cmd: str) -> str:
+    """
+    Rewrite a `print` command to use as-value output.
+
+    The flag is inserted right after `print`, so `where` clauses keep
+    working. Other commands and print commands that already choose an
+    output format are returned unchanged.
+    """
+
+    words = cmd.split()
+    if "print" not in words or _PRINT_FORMATS.intersection(words):
+        return cmd
+
+    return _PRINT_WORD.sub("print as-value", cmd, count=1)
+
+
+def read_only_command(cmd: str) -> bool:
+    """
+    Return True for commands that only read device state.
 
+    `print` and `export` qualify unless they write a file (file=).
+    Both must be whole words; `export` may carry a menu path
+    (/export, /ip/address/export).
+    """
+
+    words = cmd.split()
+
+    if "print" not in words and not any(
+        w.rsplit("/", 1)[-1] == "export" for w in words
+    ):
+        return False
+
+    return not any(w.startswith("file=") for w in words)
 
-def run_commands(client, commands):
+
+@traced("run_commands")
+def run_commands(
+    client,
+    commands,
+    *,
+    structured: bool = False,
+    batch: bool = False,
+):
     """
     Execute one or more RouterOS commands on an active connection.
 
     This helper assumes:
     - client.conn is already connected
     - no connection lifecycle handling here
+
+    With structured=True, print commands are sent with as-value output
+    and each entry carries parsed "records" next to the raw "output"
+    (which keeps error text and output of non-print commands).
+    With batch=True, all commands are written in one round-trip
+    (see send_batch()).
     """
 
     if isinstance(commands, str):
         commands = [commands]
 
+    sent = list(commands)
+    if structured:
+        sent = [structured_command(cmd) for cmd in sent]
+
+    if batch:
+        client.logger.info("Running %d commands in one batch", len(sent))
+        if not all(client.is_read_only(cmd) for cmd in sent):
+            client.invalidate_cache()
+        raw_outputs = send_batch(client, sent)
+    else:
+        raw_outputs = []
+        for cmd in sent:
+            client.logger.info("Running command: %s", cmd)
+            raw_outputs.append(client.send_command(cmd))
+
+    outputs = []
+
+    for cmd, output in zip(commands, raw_outputs):
+        entry = {
+            "command": cmd,
+            "output": output,
+        }
+
+        if structured:
+            entry["records"] = parse_print(output)
+
+        outputs.append(entry)
+
+    return outputs
+
+
+# -------------------------------------------------------
+# Batched submission
+# -------------------------------------------------------
+
+def _marker(index: int) -> str:
+    return f"{BATCH_MARKER}-{index}"
+
+
+def _marker_command(index: int) -> str:
+    # Concatenation keeps the marker text out of the command echo
+    return f':put ("{BATCH_MARKER}-" . "{index}")'
+
+
+def send_batch(client, commands: list[str]) -> list[str]:
+    """
+    Send all commands in one write and split the output per command.
+
+    Every command is followed by a `:put` marker; the combined output is
+    read once, up to the final marker and prompt, then cut at the
+    markers. Command echoes, marker echoes and prompts are removed.
+    """
+
+    if not commands:
+        return []
+
+    conn = client.conn
+    enter = conn.RETURN
+
+    payload = "".join(
+        f"{cmd}{enter}{_marker_command(i)}{enter}"
+        for i, cmd in enumerate(commands)
+    )
+
+    with client.span("command", f"batch of {len(commands)}"):
+        conn.write_channel(payload)
+
+        raw = conn.read_until_pattern(
+            pattern=rf"^{re.escape(_marker(len(commands) - 1))}\r?$[\s\S]*{_PROMPT}",
+            read_timeout=BATCH_READ_TIMEOUT,
+            re_flags=re.M,
+        )
+
+    return split_batch_output(raw, commands)
+
+
+def split_batch_output(raw: str, commands: list[str]) -> list[str]:
+    """Cut batch output at the marker lines into one output per command."""
+
     outputs = []
+    current = []
+
+    for line in raw.splitlines():
+        if line.strip() == _marker(len(outputs)):
+            outputs.append(_clean_segment(current, commands[len(outputs)]))
+            current = []
 
-    for cmd in commands:
-        client.logger.info("Running command: %s", cmd)
+            if len(outputs) == len(commands):
+                break
+            continue
 
-        output = client.conn.send_command(cmd)
+        current.append(line)
 
-        outputs.append(
-            {
-                "command": cmd,
-                "output": output,
-            }
+    if len(outputs) != len(commands):
+        raise RuntimeError(
+            f"Batch output incomplete: {len(outputs)} of {len(commands)} commands"
         )
 
     return outputs
 
 
+def _clean_segment(lines: list[str], cmd: str) -> str:
+    # Output starts after the command echo ("[admin@R1] > cmd")
+    for i, line in enumerate(lines):
+        if line.rstrip().endswith(cmd):
+            lines = lines[i + 1:]
+            break
+
+    lines = [line for line in lines if f'"{BATCH_MARKER}-"' not in line]
+
+    return "\n".join(lines).strip("\r\n")
+
+
 def run(
     client,
     commands,
     *,
+    structured: bool = False,
+    batch: bool = False,
     return_result: bool = False,
 ):
     """
@@ -49,7 +212,9 @@ def run(
     - Connects to device
     - Executes commands
     - Disconnects
-    - Returns raw output or OperationResult
+    - Returns raw output, parsed records (structured=True)
+      or OperationResult
+    - batch=True sends all commands in one round-trip
     - Raises exceptions on failure
     """
 
@@ -58,15 +223,23 @@ def run(
         operation="run",
         metadata={
             "commands": commands,
+            "structured": structured,
+            "batch": batch,
         },
     )
 
     result.mark_started()
+    previous = client.attach_result(result)
 
     try:
         client.connect()
 
-        outputs = run_commands(client, commands)
+        outputs = run_commands(
+            client,
+            commands,
+            structured=structured,
+            batch=batch,
+        )
 
         result.metadata["output"] = outputs
         result.message = "Commands executed successfully"
@@ -81,4 +254,5 @@ def run(
     finally:
         result.mark_finished()
         client.disconnect()
+        client.detach_result(previous)
 
@@ -0,0 +1,690 @@
+# network_automation/platforms/mikrotik_routeros/simulator.py
+
+"""
+In-process RouterOS SSH/SFTP simulator.
+
+A Paramiko SSH server that behaves like a RouterOS device closely
+enough for the real client stack (Netmiko login, prompt handling,
+command echo, Paramiko SFTP) to run against it on localhost:
+
+    with RouterOSSimulator(latency=0.02, bandwidth=10_000_000) as sim:
+        client = MikrotikRouterOS(**sim.client_params())
+        client.get_info()
+
+Supported commands:
+    /system resource print
+    /file print detail [where name~"..." | name="..."]
+    /file remove <name>
+    /system backup save name=<name>
+    /tool fetch url="..."
+    /system reboot          (asks for confirmation)
+    /export
+    :put <string expression>
+    quit
+
+Injectable behavior:
+    latency          seconds added to connection setup and every reply
+    bandwidth        SFTP bytes per second (None: unlimited)
+    reboot_duration  seconds the device refuses SSH after a reboot
+
+Rebooting installs an uploaded/fetched routeros-<version>*.npk, like
+the real device.
+
+For tests and benchmarks only; there is no security whatsoever.
+"""
+
+import logging
+import os
+import re
+import socket
+import stat
+import threading
+import time
+from datetime import datetime
+
+import paramiko
+
+MIB = 1024 ** 2
+
+# Server-side Paramiko log channel; clients hanging up (probes, reboots)
+# are routine here, so nothing is printed unless logging is configured
+_SSH_LOG = f"{__name__}.ssh"
+logging.getLogger(_SSH_LOG).addHandler(logging.NullHandler())
+
+# Default size of fetched firmware packages (must pass upgrade checks)
+DEFAULT_FIRMWARE_SIZE = 12 * MIB
+
+# Default size of generated .backup files
+DEFAULT_BACKUP_SIZE = 64 * 1024
+
+# Netmiko appends terminal options to the login name (admin+ct511w4098h)
+_LOGIN_OPTIONS = re.compile(r"\+[a-z0-9]*$")
+
+_PACKAGE = re.compile(r"^routeros-(\d+(?:\.\d+)*)(?:-[\w]+)?\.npk$")
+
+_FILE_TYPES = {
+    ".backup": "backup",
+    ".npk": "package",
+    ".rsc": "script",
+}
+
+
+# -------------------------------------------------------
+# Device state
+# -------------------------------------------------------
+
+class SimulatedRouter:
+    """
+    State of one simulated RouterOS device: identity, version and files.
+
+    Thread-safe; shared by all sessions of a simulator.
+    """
+
+    def __init__(
+        self,
+        *,
+        identity: str = "MikroTik",
+        version: str = "7.14",
+        arch: str = "x86_64",
+        board: str = "CHR",
+        files: dict[str, bytes] | None = None,
+        firmware_size: int = DEFAULT_FIRMWARE_SIZE,
+        backup_size: int = DEFAULT_BACKUP_SIZE,
+    ):
+        self.identity = identity
+        self.version = version
+        self.arch = arch
+        self.board = board
+        self.firmware_size = firmware_size
+        self.backup_size = backup_size
+
+        self.booted_at = time.time()
+        self.reboots = 0
+
+        self._files = {}
+        self._mtimes = {}
+        self._lock = threading.Lock()
+
+        for name, data in (files or {}).items():
+            self.put_file(name, data)
+
+    # ---- files ----
+
+    def put_file(self, name: str, data: bytes):
+        with self._lock:
+            self._files[name] = bytes(data)
+            self._mtimes[name] = int(time.time())
+
+    def get_file(self, name: str) -> bytes | None:
+        return self._files.get(name)
+
+    def remove_file(self, name: str) -> bool:
+        with self._lock:
+            self._mtimes.pop(name, None)
+            return self._files.pop(name, None) is not None
+
+    def file_names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._files)
+
+    def file_mtime(self, name: str) -> int:
+        return self._mtimes.get(name, 0)
+
+    # ---- device operations ----
+
+    def backup_data(self) -> bytes:
+        """
+        Content of a new .backup file.
+
+        Like RouterOS, every save is encrypted with a fresh salt, so two
+        backups of the same config are never byte-identical.
+        """
+        header = f"RouterOS backup {self.identity} {self.version}\n".encode()
+        return (header + os.urandom(16)).ljust(self.backup_size, b"\0")
+
+    def install_packages(self):
+        """Apply a pending routeros-*.npk on reboot, as RouterOS does."""
+        for name in self.file_names():
+            m = _PACKAGE.match(name.rsplit("/", 1)[-1])
+            if m:
+                self.version = m.group(1)
+                self.remove_file(name)
+
+    def uptime(self) -> str:
+        seconds = int(time.time() - self.booted_at)
+        return f"{seconds // 3600}h{seconds // 60 % 60}m{seconds % 60}s"
+
+
+# -------------------------------------------------------
+# Simulator
+# -------------------------------------------------------
+
+class RouterOSSimulator:
+    """
+    SSH/SFTP server for one SimulatedRouter on a local port.
+
+    Use as a context manager, or call start() / stop().
+    """
+
+    def __init__(
+        self,
+        router: SimulatedRouter | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        username: str = "admin",
+        password: str = "admin",
+        latency: float = 0.0,
+        bandwidth: float | None = None,
+        reboot_duration: float = 1.0,
+        host_key: paramiko.PKey | None = None,
+    ):
+        self.router = router or SimulatedRouter()
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.reboot_duration = reboot_duration
+        self.host_key = host_key or paramiko.ECDSAKey.generate()
+
+        # Statistics
+        self.connections = 0
+        self.commands = []
+
+        self._down_until = 0.0
+        self._listener = None
+        self._thread = None
+        self._transports = set()
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------
+
+    def start(self):
+        self._listener = socket.create_server((self.host, self.port))
+        self.port = self._listener.getsockname()[1]
+
+        self._thread = threading.Thread(
+            target=self._serve,
+            name=f"routeros-sim-{self.port}",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._listener is None:
+            return
+
+        # shutdown() wakes the accept() of the server thread
+        try:
+            self._listener.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._listener.close()
+        self._listener = None
+
+        self._close_transports()
+        self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def client_params(self, **params) -> dict:
+        """MikrotikRouterOS / get_client() parameters for this device."""
+        return {
+            "host": self.host,
+            "port": self.port,
+            "username": self.username,
+            "password": self.password,
+            **params,
+        }
+
+    @property
+    def rebooting(self) -> bool:
+        return time.monotonic() < self._down_until
+
+    def reboot(self):
+        """Drop all sessions and refuse SSH for reboot_duration seconds."""
+        self._down_until = time.monotonic() + self.reboot_duration
+        self._close_transports()
+
+        self.router.install_packages()
+        self.router.booted_at = time.time() + self.reboot_duration
+        self.router.reboots += 1
+
+    # -------------------------------------------------------
+    # Connections
+    # -------------------------------------------------------
+
+    def _serve(self):
+        listener = self._listener
+
+        while True:
+            try:
+                sock, _ = listener.accept()
+            except OSError:
+                return
+
+            if self.rebooting:
+                # Port answers, SSH does not (boot in progress)
+                sock.close()
+                continue
+
+            threading.Thread(
+                target=self._handle,
+                args=(sock,),
+                daemon=True,
+            ).start()
+
+    def _handle(self, sock):
+        self.delay()
+
+        transport = paramiko.Transport(sock)
+        transport.set_log_channel(_SSH_LOG)
+        transport.add_server_key(self.host_key)
+        transport.set_subsystem_handler(
+            "sftp",
+            paramiko.SFTPServer,
+            _SFTPInterface,
+            self,
+        )
+
+        with self._lock:
+            self._transports = {t for t in self._transports if t.is_active()}
+            self._transports.add(transport)
+            self.connections += 1
+
+        try:
+            transport.start_server(server=_SSHServer(self))
+        except (paramiko.SSHException, EOFError, OSError):
+            transport.close()
+
+    def _close_transports(self):
+        with self._lock:
+            transports, self._transports = self._transports, set()
+
+        for transport in transports:
+            transport.close()
+
+    # -------------------------------------------------------
+    # Injected behavior
+    # -------------------------------------------------------
+
+    def delay(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def throttle(self, size: int):
+        if self.bandwidth:
+            time.sleep(size / self.bandwidth)
+
+    # -------------------------------------------------------
+    # CLI
+    # -------------------------------------------------------
+
+    def prompt(self) -> str:
+        return f"[{self.username}@{self.router.identity}] > "
+
+    def _shell(self, channel):
+        """Line-based RouterOS CLI on one shell channel."""
+
+        channel.sendall(
+            f"\r\n\r\n  MikroTik RouterOS {self.router.version} "
+            f"(c) 1999-2024       https://www.mikrotik.com/\r\n\r\n"
+            + self.prompt()
+        )
+
+        buffer = ""
+        confirm_reboot = False
+
+        try:
+            while True:
+                data = channel.recv(4096)
+                if not data:
+                    return
+                buffer += data.decode("utf-8", errors="replace")
+
+                while "\n" in buffer:
+                    line, buffer = buffer.split("\n", 1)
+                    line = line.rstrip("\r")
+
+                    if confirm_reboot:
+                        confirm_reboot = False
+                        channel.sendall(line + "\r\n")
+
+                        if line.strip().lower().startswith("y"):
+                            channel.sendall("system will reboot shortly\r\n")
+                            time.sleep(0.1)
+                            self.reboot()
+                            return
+
+                        channel.sendall("\r\n" + self.prompt())
+                        continue
+
+                    command = " ".join(line.split())
+                    if command == "quit":
+                        channel.sendall(line + "\r\ninterrupted\r\n")
+                        return
+
+                    self.delay()
+                    channel.sendall(line + "\r\n")
+
+                    if not command:
+                        channel.sendall(self.prompt())
+                        continue
+
+                    self.commands.append(command)
+
+                    if command == "/system reboot":
+                        channel.sendall("Reboot, yes? [y/N]: ")
+                        confirm_reboot = True
+                        continue
+
+                    output = self.execute(command)
+                    if output:
+                        channel.sendall(output.replace("\n", "\r\n") + "\r\n")
+                    channel.sendall(self.prompt())
+
+        except (OSError, EOFError):
+            pass
+
+        finally:
+            channel.close()
+
+    def execute(self, command: str) -> str:
+        """Run one CLI command against the router; return its output."""
+
+        for pattern, handler in _COMMANDS:
+            m = pattern.match(command)
+            if m:
+                return handler(self.router, *m.groups())
+
+        word = command.split()[0]
+        return f"bad command name {word.lstrip('/')} (line 1 column 2)"
+
+
+# -------------------------------------------------------
+# Command handlers
+# -------------------------------------------------------
+
+def _format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size}B"
+    if size < MIB:
+        return f"{size / 1024:.1f}KiB"
+    return f"{size / MIB:.1f}MiB"
+
+
+def _timestamp(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _resource_print(router: SimulatedRouter) -> str:
+    properties = {
+        "uptime": router.uptime(),
+        "version": f"{router.version} (stable)",
+        "free-memory": "900.5MiB",
+        "total-memory": "1024.0MiB",
+        "cpu": "QEMU",
+        "cpu-count": "1",
+        "cpu-load": "1%",
+        "free-hdd-space": "80.1MiB",
+        "total-hdd-space": "128.0MiB",
+        "architecture-name": router.arch,
+        "board-name": router.board,
+        "platform": "MikroTik",
+    }
+    return "\n".join(f"{key:>25}: {value}" for key, value in properties.items())
+
+
+def _file_print(router: SimulatedRouter, operator=None, value=None) -> str:
+    lines = ["Flags: "]
+    index = 0
+
+    for name in router.file_names():
+        if operator == "~" and not re.search(value, name):
+            continue
+        if operator == "=" and name != value:
+            continue
+
+        data = router.get_file(name)
+        if data is None:
+            continue
+
+        suffix = os.path.splitext(name)[1]
+        lines.append(
+            f' {index} name="{name}" type="{_FILE_TYPES.get(suffix, "file")}" '
+            f"size={_format_size(len(data))} "
+            f"last-modified={_timestamp(router.file_mtime(name))}"
+        )
+        index += 1
+
+    return "\n".join(lines)
+
+
+def _file_remove(router: SimulatedRouter, quoted, bare) -> str:
+    if not router.remove_file(quoted or bare):
+        return "no such item"
+    return ""
+
+
+def _backup_save(router: SimulatedRouter, quoted, bare) -> str:
+    name = quoted or bare
+    if not name.endswith(".backup"):
+        name += ".backup"
+
+    router.put_file(name, router.backup_data())
+    return "Configuration backup saved"
+
+
+def _fetch(router: SimulatedRouter, url) -> str:
+    name = url.rstrip("/").rsplit("/", 1)[-1]
+    router.put_file(name, bytes(router.firmware_size))
+
+    size = _format_size(router.firmware_size)
+    return (
+        f"      status: finished\n"
+        f"  downloaded: {size}\n"
+        f"       total: {size}\n"
+        f"    duration: 1s"
+    )
+
+
+def _export(router: SimulatedRouter) -> str:
+    return "\n".join(
+        [
+            f"# {datetime.now():%Y-%m-%d %H:%M:%S} by RouterOS {router.version}",
+            "# software id = SIMU-LATE",
+            "#",
+            "/interface bridge",
+            "add name=bridge1",
+            "/ip address",
+            "add address=192.0.2.1/24 interface=bridge1",
+            "/system identity",
+            f"set name={router.identity}",
+        ]
+    )
+
+
+def _put(router: SimulatedRouter, expression) -> str:
+    literals = re.findall(r'"([^"]*)"', expression)
+    return "".join(literals) if literals else expression
+
+
+_COMMANDS = [
+    (re.compile(r"^/system resource print(?: without-paging)?$"), _resource_print),
+    (re.compile(r'^/file print detail(?: where name([~=])"([^"]*)")?$'), _file_print),
+    (re.compile(r'^/file remove (?:"([^"]+)"|(\S+))$'), _file_remove),
+    (re.compile(r'^/system backup save name=(?:"([^"]+)"|(\S+))$'), _backup_save),
+    (re.compile(r'^/tool fetch url="([^"]+)"'), _fetch),
+    (re.compile(r"^/export(?: .*)?$"), _export),
+    (re.compile(r"^:put (.+)$"), _put),
+]
+
+
+# -------------------------------------------------------
+# Paramiko server side
+# -------------------------------------------------------
+
+class _SSHServer(paramiko.ServerInterface):
+    def __init__(self, simulator: RouterOSSimulator):
+        self.simulator = simulator
+
+    def _user_ok(self, username: str) -> bool:
+        return _LOGIN_OPTIONS.sub("", username) == self.simulator.username
+
+    def get_allowed_auths(self, username):
+        return "password,publickey"
+
+    def check_auth_password(self, username, password):
+        if self._user_ok(username) and password == self.simulator.password:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_auth_publickey(self, username, key):
+        # Any key is accepted for the configured user
+        if self._user_ok(username):
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_pty_request(self, channel, term, width, height, pixelwidth, pixelheight, modes):
+        return True
+
+    def check_channel_shell_request(self, channel):
+        threading.Thread(
+            target=self.simulator._shell,
+            args=(channel,),
+            daemon=True,
+        ).start()
+        return True
+
+
+class _SFTPHandle(paramiko.SFTPHandle):
+    """Open file: an in-memory buffer written back on close."""
+
+    def __init__(self, simulator: RouterOSSimulator, name: str, data: bytes, writable: bool):
+        super().__init__()
+        self.simulator = simulator
+        self.name = name
+        self.data = bytearray(data)
+        self.writable = writable
+
+    def read(self, offset, length):
+        chunk = bytes(self.data[offset:offset + length])
+        self.simulator.throttle(len(chunk))
+        return chunk
+
+    def write(self, offset, data):
+        if not self.writable:
+            return paramiko.SFTP_PERMISSION_DENIED
+
+        self.simulator.throttle(len(data))
+        if offset > len(self.data):
+            self.data.extend(bytes(offset - len(self.data)))
+        self.data[offset:offset + len(data)] = data
+        return paramiko.SFTP_OK
+
+    def stat(self):
+        return _attributes(self.name, len(self.data), int(time.time()))
+
+    def close(self):
+        if self.writable:
+            self.simulator.router.put_file(self.name, bytes(self.data))
+        super().close()
+
+
+class _SFTPInterface(paramiko.SFTPServerInterface):
+    """SFTP view of the router's flat file list."""
+
+    def __init__(self, server, simulator: RouterOSSimulator, *args, **kwargs):
+        super().__init__(server, *args, **kwargs)
+        self.simulator = simulator
+        self.router = simulator.router
+
+    def open(self, path, flags, attr):
+        name = _name(path)
+        data = self.router.get_file(name)
+        writable = bool(flags & (os.O_WRONLY | os.O_RDWR))
+
+        if data is None:
+            if not flags & os.O_CREAT:
+                return paramiko.SFTP_NO_SUCH_FILE
+            data = b""
+
+        if flags & os.O_TRUNC:
+            data = b""
+
+        return _SFTPHandle(self.simulator, name, data, writable)
+
+    def stat(self, path):
+        name = _name(path)
+        if not name:
+            return _directory()
+
+        data = self.router.get_file(name)
+        if data is None:
+            return paramiko.SFTP_NO_SUCH_FILE
+
+        return _attributes(name, len(data), self.router.file_mtime(name))
+
+    lstat = stat
+
+    def list_folder(self, path):
+        if _name(path):
+            return paramiko.SFTP_NO_SUCH_FILE
+
+        entries = []
+        for name in self.router.file_names():
+            data = self.router.get_file(name)
+            if data is not None:
+                entries.append(
+                    _attributes(name, len(data), self.router.file_mtime(name))
+                )
+        return entries
+
+    def remove(self, path):
+        if not self.router.remove_file(_name(path)):
+            return paramiko.SFTP_NO_SUCH_FILE
+        return paramiko.SFTP_OK
+
+    def rename(self, oldpath, newpath):
+        data = self.router.get_file(_name(oldpath))
+        if data is None:
+            return paramiko.SFTP_NO_SUCH_FILE
+
+        self.router.put_file(_name(newpath), data)
+        self.router.remove_file(_name(oldpath))
+        return paramiko.SFTP_OK
+
+
+def _name(path: str) -> str:
+    return path.strip("/")
+
+
+def _attributes(name: str, size: int, mtime: int) -> paramiko.SFTPAttributes:
+    attrs = paramiko.SFTPAttributes()
+    attrs.filename = name
+    attrs.st_size = size
+    attrs.st_mode = stat.S_IFREG | 0o644
+    attrs.st_mtime = mtime
+    attrs.st_atime = mtime
+    return attrs
+
+
+def _directory() -> paramiko.SFTPAttributes:
+    attrs = paramiko.SFTPAttributes()
+    attrs.st_mode = stat.S_IFDIR | 0o755
+    return attrs
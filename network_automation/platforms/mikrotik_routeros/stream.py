@@ -0,0 +1,179 @@
+# network_automation/platforms/mikrotik_routeros/stream.py
+
+"""
+Mikrotik RouterOS streaming command output helpers.
+
+Output is read from the channel as it arrives and yielded line by line,
+so memory stays flat regardless of output size.
+"""
+
+import re
+import time
+from pathlib import Path
+
+from network_automation.results import OperationResult
+
+# Idle time without any data before a stream is aborted
+STREAM_READ_TIMEOUT = 60.0
+
+# Pause between channel polls when no data is available
+STREAM_POLL_INTERVAL = 0.05
+
+# Prompt left on an unterminated line once the command finished
+_PROMPT_LINE = re.compile(r"\s*\[[^\]\n]*\]\s*>\s*$")
+
+
+def stream_command(
+    client,
+    command: str,
+    *,
+    read_timeout: float = STREAM_READ_TIMEOUT,
+):
+    """
+    Send a command and yield its output lines as they arrive.
+
+    - no connect/disconnect
+    - the command echo, the blank line before the final prompt and the
+      prompt itself are not yielded
+    - raises TimeoutError if no data arrives for read_timeout seconds
+    """
+
+    conn = client.conn
+
+    if not client.is_read_only(command):
+        client.invalidate_cache()
+
+    client.logger.info("Streaming command: %s", command)
+
+    with client.span("command", command):
+        conn.write_channel(f"{command}{conn.RETURN}")
+        yield from _read_lines(conn, command, read_timeout)
+
+
+def _read_lines(conn, command: str, read_timeout: float):
+    pending = ""
+    echo_seen = False
+    # A blank line is held back until the next line: RouterOS prints
+    # one right before the prompt, which is not part of the output
+    held_blank = False
+    deadline = time.monotonic() + read_timeout
+
+    while True:
+        data = conn.read_channel()
+
+        if not data:
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"No output from '{command}' for {read_timeout}s"
+                )
+            time.sleep(STREAM_POLL_INTERVAL)
+            continue
+
+        deadline = time.monotonic() + read_timeout
+
+        *lines, pending = (pending + data).split("\n")
+
+        for line in lines:
+            line = line.rstrip("\r")
+
+            if not echo_seen:
+                # Skip everything up to the echoed command line
+                echo_seen = line.rstrip().endswith(command)
+                continue
+
+            if held_blank:
+                yield ""
+            held_blank = not line
+            if line:
+                yield line
+
+        if echo_seen and _PROMPT_LINE.match(pending):
+            return
+
+
+def run_stream(
+    client,
+    command: str,
+    *,
+    sink=None,
+    return_result: bool = False,
+):
+    """
+    Run a command as a full workflow operation, streaming its output.
+
+    Behavior:
+    - Without sink: returns a generator of output lines; the device is
+      connected on first iteration and disconnected when it is exhausted
+      or closed
+    - With sink (path or writable text file): writes lines to it and
+      returns None or OperationResult (lines, bytes, sink)
+    - Raises exceptions on failure
+    """
+
+    if sink is None:
+        return _iter_stream(client, command)
+
+    result = OperationResult(
+        success=True,
+        operation="stream",
+        metadata={
+            "command": command,
+        },
+    )
+
+    result.mark_started()
+    previous = client.attach_result(result)
+
+    try:
+        client.connect()
+
+        if isinstance(sink, (str, Path)):
+            with open(sink, "w", encoding="utf-8") as f:
+                lines, size = write_lines(stream_command(client, command), f)
+            result.metadata["sink"] = str(sink)
+        else:
+            lines, size = write_lines(stream_command(client, command), sink)
+
+        result.metadata["lines"] = lines
+        result.metadata["bytes"] = size
+        result.message = f"Streamed {lines} lines"
+
+        return result if return_result else None
+
+    except Exception as exc:
+        result.success = False
+        result.errors.append(str(exc))
+        raise
+
+    finally:
+        result.mark_finished()
+        client.disconnect()
+        client.detach_result(previous)
+
+
+def _iter_stream(client, command: str):
+    client.connect()
+    try:
+        yield from stream_command(client, command)
+    finally:
+        client.disconnect()
+
+
+def write_lines(lines, f) -> tuple[int, int]:
+    """
+    Write lines to a text file.
+
+    Returns (lines, bytes) written; bytes are counted UTF-8 encoded
+    and before any compression.
+    """
+
+    count = 0
+    size = 0
+
+    for line in lines:
+        f.write(line)
+        f.write("\n")
+        count += 1
+        size += len(line.encode("utf-8")) + 1
+
+    return count, size
@@ -4,18 +4,27 @@
 Mikrotik firmware upgrade helpers.
 """
 
-import re
 import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
 
+from network_automation.probe import PROBE_READY, next_delay
 from network_automation.results import OperationResult
+from network_automation.spans import phase_entry
 from network_automation.platforms.mikrotik_routeros.info import (
     get_info,
     normalize_version,
     is_newer_version,
 )
+from network_automation.platforms.mikrotik_routeros.parser import parse_detail
 from network_automation.platforms.mikrotik_routeros.upload import upload_files
 
+MIB = 1024 ** 2
+
+# Sanity bound: anything smaller is a failed or truncated download
+MIN_FIRMWARE_MIB = 10
+
 
 # -------------------------------------------------------
 # Firmware helpers
@@ -27,6 +36,20 @@ def firmware_filename(version: str, arch: str) -> str:
     return f"routeros-{version}-{arch}.npk"
 
 
+def find_file(output: str, filename: str) -> dict | None:
+    """
+    Return the `/file print detail` record for filename, if present.
+
+    Matches the file at the root or inside a directory (e.g. flash/).
+    """
+
+    for record in parse_detail(output):
+        name = record.get("name", "")
+        if name == filename or name.endswith(f"/{filename}"):
+            return record
+    return None
+
+
 def download_firmware(client):
     """
     Download firmware directly on device from repo_url.
@@ -41,13 +64,11 @@ def download_firmware(client):
     client.logger.info("Download URL: %s", url)
 
     # Check if file already exists
-    initial_info = client.conn.send_command(
+    initial_info = client.send_command(
         f'/file print detail where name~"{filename}"'
     )
 
-    exists = bool(
-        re.search(rf'\bname=[^\s]*{re.escape(filename)}\b', initial_info)
-    )
+    exists = find_file(initial_info, filename) is not None
 
     if not exists:
         client.logger.info("File not found — downloading firmware...")
@@ -55,7 +76,9 @@ def download_firmware(client):
         cmd = f'/tool fetch url="{url}"'
         client.logger.info("Executing: %s", cmd)
 
-        output = client.conn.send_command_timing(cmd)
+        client.invalidate_cache()
+        with client.span("command", cmd):
+            output = client.conn.send_command_timing(cmd)
         output_l = output.lower()
 
         if "failure" in output_l or "error" in output_l:
@@ -74,33 +97,27 @@ def download_firmware(client):
     # Validate file presence and size
     time.sleep(0.5)
 
-    file_info = client.conn.send_command(
+    file_info = client.send_command(
         f'/file print detail where name~"{filename}"'
     )
 
-    line_match = re.search(
-        rf'^.*\bname=[^\s]*{re.escape(filename)}\b.*$',
-        file_info,
-        re.MULTILINE,
-    )
+    record = find_file(file_info, filename)
 
-    if not line_match:
+    if not record:
         raise RuntimeError(
             f"Firmware '{filename}' not found after download."
         )
 
-    line = line_match.group(0)
-
-    match = re.search(r'size=(\d+(?:\.\d+)?)MiB', line)
-    if not match:
+    size_bytes = record.get("size")
+    if not isinstance(size_bytes, int):
         raise RuntimeError(
             f"Firmware '{filename}' size missing or invalid."
         )
 
-    size = float(match.group(1))
-    if size < 10:
+    size = size_bytes / MIB
+    if size < MIN_FIRMWARE_MIB:
         raise RuntimeError(
-            f"Firmware '{filename}' too small ({size}MiB)."
+            f"Firmware '{filename}' too small ({size:.1f}MiB)."
         )
 
     client.logger.info(
@@ -113,6 +130,9 @@ def download_firmware(client):
 def upload_firmware(client):
     """
     Upload firmware to device from local repo_path.
+
+    Skips the transfer when the device already holds an identical file
+    (same size, and same SHA-256 when client.verify_checksum is set).
     """
 
     if not client.repo_path:
@@ -139,10 +159,13 @@ def upload_firmware(client):
         local_file,
     )
 
-    upload_files(
+    return upload_files(
         client,
         files=[local_file],
         remote_dir="/",
+        resume=client.resume_upload,
+        verify_checksum=client.verify_checksum,
+        skip_existing=True,
     )
 
 
@@ -151,6 +174,7 @@ def provide_firmware(client):
     Provide firmware to device using selected method.
 
     firmware_delivery is REQUIRED.
+    Returns TransferStats for uploads, None for downloads.
     """
 
     method = getattr(client, "firmware_delivery", None)
@@ -171,7 +195,7 @@ def provide_firmware(client):
             raise RuntimeError(
                 "firmware_delivery='upload' requires repo_path"
             )
-        upload_firmware(client)
+        return upload_firmware(client)
 
     elif method == "download":
         download_firmware(client)
@@ -184,79 +208,334 @@ def provide_firmware(client):
 
 
 # -------------------------------------------------------
-# Upgrade workflow
+# Upgrade state machine
 # -------------------------------------------------------
 
-def upgrade(client, *, return_result: bool = False):
-    """Run full firmware upgrade workflow."""
+PHASE_PREFLIGHT = "preflight"
+PHASE_PROVIDE_FIRMWARE = "provide_firmware"
+PHASE_REBOOT = "reboot"
+PHASE_AWAIT_ONLINE = "await_online"
+PHASE_VERIFY = "verify"
+PHASE_DONE = "done"
+PHASE_FAILED = "failed"
+
+
+@dataclass
+class UpgradeState:
+    """
+    Serializable progress of one device upgrade.
+
+    Holds only plain values so it can be persisted (to_dict) and
+    resumed later, possibly by another worker or process.
+    """
+
+    host: str
+    target_version: str
+    phase: str = PHASE_PREFLIGHT
+
+    arch: str | None = None
+    current_version: str | None = None
+    final_version: str | None = None
+    skipped: bool = False
+    firmware_transfer: dict | None = None
+    error: str | None = None
+    failed_phase: str | None = None
+
+    # Wall-clock timestamps (epoch seconds)
+    started_at: float | None = None
+    finished_at: float | None = None
+    reboot_at: float | None = None
+
+    # await_online scheduling
+    next_probe_at: float = 0.0
+    probe_delay: float = 0.0
+    last_probe: str | None = None
+
+    # Timed phases (see OperationResult.phases)
+    phases: list = field(default_factory=list)
+
+    @property
+    def finished(self) -> bool:
+        return self.phase in (PHASE_DONE, PHASE_FAILED)
+
+    @property
+    def waiting(self) -> bool:
+        """True while parked waiting for the device to come back."""
+        return self.phase == PHASE_AWAIT_ONLINE
+
+    def add_phase(
+        self,
+        name: str,
+        seconds: float,
+        *,
+        target: str | None = None,
+        started: float | None = None,
+    ):
+        """Record a timed phase; lets the state receive client spans."""
+        self.phases.append(
+            phase_entry(name, seconds, target=target, started=started)
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UpgradeState":
+        return cls(**data)
+
+
+def _ensure_connected(client):
+    if client.conn is None:
+        client.connect()
+
+
+def _phase_preflight(client, state: UpgradeState):
+    _ensure_connected(client)
+
+    arch, current_version = get_info(client)
+    client.arch = arch
+    client.current_version = current_version
+
+    state.arch = arch
+    state.current_version = current_version
+
+    if not is_newer_version(current_version, state.target_version):
+        client.logger.info(
+            "Skipping upgrade: current version %s is >= target %s",
+            current_version,
+            state.target_version,
+        )
+        state.skipped = True
+        state.phase = PHASE_DONE
+        return
+
+    state.phase = PHASE_PROVIDE_FIRMWARE
+
+
+def _phase_provide_firmware(client, state: UpgradeState):
+    _ensure_connected(client)
+    client.arch = state.arch
+
+    stats = provide_firmware(client)
+    if stats is not None:
+        state.firmware_transfer = stats.as_dict()
+
+    state.phase = PHASE_REBOOT
+
+
+def _phase_reboot(client, state: UpgradeState):
+    _ensure_connected(client)
+
+    client.reboot()
+
+    state.reboot_at = time.time()
+    state.next_probe_at = 0.0
+    state.probe_delay = 0.0
+    state.phase = PHASE_AWAIT_ONLINE
+
+
+def _phase_await_online(client, state: UpgradeState):
+    """Single non-blocking probe; reschedules itself when not ready."""
+
+    if time.time() - state.reboot_at > client.reconnect_timeout:
+        raise TimeoutError(
+            f"Device did not reconnect within "
+            f"{client.reconnect_timeout} seconds."
+        )
+
+    stage = client.probe_reconnect()
+    state.last_probe = stage
+
+    if stage == PROBE_READY:
+        client.logger.info("Device fully online (SSH + CLI ready).")
+        client.observe(
+            "nauto_reconnect_wait_seconds",
+            time.time() - state.reboot_at,
+        )
+        state.phase = PHASE_VERIFY
+        return
+
+    state.probe_delay = next_delay(
+        stage,
+        state.probe_delay,
+        min_delay=min(1.0, client.reconnect_delay),
+        max_delay=client.reconnect_delay,
+    )
+    state.next_probe_at = time.time() + state.probe_delay
+
+
+def _phase_verify(client, state: UpgradeState):
+    _ensure_connected(client)
+
+    arch, final_version = get_info(client)
+    client.current_version = final_version
+    state.final_version = final_version
+
+    if normalize_version(final_version) != normalize_version(
+        state.target_version
+    ):
+        raise RuntimeError(
+            f"Upgrade version mismatch: expected "
+            f"{state.target_version}, got {final_version}"
+        )
+
+    client.logger.info("Upgrade completed successfully: %s", final_version)
+    state.phase = PHASE_DONE
+
+
+_PHASES = {
+    PHASE_PREFLIGHT: _phase_preflight,
+    PHASE_PROVIDE_FIRMWARE: _phase_provide_firmware,
+    PHASE_REBOOT: _phase_reboot,
+    PHASE_AWAIT_ONLINE: _phase_await_online,
+    PHASE_VERIFY: _phase_verify,
+}
+
+
+def start_upgrade(client) -> UpgradeState:
+    """Create the initial upgrade state for a client."""
 
     if not client.version:
         raise ValueError(
             "firmware_version is required for upgrade operation"
         )
 
+    return UpgradeState(
+        host=client.host,
+        target_version=client.version,
+        started_at=time.time(),
+    )
+
+
+def upgrade_step(client, state: UpgradeState) -> UpgradeState:
+    """
+    Advance the upgrade by one phase.
+
+    - connects on demand, never disconnects
+    - await_online performs one probe and returns (no sleeping)
+    - raises exceptions on failure
+    """
+
+    if state.finished:
+        return state
+
+    if state.phase not in _PHASES:
+        raise ValueError(f"Unknown upgrade phase: {state.phase}")
+
+    with client.span(state.phase):
+        _PHASES[state.phase](client, state)
+
+    if state.finished:
+        state.finished_at = time.time()
+        client.count(
+            "nauto_upgrades_total",
+            outcome="skipped" if state.skipped else "success",
+        )
+
+    return state
+
+
+def fail_upgrade(client, state: UpgradeState, exc: Exception) -> UpgradeState:
+    """Mark an upgrade state as failed by exc."""
+
+    state.failed_phase = state.phase
+    state.phase = PHASE_FAILED
+    state.error = str(exc)
+    state.finished_at = time.time()
+    client.count("nauto_upgrades_total", outcome="failed")
+    return state
+
+
+def upgrade_result(state: UpgradeState) -> OperationResult:
+    """Build the OperationResult describing an upgrade state."""
+
     result = OperationResult(
-        success=True,
+        success=state.phase != PHASE_FAILED,
         operation="upgrade",
         metadata={
-            "target_version": client.version,
+            "target_version": state.target_version,
         },
     )
 
-    result.mark_started()
+    if state.started_at is not None:
+        result.started_at = datetime.fromtimestamp(state.started_at, timezone.utc)
+    if state.finished_at is not None:
+        result.finished_at = datetime.fromtimestamp(state.finished_at, timezone.utc)
 
-    client.connect()
-    try:
-        arch, current_version = get_info(client)
-        client.arch = arch
-        client.current_version = current_version
-
-        result.metadata["current_version"] = current_version
-        result.metadata["arch"] = arch
-
-        if not is_newer_version(
-            client.current_version,
-            client.version,
-        ):
-            msg = (
-                f"Skipping upgrade: current version "
-                f"{client.current_version} is >= target {client.version}"
-            )
-            client.logger.info(msg)
+    _apply_state(result, state)
+    return result
 
-            result.message = msg
-            result.metadata["skipped"] = True
 
-            return result if return_result else None
+def _apply_state(result: OperationResult, state: UpgradeState):
+    """Copy upgrade state into result metadata and message."""
 
-        # ---- provide firmware (upload or download) ----
-        provide_firmware(client)
+    if state.current_version is not None:
+        result.metadata["current_version"] = state.current_version
+        result.metadata["arch"] = state.arch
 
-        # ---- reboot & reconnect ----
-        client.reboot()
-        client.conn = client.wait_for_reconnect()
+    if state.skipped:
+        result.metadata["skipped"] = True
+        result.message = (
+            f"Skipping upgrade: current version "
+            f"{state.current_version} is >= target {state.target_version}"
+        )
 
-        # ---- verify version ----
-        arch, final_version = get_info(client)
-        client.current_version = final_version
+    if state.firmware_transfer is not None:
+        result.metadata["firmware_transfer"] = state.firmware_transfer
 
-        result.metadata["final_version"] = final_version
+    if state.final_version is not None:
+        result.metadata["final_version"] = state.final_version
 
-        if normalize_version(final_version) != normalize_version(
-            client.version
-        ):
-            raise RuntimeError(
-                f"Upgrade version mismatch: expected "
-                f"{client.version}, got {final_version}"
-            )
+    for phase in state.phases:
+        result.phases.append(dict(phase))
+
+    if state.phase == PHASE_DONE and not state.skipped:
+        result.message = (
+            f"Upgrade completed successfully: {state.final_version}"
+        )
+
+    if state.phase == PHASE_FAILED:
+        result.metadata["failed_phase"] = state.failed_phase
+        result.errors.append(state.error)
+
+
+# -------------------------------------------------------
+# Upgrade workflow
+# -------------------------------------------------------
+
+def upgrade(client, *, return_result: bool = False):
+    """Run full firmware upgrade workflow."""
+
+    state = start_upgrade(client)
+
+    result = OperationResult(
+        success=True,
+        operation="upgrade",
+        metadata={
+            "target_version": client.version,
+        },
+    )
+
+    result.mark_started()
+    previous = client.attach_result(result)
+
+    client.connect()
+    try:
+        while not state.finished:
+            if state.waiting:
+                # Blocking mode: wait for the device in place
+                client.conn = client.wait_for_reconnect()
+                state.phase = PHASE_VERIFY
+                continue
 
-        msg = f"Upgrade completed successfully: {final_version}"
-        client.logger.info(msg)
-        result.message = msg
+            upgrade_step(client, state)
 
+        _apply_state(result, state)
         return result if return_result else None
 
     except Exception as exc:
+        _apply_state(result, state)
+        client.count("nauto_upgrades_total", outcome="failed")
         result.success = False
         result.errors.append(str(exc))
         raise
@@ -264,3 +543,4 @@ def upgrade(client, *, return_result: bool = False):
     finally:
         result.mark_finished()
         client.disconnect()
+        client.detach_result(previous)
@@ -1,46 +1,238 @@
 from pathlib import Path
 from network_automation.results import OperationResult
+from network_automation.spans import traced
+from network_automation.transfer import (
+    TransferStats,
+    file_checksum,
+    put_file,
+    remote_checksum,
+    remote_file_size,
+)
 
 
 # -------------------------------------------------------
 # Upload helper (low-level)
 # -------------------------------------------------------
 
+def resume_offset(client, sftp, path: Path, remote_path: str) -> int:
+    """
+    Return the offset to resume an upload from.
+
+    A partial remote file no larger than the local file is continued;
+    anything else is uploaded from byte zero.
+    """
+
+    remote_size = remote_file_size(sftp, remote_path)
+    local_size = path.stat().st_size
+
+    if not remote_size:
+        return 0
+
+    if remote_size > local_size:
+        client.logger.warning(
+            "Remote %s is larger than local file (%d > %d) — restarting upload",
+            remote_path,
+            remote_size,
+            local_size,
+        )
+        return 0
+
+    client.logger.info(
+        "Resuming upload of %s at offset %d/%d",
+        remote_path,
+        remote_size,
+        local_size,
+    )
+    return remote_size
+
+
+def remote_matches(
+    client,
+    sftp,
+    path: Path,
+    remote_path: str,
+    *,
+    checksum: bool = False,
+) -> bool:
+    """
+    Return True if remote_path already holds the same content as path.
+
+    Compares size, and SHA-256 when checksum is set.
+    """
+
+    if remote_file_size(sftp, remote_path) != path.stat().st_size:
+        return False
+
+    if not checksum:
+        return True
+
+    return file_checksum(path) == remote_checksum(
+        sftp,
+        remote_path,
+        block_size=client.sftp_block_size,
+        max_requests=client.sftp_max_requests,
+    )
+
+
+def verify_upload(client, sftp, path: Path, remote_path: str):
+    """
+    Verify remote file checksum against the local file.
+
+    Raises RuntimeError on mismatch.
+    """
+
+    local_digest = file_checksum(path)
+    remote_digest = remote_checksum(
+        sftp,
+        remote_path,
+        block_size=client.sftp_block_size,
+        max_requests=client.sftp_max_requests,
+    )
+
+    if local_digest != remote_digest:
+        raise RuntimeError(
+            f"Checksum mismatch after upload of {remote_path}"
+        )
+
+    client.logger.info("Checksum verified for %s", remote_path)
+
+
+def _upload_one(
+    client,
+    sftp,
+    path: Path,
+    remote_path: str,
+    stats: TransferStats,
+    *,
+    resume: bool,
+    verify_checksum: bool,
+    skip_existing: bool,
+):
+    """Upload one file, adding to stats; see upload_files()."""
+
+    if skip_existing and remote_matches(
+        client,
+        sftp,
+        path,
+        remote_path,
+        checksum=verify_checksum,
+    ):
+        client.logger.info(
+            "%s already present on device. Skipping upload.",
+            remote_path,
+        )
+        stats.skipped += 1
+        return
+
+    offset = resume_offset(client, sftp, path, remote_path) if resume else 0
+
+    _add_upload(
+        client,
+        stats,
+        put_file(
+            sftp,
+            path,
+            remote_path,
+            block_size=client.sftp_block_size,
+            offset=offset,
+        ),
+    )
+
+    # A resumed file is only correct if the remote prefix matched
+    if not (verify_checksum or offset):
+        return
+
+    try:
+        verify_upload(client, sftp, path, remote_path)
+
+    except RuntimeError:
+        if not offset:
+            raise
+
+        # The partial file did not match the local prefix
+        client.logger.warning(
+            "Resumed upload of %s is corrupt — uploading from scratch",
+            remote_path,
+        )
+        _add_upload(
+            client,
+            stats,
+            put_file(
+                sftp,
+                path,
+                remote_path,
+                block_size=client.sftp_block_size,
+            ),
+        )
+        verify_upload(client, sftp, path, remote_path)
+
+
+def _add_upload(client, stats: TransferStats, file_stats: TransferStats):
+    stats.add(file_stats)
+    client.count(
+        "nauto_transfer_bytes_total",
+        file_stats.bytes,
+        direction="upload",
+    )
+
+
+@traced("upload_files")
 def upload_files(
     client,
     *,
     files: list[Path],
     remote_dir: str = "/",
+    resume: bool = False,
+    verify_checksum: bool = False,
+    skip_existing: bool = False,
 ):
     """
     Upload local files to MikroTik via SFTP.
 
     - no connect/disconnect
     - raises exceptions on failure
+    - returns aggregated TransferStats
+
+    resume: continue partial remote files from their current size;
+            a resumed file is always checksum-verified
+    verify_checksum: compare SHA-256 of local and remote file
+
+    Without the SFTP check-file extension on the device, every
+    checksum reads the remote file back (see remote_checksum).
+    skip_existing: skip files already present with identical content
     """
 
-    sftp = client.conn.remote_conn_pre.open_sftp()
+    sftp = client.get_sftp()
+    stats = TransferStats()
 
-    try:
-        for path in files:
-            if not path.exists():
-                raise FileNotFoundError(path)
+    # New files change /file print output
+    client.invalidate_cache()
 
-            remote_path = f"{remote_dir.rstrip('/')}/{path.name}"
+    for path in files:
+        if not path.exists():
+            raise FileNotFoundError(path)
 
-            client.logger.info(
-                "Uploading %s → %s",
-                path,
-                remote_path,
-            )
+        remote_path = f"{remote_dir.rstrip('/')}/{path.name}"
 
-            sftp.put(
-                str(path),
+        client.logger.info(
+            "Uploading %s → %s",
+            path,
+            remote_path,
+        )
+
+        with client.span("transfer", remote_path):
+            _upload_one(
+                client,
+                sftp,
+                path,
                 remote_path,
+                stats,
+                resume=resume,
+                verify_checksum=verify_checksum,
+                skip_existing=skip_existing,
             )
 
-    finally:
-        sftp.close()
+    return stats
 
 
 # -------------------------------------------------------
@@ -52,6 +244,8 @@ def run_upload(
     *,
     files: list[str | Path],
     remote_dir: str = "/",
+    resume: bool = False,
+    verify_checksum: bool = False,
     return_result: bool = False,
 ):
     result = OperationResult(
@@ -64,18 +258,22 @@ def run_upload(
     )
 
     result.mark_started()
+    previous = client.attach_result(result)
 
     client.connect()
     try:
         paths = [Path(f) for f in files]
 
-        upload_files(
+        stats = upload_files(
             client,
             files=paths,
             remote_dir=remote_dir,
+            resume=resume,
+            verify_checksum=verify_checksum,
         )
 
         result.metadata["files"] = [p.name for p in paths]
+        result.metadata["transfer"] = stats.as_dict()
         result.message = "Files uploaded successfully"
 
         return result if return_result else None
@@ -101,3 +299,4 @@ def run_upload(
     finally:
         result.mark_finished()
         client.disconnect()
+        client.detach_result(previous)
@@ -0,0 +1,170 @@
+# network_automation/pool.py
+
+"""
+Process-wide pool of idle Netmiko connections.
+
+Clients opt in by passing pool=... to the factory. On connect() a live
+pooled connection is reused instead of performing a new SSH handshake;
+on disconnect() the connection is returned to the pool instead of closed.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class ConnectionPool:
+    """
+    Keyed pool of idle connections with size and idle-TTL eviction.
+
+    Keys are built by the client (host, port, username, auth method).
+    The pool only stores idle connections; a connection handed out by
+    acquire() belongs to the caller until release().
+    """
+
+    def __init__(self, *, max_size: int = 64, idle_ttl: float = 300.0):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+
+        # (key, id(conn)) -> (conn, released_at), oldest first
+        self._idle = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._idle)
+
+    # -------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------
+
+    def acquire(self, key):
+        """
+        Return a live idle connection for key, or None on a miss.
+        """
+        while True:
+            with self._lock:
+                expired = self._evict_expired()
+                conn = self._pop(key)
+
+                if conn is None:
+                    self.misses += 1
+
+            _close_all(expired)
+
+            if conn is None:
+                return None
+
+            # Liveness check runs outside the lock (network I/O)
+            if _is_alive(conn):
+                with self._lock:
+                    self.hits += 1
+                return conn
+
+            with self._lock:
+                self.evictions += 1
+            _close(conn)
+
+    def release(self, key, conn):
+        """Return a connection to the pool."""
+        with self._lock:
+            self._idle[(key, id(conn))] = (conn, time.monotonic())
+            evicted = self._evict_expired()
+
+            while len(self._idle) > self.max_size:
+                _, (old, _) = self._idle.popitem(last=False)
+                self.evictions += 1
+                evicted.append(old)
+
+        _close_all(evicted)
+
+    def close_all(self):
+        """Close and drop all idle connections."""
+        with self._lock:
+            conns = [conn for conn, _ in self._idle.values()]
+            self._idle.clear()
+
+        _close_all(conns)
+
+    def stats(self) -> dict:
+        """Return pool counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "idle": len(self._idle),
+            }
+
+    # -------------------------------------------------------
+    # Internals (lock held)
+    # -------------------------------------------------------
+
+    def _pop(self, key):
+        # Most recently released first: it is the most likely to be alive
+        for entry in reversed(self._idle):
+            if entry[0] == key:
+                conn, _ = self._idle.pop(entry)
+                return conn
+        return None
+
+    def _evict_expired(self):
+        """Drop and return connections idle for longer than idle_ttl."""
+        now = time.monotonic()
+        expired = [
+            entry
+            for entry, (_, released_at) in self._idle.items()
+            if now - released_at > self.idle_ttl
+        ]
+
+        conns = []
+        for entry in expired:
+            conn, _ = self._idle.pop(entry)
+            self.evictions += 1
+            conns.append(conn)
+
+        return conns
+
+
+def _is_alive(conn) -> bool:
+    try:
+        return bool(conn.is_alive())
+    except Exception:
+        return False
+
+
+def _close(conn):
+    try:
+        conn.disconnect()
+    except Exception:
+        pass
+
+
+def _close_all(conns):
+    for conn in conns:
+        _close(conn)
+
+
+# -------------------------------------------------------
+# Process-wide default pool
+# -------------------------------------------------------
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> ConnectionPool:
+    """Return the lazily created process-wide connection pool."""
+    global _default_pool
+
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ConnectionPool()
+        return _default_pool
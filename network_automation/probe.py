@@ -0,0 +1,68 @@
+# network_automation/probe.py
+
+"""
+Cheap reachability probes used before a full SSH login.
+"""
+
+import socket
+
+# Probe stages, in order of progress
+PROBE_DOWN = "down"      # TCP connect failed
+PROBE_TCP = "tcp"        # TCP port open, no SSH banner yet
+PROBE_SSH = "ssh"        # SSH banner received
+PROBE_READY = "ready"    # full login and CLI probe succeeded
+
+
+def probe_ssh(host: str, port: int = 22, timeout: float = 3.0) -> str:
+    """
+    Probe an SSH endpoint without authenticating.
+
+    Returns PROBE_DOWN, PROBE_TCP or PROBE_SSH.
+    """
+
+    try:
+        sock = socket.create_connection((host, port), timeout=timeout)
+    except OSError:
+        return PROBE_DOWN
+
+    try:
+        sock.settimeout(timeout)
+        banner = b""
+
+        while b"\n" not in banner and len(banner) < 256:
+            data = sock.recv(256)
+            if not data:
+                break
+            banner += data
+
+    except OSError:
+        return PROBE_TCP
+
+    finally:
+        sock.close()
+
+    if banner.startswith(b"SSH-"):
+        return PROBE_SSH
+
+    return PROBE_TCP
+
+
+def next_delay(
+    stage: str,
+    delay: float,
+    *,
+    min_delay: float,
+    max_delay: float,
+    factor: float = 2.0,
+) -> float:
+    """
+    Adaptive backoff between probes.
+
+    While the device is down the delay grows up to max_delay.
+    Once it answers on TCP (boot is progressing) probing is fast again.
+    """
+
+    if stage == PROBE_DOWN:
+        return min(max(delay * factor, min_delay), max_delay)
+
+    return min(min_delay, max_delay)
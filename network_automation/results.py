@@ -1,29 +1,39 @@
 # network_automation/results.py
 
-from dataclasses import dataclass, field
+import json
+from dataclasses import dataclass
 from typing import Any, Optional
 from datetime import datetime, timezone
 
+from network_automation.spans import Span, phase_entry, phase_totals
 
-@dataclass
+
+@dataclass(slots=True)
 class OperationResult:
     """
     Generic result object for all operations.
 
     Semantics of the operation are expressed via fields,
     not via subclassing.
+
+    warnings, errors, metadata and phases are created on first access
+    (see _lazy_containers), so results that never use them stay small.
     """
 
     success: bool
     operation: str | None = None
     message: Optional[str] = None
-    warnings: list[str] = field(default_factory=list)
-    errors: list[str] = field(default_factory=list)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    warnings: list[str] | None = None
+    errors: list[str] | None = None
+    metadata: dict[str, Any] | None = None
 
     started_at: datetime | None = None
     finished_at: datetime | None = None
 
+    # Timed phases of the operation, in completion order.
+    # Entries: {"name", "seconds", "started"[, "target"]}.
+    phases: list[dict] | None = None
+
     def mark_started(self):
         self.started_at = datetime.now(timezone.utc)
 
@@ -35,3 +45,165 @@ class OperationResult:
         if self.started_at and self.finished_at:
             return (self.finished_at - self.started_at).total_seconds()
         return None
+
+    # -------------------------------------------------------
+    # Phase breakdown
+    # -------------------------------------------------------
+
+    def add_phase(
+        self,
+        name: str,
+        seconds: float,
+        *,
+        target: str | None = None,
+        started: float | None = None,
+    ):
+        self.phases.append(
+            phase_entry(name, seconds, target=target, started=started)
+        )
+
+    def span(self, name: str, target: str | None = None) -> Span:
+        """Time a block and record it as a phase of this result."""
+        return Span(name, target, self)
+
+    def phase_totals(self) -> dict[str, float]:
+        """Total seconds per phase name."""
+        return phase_totals(_stored(self, "phases") or ())
+
+    # -------------------------------------------------------
+    # Export
+    # -------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return all fields as a plain dict (timestamps as ISO strings)."""
+        return {
+            "success": self.success,
+            "operation": self.operation,
+            "message": self.message,
+            "warnings": list(_stored(self, "warnings") or ()),
+            "errors": list(_stored(self, "errors") or ()),
+            "metadata": dict(_stored(self, "metadata") or {}),
+            "phases": list(_stored(self, "phases") or ()),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_seconds": self.duration_seconds,
+        }
+
+
+# -------------------------------------------------------
+# Lazy containers
+# -------------------------------------------------------
+
+# Field name -> slot descriptor holding the container (or None)
+_CONTAINER_SLOTS = {}
+
+
+def _lazy_containers(cls, factories: dict):
+    """
+    Wrap container slots of cls in properties that create on first read.
+
+    The slot keeps None until then. Dataclass machinery (__init__,
+    __eq__, asdict(), replace()) goes through the property like any
+    other attribute access.
+    """
+
+    for name, factory in factories.items():
+        slot = cls.__dict__[name]
+        _CONTAINER_SLOTS[name] = slot
+
+        def get(self, slot=slot, factory=factory):
+            value = slot.__get__(self, cls)
+            if value is None:
+                value = factory()
+                slot.__set__(self, value)
+            return value
+
+        setattr(cls, name, property(get, slot.__set__))
+
+
+def _stored(result, name: str):
+    """Return a container field of result without creating it."""
+    return _CONTAINER_SLOTS[name].__get__(result, OperationResult)
+
+
+_lazy_containers(
+    OperationResult,
+    {"warnings": list, "errors": list, "metadata": dict, "phases": list},
+)
+
+
+# -------------------------------------------------------
+# Bulk export
+# -------------------------------------------------------
+
+# Columns produced by to_columns()
+RESULT_COLUMNS = (
+    "host",
+    "operation",
+    "success",
+    "duration_seconds",
+    "started_at",
+    "errors",
+)
+
+
+def to_columns(results) -> dict[str, list]:
+    """
+    Turn results into a columnar table (column name -> list of values).
+
+    One row per result; "host" comes from metadata, "started_at" is an
+    epoch float (naive datetimes count as local time, as in
+    datetime.timestamp()) and "errors" is the joined error text (None if
+    none).
+    The dict can be passed directly to e.g. pandas.DataFrame.
+    """
+
+    columns = {name: [] for name in RESULT_COLUMNS}
+
+    host = columns["host"]
+    operation = columns["operation"]
+    success = columns["success"]
+    duration = columns["duration_seconds"]
+    started = columns["started_at"]
+    errors = columns["errors"]
+
+    for result in results:
+        host.append((_stored(result, "metadata") or {}).get("host"))
+        operation.append(result.operation)
+        success.append(result.success)
+        duration.append(result.duration_seconds)
+        started.append(result.started_at.timestamp() if result.started_at else None)
+        result_errors = _stored(result, "errors")
+        errors.append("; ".join(result_errors) if result_errors else None)
+
+    return columns
+
+
+def write_jsonl(results, f) -> int:
+    """
+    Write results as JSON Lines to a path or writable text file.
+
+    Returns the number of lines written. Values JSON cannot encode
+    (nested results, datetimes, paths) are converted, not dropped.
+    """
+
+    if isinstance(f, str) or hasattr(f, "__fspath__"):
+        with open(f, "w", encoding="utf-8") as out:
+            return write_jsonl(results, out)
+
+    count = 0
+    for result in results:
+        f.write(json.dumps(result.to_dict(), default=json_default))
+        f.write("\n")
+        count += 1
+
+    return count
+
+
+def json_default(value):
+    """json.dumps() default= handler for result metadata."""
+    if isinstance(value, OperationResult):
+        return value.to_dict()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
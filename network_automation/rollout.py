@@ -0,0 +1,193 @@
+# network_automation/rollout.py
+
+"""
+Staged (wave-based) fleet rollout.
+
+Drives a client operation (normally "upgrade") over a fleet in waves:
+a canary set first, then growing batches. The rollout halts when a
+wave's failure rate exceeds the configured threshold.
+"""
+
+import logging
+
+from network_automation.facts import FactsStore
+from network_automation.fleet import iter_fleet
+from network_automation.results import OperationResult
+from network_automation.versions import normalize_version
+
+logger = logging.getLogger(__name__)
+
+
+def filter_current(
+    devices,
+    facts: FactsStore,
+    *,
+    max_age: float = 86400.0,
+) -> tuple[list, list]:
+    """
+    Split devices by the facts store, without connecting.
+
+    Returns (pending, current): devices whose stored version is known
+    (seen within max_age seconds) and at or above their
+    "firmware_version" are current; all others are pending. A stored
+    version that cannot be parsed is logged and counts as pending.
+    """
+
+    known = facts.all(max_age=max_age)
+    pending = []
+    current = []
+
+    for params in devices:
+        fact = known.get(params.get("host"))
+        target = params.get("firmware_version")
+
+        if (
+            fact
+            and fact["version"]
+            and target
+            and _at_least(fact["version"], target)
+        ):
+            current.append(params)
+        else:
+            pending.append(params)
+
+    return pending, current
+
+
+def _at_least(version: str, target: str) -> bool:
+    try:
+        return normalize_version(version) >= normalize_version(target)
+    except ValueError as exc:
+        logger.warning("Cannot compare versions (%s); treating as pending", exc)
+        return False
+
+
+def plan_waves(
+    devices,
+    *,
+    canary: int = 1,
+    growth: float = 2.0,
+    max_wave_size: int | None = None,
+) -> list[list]:
+    """
+    Split devices into waves.
+
+    The first wave holds `canary` devices; every following wave is
+    `growth` times larger than the previous one, capped at max_wave_size.
+    With growth > 1 each wave grows by at least one device; growth == 1
+    keeps every wave at the canary size.
+    """
+
+    if canary < 1:
+        raise ValueError("canary must be >= 1")
+    if growth < 1:
+        raise ValueError("growth must be >= 1")
+
+    devices = list(devices)
+    waves = []
+    size = canary
+    start = 0
+
+    while start < len(devices):
+        if max_wave_size:
+            size = min(size, max_wave_size)
+
+        waves.append(devices[start:start + size])
+        start += size
+        if growth > 1:
+            size = max(size + 1, int(size * growth))
+
+    return waves
+
+
+def run_rollout(
+    devices,
+    operation: str = "upgrade",
+    *args,
+    canary: int = 1,
+    growth: float = 2.0,
+    max_wave_size: int | None = None,
+    max_parallel: int = 10,
+    max_failure_rate: float = 0.0,
+    **kwargs,
+) -> list[OperationResult]:
+    """
+    Run a staged rollout and return one aggregate result per wave.
+
+    - devices: iterable of get_client() parameter dicts
+    - max_parallel: cap on devices processed (e.g. rebooting) at once
+    - max_failure_rate: halt when a wave's failure rate exceeds this
+
+    Waves after a failed wave are not started.
+    """
+
+    waves = plan_waves(
+        devices,
+        canary=canary,
+        growth=growth,
+        max_wave_size=max_wave_size,
+    )
+
+    total = sum(len(wave) for wave in waves)
+    processed = 0
+    wave_results = []
+
+    for index, wave in enumerate(waves, start=1):
+        wave_result = OperationResult(
+            success=True,
+            operation=f"{operation}_wave",
+            metadata={
+                "wave": index,
+                "devices": len(wave),
+            },
+        )
+
+        wave_result.mark_started()
+
+        results = list(
+            iter_fleet(
+                wave,
+                operation,
+                *args,
+                max_workers=min(max_parallel, len(wave)),
+                **kwargs,
+            )
+        )
+
+        wave_result.mark_finished()
+
+        failed = [r for r in results if not r.success]
+        failure_rate = len(failed) / len(results)
+        processed += len(wave)
+
+        wave_result.metadata.update(
+            {
+                "succeeded": len(results) - len(failed),
+                "failed": len(failed),
+                "failure_rate": failure_rate,
+                "results": results,
+            }
+        )
+
+        for r in failed:
+            for error in r.errors:
+                wave_result.errors.append(f"{r.metadata.get('host')}: {error}")
+
+        wave_results.append(wave_result)
+
+        if failure_rate > max_failure_rate:
+            wave_result.success = False
+            wave_result.metadata["halted"] = True
+            wave_result.metadata["remaining"] = total - processed
+            wave_result.message = (
+                f"Rollout halted after wave {index}: failure rate "
+                f"{failure_rate:.0%} exceeds {max_failure_rate:.0%}"
+            )
+            break
+
+        wave_result.message = (
+            f"Wave {index} completed: "
+            f"{len(results) - len(failed)}/{len(results)} succeeded"
+        )
+
+    return wave_results
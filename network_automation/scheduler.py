@@ -0,0 +1,195 @@
+# network_automation/scheduler.py
+
+"""
+Upgrade scheduler.
+
+Runs many upgrades with a small worker pool by driving the per-device
+upgrade state machine. Devices waiting to come back after a reboot are
+parked (no thread held) and probed again when their backoff expires.
+"""
+
+import heapq
+import itertools
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+
+from network_automation.factory import get_client
+from network_automation.results import OperationResult
+
+# Upper bound on how long the scheduler sleeps between checks
+_MAX_IDLE = 1.0
+
+
+def _notify(client, state, on_state):
+    """Call on_state; a failing callback is logged, never raised."""
+
+    if on_state is None:
+        return
+
+    try:
+        on_state(state)
+    except Exception as exc:
+        client.logger.error("on_state callback failed: %s", exc)
+
+
+def _advance(client, state, on_state):
+    """
+    Run upgrade phases until the state is finished or parked.
+
+    Never raises: failures are recorded in the state.
+    """
+
+    # Spans of the phases go to the state (copied into the result)
+    previous = client.attach_result(state)
+
+    try:
+        while not state.finished:
+            client.upgrade_step(state)
+            _notify(client, state, on_state)
+
+            if state.waiting and state.next_probe_at > time.time():
+                break
+
+    except Exception as exc:
+        client.fail_upgrade(state, exc)
+        client.logger.error("Upgrade failed: %s", exc)
+        _notify(client, state, on_state)
+
+    finally:
+        client.detach_result(previous)
+
+        if state.finished:
+            client.disconnect()
+
+    return client, state
+
+
+def _start(params: dict, states: dict):
+    """
+    Build the client and upgrade state of one device.
+
+    Returns (client, state), or a failed OperationResult.
+    """
+
+    params = dict(params)
+    host = params.get("host")
+    started_at = datetime.now(timezone.utc)
+
+    try:
+        client = get_client(**params)
+
+        if host in states:
+            state = client.resume_upgrade(states[host])
+        else:
+            state = client.start_upgrade()
+
+    except Exception as exc:
+        result = OperationResult(
+            success=False,
+            operation="upgrade",
+            started_at=started_at,
+        )
+        result.errors.append(str(exc))
+        result.mark_finished()
+        result.metadata["host"] = host
+        return result
+
+    return client, state
+
+
+def iter_upgrades(
+    devices,
+    *,
+    max_workers: int = 8,
+    states: dict | None = None,
+    on_state=None,
+):
+    """
+    Upgrade many devices, yielding one OperationResult per device.
+
+    - devices: iterable of get_client() parameter dicts
+    - max_workers: threads doing actual work (connect, transfer, probe)
+    - states: optional host -> UpgradeState.to_dict() to resume from
+    - on_state: optional callback invoked after every phase, e.g. to
+      persist state.to_dict()
+
+    Results are yielded in completion order. At most max_workers * 2
+    devices (ready, running or parked) are held at a time, so large or
+    lazily generated fleets are never fully materialized.
+    """
+
+    states = states or {}
+    devices = iter(devices)
+    window = max_workers * 2
+    exhausted = False
+
+    ready = deque()
+    parked = []
+    sequence = itertools.count()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        running = set()
+
+        while True:
+            # ---- admit devices while the window has room ----
+            while not exhausted and len(ready) + len(running) + len(parked) < window:
+                params = next(devices, None)
+                if params is None:
+                    exhausted = True
+                    break
+
+                started = _start(params, states)
+                if isinstance(started, OperationResult):
+                    yield started
+                else:
+                    ready.append(started)
+
+            if not (ready or parked or running):
+                break
+
+            now = time.time()
+
+            # ---- wake parked devices whose probe is due ----
+            while parked and parked[0][0] <= now:
+                _, _, client, state = heapq.heappop(parked)
+                ready.append((client, state))
+
+            # ---- fill free workers ----
+            while ready and len(running) < max_workers:
+                client, state = ready.popleft()
+                running.add(pool.submit(_advance, client, state, on_state))
+
+            # ---- wait for work or the next due probe ----
+            timeout = _MAX_IDLE
+            if parked:
+                timeout = min(timeout, max(parked[0][0] - time.time(), 0))
+
+            if not running:
+                time.sleep(timeout)
+                continue
+
+            done, running = wait(
+                running,
+                timeout=timeout,
+                return_when=FIRST_COMPLETED,
+            )
+
+            for future in done:
+                client, state = future.result()
+
+                if state.finished:
+                    result = client.upgrade_result(state)
+                    result.metadata["host"] = state.host
+                    yield result
+                else:
+                    heapq.heappush(
+                        parked,
+                        (state.next_probe_at, next(sequence), client, state),
+                    )
+
+
+def run_upgrades(devices, **kwargs) -> list[OperationResult]:
+    """Upgrade many devices; see iter_upgrades()."""
+    return list(iter_upgrades(devices, **kwargs))
@@ -0,0 +1,247 @@
+# network_automation/sinks.py
+
+"""
+Streaming result sinks.
+
+A sink persists OperationResults as devices finish. put() only enqueues
+the result; a background thread writes batches to disk, so workers
+never block on I/O and nothing has to be kept until the end of a run.
+"""
+
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from network_automation.results import OperationResult, json_default, write_jsonl
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the queue for the writer thread
+_CLOSE = object()
+
+
+class ResultSink(ABC):
+    """
+    Base class: queue + background writer thread.
+
+    A batch is written once it holds batch_size results or once
+    flush_interval seconds have passed since the last write, whichever
+    comes first. After a write error nothing more is written; the error
+    is raised from put() and close().
+
+    Subclasses implement _write_batch(results) and optionally _open()
+    and _close(); all three run on the writer thread.
+    """
+
+    def __init__(self, *, batch_size: int = 500, flush_interval: float = 1.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.written = 0
+        self.dropped = 0
+        self.error: Exception | None = None
+
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"{type(self).__name__}-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def put(self, result: OperationResult):
+        """
+        Enqueue a result for writing. Never blocks.
+
+        Raises the write error if an earlier batch failed.
+        """
+        if self._closed:
+            raise RuntimeError("Sink is closed")
+        if self.error is not None:
+            raise self.error
+        self._queue.put(result)
+
+    def close(self):
+        """
+        Flush pending results and stop the writer thread.
+
+        Raises the first write error, if any occurred.
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_CLOSE)
+            self._thread.join()
+
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # -------------------------------------------------------
+    # Writer thread
+    # -------------------------------------------------------
+
+    def _run(self):
+        try:
+            self._open()
+        except Exception as exc:
+            self.error = exc
+            logger.error("Result sink failed to open: %s", exc)
+
+        batch = []
+        closing = False
+        last_flush = time.monotonic()
+
+        while not closing:
+            timeout = max(0.0, last_flush + self.flush_interval - time.monotonic())
+
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _CLOSE:
+                closing = True
+            elif item is not None:
+                batch.append(item)
+
+            now = time.monotonic()
+
+            if not batch:
+                # Idle: the interval counts from the next result
+                last_flush = now
+                continue
+
+            if (
+                closing
+                or len(batch) >= self.batch_size
+                or now - last_flush >= self.flush_interval
+            ):
+                self._flush(batch)
+                batch = []
+                last_flush = now
+
+        try:
+            self._close()
+        except Exception as exc:
+            self.error = self.error or exc
+
+    def _flush(self, batch: list[OperationResult]):
+        if self.error is not None:
+            self.dropped += len(batch)
+            return
+
+        try:
+            self._write_batch(batch)
+            self.written += len(batch)
+        except Exception as exc:
+            self.error = exc
+            self.dropped += len(batch)
+            logger.error("Result sink write failed: %s", exc)
+
+    def _open(self):
+        pass
+
+    @abstractmethod
+    def _write_batch(self, results: list[OperationResult]):
+        """Persist one batch of results."""
+
+    def _close(self):
+        pass
+
+
+class JsonlSink(ResultSink):
+    """Append results as JSON Lines to a file."""
+
+    def __init__(self, path: str, **kwargs):
+        self.path = path
+        self._file = None
+        super().__init__(**kwargs)
+
+    def _open(self):
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _write_batch(self, results):
+        write_jsonl(results, self._file)
+        self._file.flush()
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    host TEXT,
+    operation TEXT,
+    success INTEGER NOT NULL,
+    message TEXT,
+    errors TEXT,
+    started_at TEXT,
+    finished_at TEXT,
+    duration_seconds REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_host ON results (host);
+"""
+
+
+class SqliteSink(ResultSink):
+    """
+    Insert results into an SQLite table.
+
+    Summary fields get their own columns (host is indexed); the full
+    result is kept as JSON in the "data" column. One transaction per
+    batch.
+    """
+
+    def __init__(self, path: str, **kwargs):
+        self.path = path
+        self._db = None
+        super().__init__(**kwargs)
+
+    def _open(self):
+        # Created on the writer thread, which is the only user
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(_SQLITE_SCHEMA)
+
+    def _write_batch(self, results):
+        rows = []
+        for result in results:
+            data = result.to_dict()
+            rows.append(
+                (
+                    data["metadata"].get("host"),
+                    result.operation,
+                    int(result.success),
+                    result.message,
+                    json.dumps(data["errors"]) if data["errors"] else None,
+                    data["started_at"],
+                    data["finished_at"],
+                    data["duration_seconds"],
+                    json.dumps(data, default=json_default),
+                )
+            )
+
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO results (host, operation, success, message, "
+                "errors, started_at, finished_at, duration_seconds, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def _close(self):
+        if self._db is not None:
+            self._db.close()
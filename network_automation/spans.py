@@ -0,0 +1,122 @@
+# network_automation/spans.py
+
+"""
+Timing spans.
+
+A span measures one phase of a workflow (connect, a command, a file
+transfer, reboot, reconnect wait, ...) and reports its duration to a
+recorder: any object with add_phase() such as OperationResult. It is
+also reported to the tracer and the metrics registry of the execution
+context, if any.
+
+When nothing records, traces or counts, BaseClient.span() returns NULL_SPAN,
+a shared no-op context manager, so instrumented hot paths cost two
+attribute checks.
+"""
+
+import functools
+import time
+from contextlib import nullcontext
+
+# Shared no-op span
+NULL_SPAN = nullcontext()
+
+
+class Span:
+    """Context manager timing one phase."""
+
+    __slots__ = (
+        "name",
+        "target",
+        "recorder",
+        "tracer",
+        "attributes",
+        "metrics",
+        "started",
+        "_t0",
+        "_handle",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        target: str | None,
+        recorder,
+        tracer=None,
+        attributes: dict | None = None,
+        metrics=None,
+    ):
+        self.name = name
+        self.target = target
+        self.recorder = recorder
+        self.tracer = tracer
+        self.attributes = attributes
+        self.metrics = metrics
+
+    def __enter__(self):
+        if self.tracer is not None:
+            attributes = self.attributes or {}
+            if self.target is not None:
+                attributes["target"] = self.target
+            self._handle = self.tracer.start_span(self.name, attributes)
+
+        self.started = time.time()
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self._t0
+
+        if self.recorder is not None:
+            self.recorder.add_phase(
+                self.name,
+                seconds,
+                target=self.target,
+                started=self.started,
+            )
+
+        if self.metrics is not None:
+            self.metrics.observe_phase(self.name, seconds)
+
+        if self.tracer is not None:
+            self.tracer.end_span(self._handle, exc)
+
+        return False
+
+
+def traced(name: str):
+    """
+    Decorator: run a helper taking `client` first inside client.span(name).
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(client, *args, **kwargs):
+            with client.span(name):
+                return func(client, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def phase_entry(
+    name: str,
+    seconds: float,
+    *,
+    target: str | None = None,
+    started: float | None = None,
+) -> dict:
+    """Build one phase breakdown entry."""
+    entry = {"name": name, "seconds": seconds, "started": started}
+    if target is not None:
+        entry["target"] = target
+    return entry
+
+
+def phase_totals(phases) -> dict[str, float]:
+    """Sum phase durations by name (nested phases overlap)."""
+    totals = {}
+    for phase in phases:
+        totals[phase["name"]] = totals.get(phase["name"], 0.0) + phase["seconds"]
+    return totals
@@ -1,5 +1,8 @@
 # network_automation/tests/mikrotik_routeros/conftest.py
 
+import io
+from types import SimpleNamespace
+
 import pytest
 from network_automation.platforms.mikrotik_routeros.client import MikrotikRouterOS
 
@@ -17,3 +20,99 @@ def mikrotik_client():
         reconnect_timeout=1,
         reconnect_delay=0,
     )
+
+
+# -------------------------------------------------------
+# In-memory SFTP stack
+# -------------------------------------------------------
+
+class FakeSFTPFile(io.BytesIO):
+    def __init__(self, sftp, path, mode):
+        super().__init__(b"" if "w" in mode else sftp.files[path])
+        self._sftp = sftp
+        self._path = path
+        self._mode = mode
+        if "a" in mode:
+            self.seek(0, io.SEEK_END)
+
+    def set_pipelined(self, pipelined=True):
+        pass
+
+    def prefetch(self, file_size=None, max_concurrent_requests=None):
+        self._sftp.prefetches.append(max_concurrent_requests)
+
+    def check(self, hash_algorithm, offset=0, length=0, block_size=0):
+        # RouterOS does not implement the "check-file" extension
+        raise IOError("Operation unsupported")
+
+    def close(self):
+        if not self.closed and ("w" in self._mode or "+" in self._mode or "a" in self._mode):
+            self._sftp.files[self._path] = self.getvalue()
+        super().close()
+
+
+class FakeSFTP:
+    def __init__(self, files=None):
+        self.files = dict(files or {})
+        self.mtimes = {}
+        self.opened = []
+        self.prefetches = []
+        self.closed = False
+
+    def open(self, path, mode="r", bufsize=-1):
+        if "w" not in mode and path not in self.files:
+            raise FileNotFoundError(path)
+        self.opened.append((path, mode))
+        return FakeSFTPFile(self, path, mode)
+
+    def stat(self, path):
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        return SimpleNamespace(
+            st_size=len(self.files[path]),
+            st_mtime=self.mtimes.get(path, 0),
+        )
+
+    def close(self):
+        self.closed = True
+
+
+class FakeRemoteConnPre:
+    def __init__(self, sftp):
+        self._sftp = sftp
+
+    def open_sftp(self):
+        return self._sftp
+
+
+class FakeConn:
+    RETURN = "\r\n"
+
+    def __init__(self, sftp):
+        self.remote_conn_pre = FakeRemoteConnPre(sftp)
+
+        # command -> output served over the raw channel (streaming)
+        self.stream_outputs = {}
+        self._channel = ""
+
+    def send_command(self, *args, **kwargs):
+        return ""
+
+    def write_channel(self, data):
+        command = data.strip()
+        output = self.stream_outputs.get(command, "")
+        self._channel += f"[admin@R1] > {command}\r\n{output}\r\n[admin@R1] > "
+
+    def read_channel(self):
+        data, self._channel = self._channel, ""
+        return data
+
+
+@pytest.fixture
+def fake_sftp():
+    return FakeSFTP()
+
+
+@pytest.fixture
+def sftp_conn(fake_sftp):
+    return FakeConn(fake_sftp)
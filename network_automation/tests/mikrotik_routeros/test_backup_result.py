@@ -1,42 +1,24 @@
 # network_automation/tests/mikrotik_routeros/test_backup_result.py
 
-from network_automation.results import OperationResult
-
-class FakeSFTP:
-    def __init__(self):
-        self.downloads = []
-
-    def get(self, remote, local):
-        self.downloads.append((remote, local))
-
-    def close(self):
-        pass
-
-
-class FakeRemoteConnPre:
-    def __init__(self, sftp):
-        self._sftp = sftp
-
-    def open_sftp(self):
-        return self._sftp
+import gzip
+import sys
+from unittest.mock import MagicMock
 
+import pytest
 
-class FakeConn:
-    def __init__(self, sftp):
-        self.remote_conn_pre = FakeRemoteConnPre(sftp)
-
-    def send_command(self, *args, **kwargs):
-        return ""
+from network_automation.backup_store import BackupStore
+from network_automation.platforms.mikrotik_routeros.backup import open_export
+from network_automation.results import OperationResult
 
 
-def test_backup_returns_result_and_downloads(monkeypatch, mikrotik_client, tmp_path):
+def test_backup_returns_result_and_downloads(monkeypatch, mikrotik_client, tmp_path, fake_sftp, sftp_conn):
     # ---- lifecycle mocks ----
     monkeypatch.setattr(mikrotik_client, "connect", lambda: None)
     monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
 
     # ---- fake SFTP stack ----
-    fake_sftp = FakeSFTP()
-    mikrotik_client.conn = FakeConn(fake_sftp)
+    fake_sftp.files["nauto_test-backup.backup"] = b"backup-data"
+    mikrotik_client.conn = sftp_conn
 
     # ---- run backup ----
     result = mikrotik_client.backup(
@@ -53,8 +35,127 @@ def test_backup_returns_result_and_downloads(monkeypatch, mikrotik_client, tmp_p
     # ---- metadata ----
     assert result.metadata["remote_file"] == "test-backup.backup"
     assert result.metadata["local_path"].endswith("test-backup.backup")
+    assert result.metadata["transfer"]["bytes"] == len(b"backup-data")
 
     # ---- SFTP interaction ----
-    assert fake_sftp.downloads == [
-        ("nauto_test-backup.backup", f"{tmp_path}/test-backup.backup")
+    assert (tmp_path / "test-backup.backup").read_bytes() == b"backup-data"
+
+
+def test_backup_with_compressed_export(monkeypatch, mikrotik_client, tmp_path, fake_sftp, sftp_conn):
+    monkeypatch.setattr(mikrotik_client, "connect", lambda: None)
+    monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
+
+    fake_sftp.files["nauto_nightly.backup"] = b"backup-data"
+    sftp_conn.stream_outputs["/export"] = "/ip address\r\nadd address=10.0.0.1/24 interface=ether1"
+    mikrotik_client.conn = sftp_conn
+
+    result = mikrotik_client.backup(
+        "nightly",
+        return_result=True,
+        download_dir=str(tmp_path),
+        export=True,
+    )
+
+    export = result.metadata["export"]
+    assert export["path"] == f"{tmp_path}/nightly.rsc.gz"
+    assert export["compression"] == "gzip"
+    assert export["lines"] == 2
+
+    with gzip.open(export["path"], "rt") as f:
+        assert f.read() == "/ip address\nadd address=10.0.0.1/24 interface=ether1\n"
+
+    assert (tmp_path / "nightly.backup").read_bytes() == b"backup-data"
+
+
+def test_open_export_rejects_unknown_compression(tmp_path):
+    with pytest.raises(ValueError):
+        with open_export(str(tmp_path / "x.rsc"), "bz2"):
+            pass
+
+
+def test_backup_rejects_unknown_compression_before_device_work(mikrotik_client, tmp_path):
+    mikrotik_client.connect = MagicMock()
+
+    with pytest.raises(ValueError, match="bz2"):
+        mikrotik_client.backup(
+            "nightly",
+            download_dir=str(tmp_path),
+            export=True,
+            export_compression="bz2",
+        )
+
+    mikrotik_client.connect.assert_not_called()
+
+
+def test_backup_checks_zstandard_before_device_work(monkeypatch, mikrotik_client, tmp_path):
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    mikrotik_client.connect = MagicMock()
+
+    with pytest.raises(RuntimeError, match="zstandard"):
+        mikrotik_client.backup(
+            "nightly",
+            download_dir=str(tmp_path),
+            export=True,
+            export_compression="zstd",
+        )
+
+    mikrotik_client.connect.assert_not_called()
+
+
+def test_incremental_backup_requires_export_and_store(mikrotik_client, tmp_path):
+    mikrotik_client.connect = MagicMock()
+
+    with pytest.raises(ValueError, match="incremental"):
+        mikrotik_client.backup("nightly", export=True, incremental=True)
+
+    mikrotik_client.connect.assert_not_called()
+
+
+def test_backup_into_store_deduplicates(monkeypatch, mikrotik_client, tmp_path, fake_sftp, sftp_conn):
+    monkeypatch.setattr(mikrotik_client, "connect", lambda: None)
+    monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
+
+    fake_sftp.files["nauto_nightly.backup"] = b"backup-data"
+    sftp_conn.stream_outputs["/export"] = "# 2025-12-26 20:00:00 by RouterOS 7.14\r\n/system identity"
+    mikrotik_client.conn = sftp_conn
+
+    store = BackupStore(tmp_path / "repo")
+
+    results = [
+        mikrotik_client.backup("nightly", return_result=True, export=True, store=store)
+        for _ in range(2)
     ]
+
+    assert [r.metadata["store"]["backup"]["stored"] for r in results] == [True, False]
+    assert [r.metadata["store"]["export"]["stored"] for r in results] == [True, False]
+    assert results[1].metadata["local_path"] == results[0].metadata["local_path"]
+    assert len(store.history("1.1.1.1")) == 4
+
+    with gzip.open(results[0].metadata["export"]["path"], "rt") as f:
+        assert f.read() == "/system identity\n"
+
+
+def test_backup_into_store_removes_temp_file_on_failure(monkeypatch, mikrotik_client, tmp_path, fake_sftp, sftp_conn):
+    monkeypatch.setattr(mikrotik_client, "connect", lambda: None)
+    monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
+
+    fake_sftp.files["nauto_nightly.backup"] = b"backup-data"
+    mikrotik_client.conn = sftp_conn
+
+    def broken_export(client, path, compression):
+        with open(path, "w") as f:
+            f.write("partial")
+        raise TimeoutError("export stalled")
+
+    monkeypatch.setattr(
+        "network_automation.platforms.mikrotik_routeros.backup.export_config",
+        broken_export,
+    )
+
+    store = BackupStore(tmp_path / "repo")
+
+    with pytest.raises(TimeoutError):
+        mikrotik_client.backup("nightly", export=True, store=store)
+
+    assert list((tmp_path / "repo" / "tmp").iterdir()) == []
+    assert [e["kind"] for e in store.history("1.1.1.1")] == ["backup"]
@@ -0,0 +1,65 @@
+# network_automation/tests/mikrotik_routeros/test_command_cache.py
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from network_automation.platforms.mikrotik_routeros.client import MikrotikRouterOS
+from network_automation.platforms.mikrotik_routeros.run import read_only_command
+
+
+@pytest.fixture
+def cached_client(monkeypatch):
+    client = MikrotikRouterOS(
+        host="1.1.1.1",
+        username="admin",
+        command_cache_ttl=60,
+    )
+    monkeypatch.setattr(client, "connect", lambda: None)
+    monkeypatch.setattr(client, "disconnect", lambda: None)
+
+    client.conn = MagicMock()
+    client.conn.send_command.side_effect = lambda cmd, **kw: f"out:{cmd}"
+    return client
+
+
+def test_read_only_command():
+    assert read_only_command("/system resource print")
+    assert read_only_command("/file print detail where name~\"x\"")
+    assert read_only_command("/export compact")
+    assert read_only_command("/ip/address/export")
+    assert not read_only_command("/export file=cfg")
+    assert not read_only_command("/system script run do-export")
+    assert not read_only_command("/system script run reexport")
+    assert not read_only_command("/file remove \"x\"")
+    assert not read_only_command("/system backup save name=x")
+
+
+def test_read_only_commands_are_cached(cached_client):
+    cached_client.run("/system resource print")
+    cached_client.run(["/system resource print", "/system resource print"])
+
+    assert cached_client.conn.send_command.call_count == 1
+    assert cached_client.command_cache.hits == 2
+
+
+def test_mutating_command_invalidates(cached_client):
+    cached_client.run("/file print")
+    cached_client.run('/file remove "nauto_old.backup"')
+    cached_client.run("/file print")
+
+    assert cached_client.conn.send_command.call_count == 3
+
+
+def test_reboot_invalidates(cached_client):
+    conn = cached_client.conn
+    conn.send_command_timing.return_value = "Reboot, yes? [y/N]:"
+
+    cached_client.run("/system resource print")
+    cached_client.reboot()
+
+    assert cached_client.command_cache.stats()["entries"] == 0
+
+
+def test_cache_disabled_by_default(mikrotik_client):
+    assert mikrotik_client.command_cache is None
@@ -1,42 +1,17 @@
 # network_automation/tests/mikrotik_routeros/test_uload.py
 
 from pathlib import Path
+from network_automation.context import ExecutionContext
+from network_automation.metrics import MetricsRegistry
+from network_automation.platforms.mikrotik_routeros.client import MikrotikRouterOS
 from network_automation.results import OperationResult
 
 
-# -------------------------------------------------------
-# Fake SFTP stack
-# -------------------------------------------------------
-
-class FakeSFTP:
-    def __init__(self):
-        self.downloads = []
-
-    def get(self, remote, local):
-        self.downloads.append((remote, local))
-
-    def close(self):
-        pass
-
-
-class FakeRemoteConnPre:
-    def __init__(self, sftp):
-        self._sftp = sftp
-
-    def open_sftp(self):
-        return self._sftp
-
-
-class FakeConn:
-    def __init__(self, sftp):
-        self.remote_conn_pre = FakeRemoteConnPre(sftp)
-
-
 # -------------------------------------------------------
 # Tests
 # -------------------------------------------------------
 
-def test_download_files_success(monkeypatch, mikrotik_client, tmp_path):
+def test_download_files_success(monkeypatch, mikrotik_client, tmp_path, fake_sftp, sftp_conn):
     """
     Download single file via SFTP.
     """
@@ -46,8 +21,8 @@ def test_download_files_success(monkeypatch, mikrotik_client, tmp_path):
     monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
 
     # ---- fake SFTP ----
-    fake_sftp = FakeSFTP()
-    mikrotik_client.conn = FakeConn(fake_sftp)
+    fake_sftp.files["test.txt"] = b"payload"
+    mikrotik_client.conn = sftp_conn
 
     # ---- run download ----
     result = mikrotik_client.download(
@@ -64,9 +39,67 @@ def test_download_files_success(monkeypatch, mikrotik_client, tmp_path):
     # ---- metadata ----
     assert result.metadata["files"] == ["test.txt"]
     assert result.metadata["local_dir"] == str(tmp_path)
+    assert result.metadata["transfer"]["bytes"] == 7
 
     # ---- SFTP interaction ----
-    expected_local = str(tmp_path / "test.txt")
-    assert fake_sftp.downloads == [
-        ("test.txt", expected_local)
-    ]
+    assert (tmp_path / "test.txt").read_bytes() == b"payload"
+    assert fake_sftp.prefetches == [mikrotik_client.sftp_max_requests]
+
+
+def test_incremental_download_skips_unchanged(monkeypatch, mikrotik_client, tmp_path, fake_sftp, sftp_conn):
+    monkeypatch.setattr(mikrotik_client, "connect", lambda: None)
+    monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
+
+    fake_sftp.files["a.txt"] = b"aaaa"
+    fake_sftp.files["b.txt"] = b"bbbb"
+    fake_sftp.mtimes["b.txt"] = 1000
+    mikrotik_client.conn = sftp_conn
+
+    def download():
+        return mikrotik_client.download(
+            files=["a.txt", "b.txt"],
+            local_dir=str(tmp_path),
+            incremental=True,
+            return_result=True,
+        )
+
+    first = download()
+    assert first.metadata["transfer"]["files"] == 2
+    assert first.metadata["skipped"] is False
+
+    second = download()
+    assert second.metadata["transfer"]["files"] == 0
+    assert second.metadata["transfer"]["skipped"] == 2
+    assert second.metadata["skipped"] is True
+
+    # Same size, newer mtime: downloaded again
+    fake_sftp.files["b.txt"] = b"BBBB"
+    fake_sftp.mtimes["b.txt"] = 2000
+
+    third = download()
+    assert third.metadata["transfer"]["files"] == 1
+    assert third.metadata["transfer"]["skipped"] == 1
+    assert (tmp_path / "b.txt").read_bytes() == b"BBBB"
+
+    # Local copy removed: downloaded again
+    (tmp_path / "a.txt").unlink()
+    assert download().metadata["transfer"]["files"] == 1
+
+
+def test_download_counts_bytes(monkeypatch, tmp_path, fake_sftp, sftp_conn):
+    metrics = MetricsRegistry()
+    client = MikrotikRouterOS(
+        host="1.1.1.1",
+        username="admin",
+        context=ExecutionContext(metrics=metrics),
+    )
+    monkeypatch.setattr(client, "connect", lambda: None)
+    monkeypatch.setattr(client, "disconnect", lambda: None)
+
+    fake_sftp.files["test.txt"] = b"payload"
+    client.conn = sftp_conn
+
+    client.download(files=["test.txt"], local_dir=str(tmp_path))
+
+    assert metrics.get("nauto_transfer_bytes_total").value(direction="download") == 7
+    assert metrics.get("nauto_transfer_seconds").count() == 1
@@ -0,0 +1,116 @@
+# network_automation/tests/mikrotik_routeros/test_parser.py
+
+from unittest.mock import MagicMock
+
+from network_automation.platforms.mikrotik_routeros.backup import cleanup_old_backups
+from network_automation.platforms.mikrotik_routeros.parser import (
+    parse_as_value,
+    parse_detail,
+    parse_print,
+    parse_properties,
+    parse_size,
+    parse_table,
+)
+
+
+FILE_DETAIL = (
+    "Flags: X - disabled\n"
+    " 0   name=flash type=disk last-modified=2025-01-25 12:40:02\n"
+    ' 1 X ;;; nightly backup\n'
+    '     name="nauto_my backup.backup" type=backup size=40.2KiB\n'
+    "     last-modified=2025-12-26 20:00:00\n"
+    " 2   name=flash/routeros-7.14-arm64.npk type=package size=12.5MiB\n"
+)
+
+
+def test_parse_size_units():
+    assert parse_size("512B") == 512
+    assert parse_size("40.2KiB") == int(40.2 * 1024)
+    assert parse_size("12.5MiB") == int(12.5 * 1024 ** 2)
+    assert parse_size("1GiB") == 1024 ** 3
+    assert parse_size("disk") is None
+
+
+def test_parse_detail_records():
+    records = parse_detail(FILE_DETAIL)
+
+    assert len(records) == 3
+
+    assert records[0] == {
+        ".index": 0,
+        "name": "flash",
+        "type": "disk",
+        "last-modified": "2025-01-25 12:40:02",
+    }
+
+    assert records[1][".flags"] == "X"
+    assert records[1]["comment"] == "nightly backup"
+    assert records[1]["name"] == "nauto_my backup.backup"
+    assert records[1]["size"] == int(40.2 * 1024)
+    assert records[1]["last-modified"] == "2025-12-26 20:00:00"
+
+    assert records[2]["size"] == int(12.5 * 1024 ** 2)
+
+
+def test_parse_detail_untyped():
+    records = parse_detail(FILE_DETAIL, typed=False)
+    assert records[2]["size"] == "12.5MiB"
+
+
+def test_parse_as_value_records():
+    output = '.id=*1;name="a;b";size=1KiB;.id=*2;name=c;size=2KiB'
+
+    assert parse_as_value(output) == [
+        {".id": "*1", "name": "a;b", "size": 1024},
+        {".id": "*2", "name": "c", "size": 2048},
+    ]
+
+
+def test_parse_properties_continuation():
+    output = (
+        "      uptime: 1d2h\n"
+        "     version: 7.14 (stable)\n"
+        " free-memory: 865.5MiB\n"
+        "  board-name: hAP ax\n"
+        "              lite\n"
+    )
+
+    assert parse_properties(output) == {
+        "uptime": "1d2h",
+        "version": "7.14 (stable)",
+        "free-memory": int(865.5 * 1024 ** 2),
+        "board-name": "hAP ax lite",
+    }
+
+
+def test_parse_table_columns():
+    output = (
+        "Flags: R - RUNNING\n"
+        "Columns: NAME, TYPE, MTU\n"
+        "#   NAME    TYPE   MTU\n"
+        "0 R ether1  ether  1500\n"
+        "1   ether2  ether  1500\n"
+    )
+
+    assert parse_table(output) == [
+        {".index": 0, ".flags": "R", "name": "ether1", "type": "ether", "mtu": "1500"},
+        {".index": 1, "name": "ether2", "type": "ether", "mtu": "1500"},
+    ]
+
+
+def test_parse_print_detects_format():
+    assert len(parse_print(FILE_DETAIL)) == 3
+    assert parse_print(".id=*1;name=x") == [{".id": "*1", "name": "x"}]
+    assert parse_print("version: 7.14") == [{"version": "7.14"}]
+    assert parse_print("") == []
+
+
+def test_cleanup_old_backups_handles_quoted_names(mikrotik_client):
+    conn = MagicMock()
+    conn.send_command.side_effect = [FILE_DETAIL, "", "", ""]
+    mikrotik_client.conn = conn
+
+    cleanup_old_backups(mikrotik_client)
+
+    removed = [c.args[0] for c in conn.send_command.call_args_list[1:]]
+    assert removed == ['/file remove "nauto_my backup.backup"']
@@ -0,0 +1,67 @@
+# network_automation/tests/mikrotik_routeros/test_reconnect.py
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from network_automation.probe import PROBE_DOWN, PROBE_SSH, PROBE_TCP
+
+
+def test_wait_for_reconnect_logs_in_only_after_banner(mocker, mikrotik_client):
+    mikrotik_client.reconnect_timeout = 30
+
+    mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.probe_ssh",
+        side_effect=[PROBE_DOWN, PROBE_DOWN, PROBE_TCP, PROBE_SSH],
+    )
+    mocker.patch("network_automation.platforms.mikrotik_routeros.client.time.sleep")
+
+    fake_conn = MagicMock()
+    fake_conn.send_command.return_value = "version: 7.14"
+
+    connect_handler = mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.ConnectHandler",
+        return_value=fake_conn,
+    )
+
+    conn = mikrotik_client.wait_for_reconnect()
+
+    assert conn is fake_conn
+    assert mikrotik_client.conn is fake_conn
+    connect_handler.assert_called_once()
+
+
+def test_probe_reconnect_discards_unready_cli(mocker, mikrotik_client):
+    mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.probe_ssh",
+        return_value=PROBE_SSH,
+    )
+    mocker.patch("network_automation.platforms.mikrotik_routeros.client.time.sleep")
+
+    fake_conn = MagicMock()
+    fake_conn.send_command.return_value = ""
+
+    mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.ConnectHandler",
+        return_value=fake_conn,
+    )
+
+    assert mikrotik_client.probe_reconnect() == PROBE_SSH
+    assert mikrotik_client.conn is None
+    fake_conn.disconnect.assert_called_once()
+
+
+def test_wait_for_reconnect_times_out(mocker, mikrotik_client):
+    mikrotik_client.reconnect_timeout = 0
+
+    mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.probe_ssh",
+        return_value=PROBE_DOWN,
+    )
+    mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.time.time",
+        side_effect=[0, 1],
+    )
+
+    with pytest.raises(TimeoutError):
+        mikrotik_client.wait_for_reconnect()
@@ -1,6 +1,13 @@
 # network_automation/tests/mikrotik_routeros/test_run.py
 
 from unittest.mock import MagicMock
+
+import pytest
+
+from network_automation.platforms.mikrotik_routeros.run import (
+    split_batch_output,
+    structured_command,
+)
 from network_automation.results import OperationResult
 
 
@@ -74,3 +81,136 @@ def test_run_multiple_commands(monkeypatch, mikrotik_client):
     ]
 
     assert fake_conn.send_command.call_count == 2
+
+
+def test_structured_command_adds_as_value():
+    assert structured_command("/ip route print") == "/ip route print as-value"
+    assert (
+        structured_command("/ip route print where gateway=ether1")
+        == "/ip route print as-value where gateway=ether1"
+    )
+    assert structured_command("/file print detail") == "/file print detail"
+    assert structured_command("/system reboot") == "/system reboot"
+
+
+def test_run_structured_returns_records(monkeypatch, mikrotik_client):
+    monkeypatch.setattr(mikrotik_client, "connect", lambda: None)
+    monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
+
+    fake_conn = MagicMock()
+    fake_conn.send_command.side_effect = [
+        ".id=*1;address=10.0.0.1/24;interface=ether1\n"
+        ".id=*2;address=10.0.1.1/24;interface=ether2",
+        "   uptime: 1d2h\n  version: 7.14 (stable)\n",
+    ]
+
+    mikrotik_client.conn = fake_conn
+
+    result = mikrotik_client.run(
+        ["/ip address print", "/system resource print detail"],
+        structured=True,
+        return_result=True,
+    )
+
+    assert result.metadata["structured"] is True
+    assert result.metadata["output"] == [
+        {
+            "command": "/ip address print",
+            "output": (
+                ".id=*1;address=10.0.0.1/24;interface=ether1\n"
+                ".id=*2;address=10.0.1.1/24;interface=ether2"
+            ),
+            "records": [
+                {".id": "*1", "address": "10.0.0.1/24", "interface": "ether1"},
+                {".id": "*2", "address": "10.0.1.1/24", "interface": "ether2"},
+            ],
+        },
+        {
+            "command": "/system resource print detail",
+            "output": "   uptime: 1d2h\n  version: 7.14 (stable)\n",
+            "records": [{"uptime": "1d2h", "version": "7.14 (stable)"}],
+        },
+    ]
+
+    assert fake_conn.send_command.call_args_list[0].args == (
+        "/ip address print as-value",
+    )
+
+
+def test_run_structured_keeps_error_output(monkeypatch, mikrotik_client):
+    monkeypatch.setattr(mikrotik_client, "connect", lambda: None)
+    monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
+
+    mikrotik_client.conn = MagicMock()
+    mikrotik_client.conn.send_command.return_value = "no such item"
+
+    [entry] = mikrotik_client.run('/file remove "x"', structured=True)
+
+    assert entry == {
+        "command": '/file remove "x"',
+        "output": "no such item",
+        "records": [],
+    }
+
+
+class FakeShell:
+    """Echoes written lines like the RouterOS CLI and answers from a table."""
+
+    RETURN = "\r\n"
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.writes = []
+
+    def write_channel(self, data):
+        self.writes.append(data)
+
+    def read_until_pattern(self, pattern, read_timeout=10.0, re_flags=0):
+        prompt = "[admin@R1] > "
+        lines = []
+
+        for line in self.writes[-1].split(self.RETURN)[:-1]:
+            lines.append(prompt + line)
+            if line.startswith(":put"):
+                lines.append(line.split('"')[1] + line.split('"')[3])
+            else:
+                lines.extend(self.answers[line].splitlines())
+
+        return "\r\n".join(lines) + "\r\n" + prompt
+
+
+def test_run_batch_sends_one_write(monkeypatch, mikrotik_client):
+    monkeypatch.setattr(mikrotik_client, "connect", lambda: None)
+    monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
+
+    shell = FakeShell(
+        {
+            "/system identity print": "  name: R1",
+            "/ip address print as-value": ".id=*1;address=10.0.0.1/24",
+            "/system script run noop": "",
+        }
+    )
+    mikrotik_client.conn = shell
+
+    outputs = mikrotik_client.run(
+        ["/system identity print", "/system script run noop"],
+        batch=True,
+    )
+
+    assert len(shell.writes) == 1
+    assert outputs == [
+        {"command": "/system identity print", "output": "  name: R1"},
+        {"command": "/system script run noop", "output": ""},
+    ]
+
+    [entry] = mikrotik_client.run(
+        "/ip address print",
+        batch=True,
+        structured=True,
+    )
+    assert entry["records"] == [{".id": "*1", "address": "10.0.0.1/24"}]
+
+
+def test_split_batch_output_incomplete_raises():
+    with pytest.raises(RuntimeError, match="1 of 2"):
+        split_batch_output("out\r\nNAUTO-MARK-0\r\nmore\r\n", ["/a", "/b"])
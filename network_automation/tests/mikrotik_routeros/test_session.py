@@ -0,0 +1,63 @@
+# network_automation/tests/mikrotik_routeros/test_session.py
+
+from unittest.mock import MagicMock
+
+
+SYSTEM_RESOURCE = """
+    version: 7.14
+    architecture-name: arm64
+"""
+
+
+def test_session_shares_one_connection(mocker, mikrotik_client):
+    fake_conn = MagicMock()
+    fake_conn.send_command.return_value = SYSTEM_RESOURCE
+
+    connect_handler = mocker.patch(
+        "network_automation.base_client.ConnectHandler",
+        return_value=fake_conn,
+    )
+
+    with mikrotik_client.session() as client:
+        client.info()
+        client.run("/system resource print")
+        client.upgrade()
+
+        assert client.conn is fake_conn
+        fake_conn.disconnect.assert_not_called()
+
+    connect_handler.assert_called_once()
+    fake_conn.disconnect.assert_called_once()
+    assert mikrotik_client.conn is None
+
+
+def test_nested_session_closes_on_outer_exit(mocker, mikrotik_client):
+    fake_conn = MagicMock()
+
+    mocker.patch(
+        "network_automation.base_client.ConnectHandler",
+        return_value=fake_conn,
+    )
+
+    with mikrotik_client:
+        with mikrotik_client:
+            pass
+
+        fake_conn.disconnect.assert_not_called()
+
+    fake_conn.disconnect.assert_called_once()
+
+
+def test_workflow_outside_session_disconnects(mocker, mikrotik_client):
+    fake_conn = MagicMock()
+    fake_conn.send_command.return_value = "OK"
+
+    mocker.patch(
+        "network_automation.base_client.ConnectHandler",
+        return_value=fake_conn,
+    )
+
+    mikrotik_client.run("/system resource print")
+
+    fake_conn.disconnect.assert_called_once()
+    assert mikrotik_client.conn is None
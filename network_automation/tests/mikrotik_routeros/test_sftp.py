@@ -0,0 +1,60 @@
+# network_automation/tests/mikrotik_routeros/test_sftp.py
+
+from unittest.mock import MagicMock
+
+
+def _fake_conn():
+    conn = MagicMock()
+    conn.send_command.return_value = ""
+    conn.send_command_timing.return_value = "[y/N]"
+    return conn
+
+
+def test_transfer_helpers_share_one_sftp_channel(mocker, mikrotik_client, tmp_path, fake_sftp):
+    fake_conn = _fake_conn()
+    fake_conn.remote_conn_pre.open_sftp.return_value = fake_sftp
+    fake_sftp.files["nauto_daily.backup"] = b"backup"
+
+    mocker.patch(
+        "network_automation.base_client.ConnectHandler",
+        return_value=fake_conn,
+    )
+
+    local_file = tmp_path / "test.txt"
+    local_file.write_text("hello")
+
+    with mikrotik_client.session():
+        mikrotik_client.upload(files=[str(local_file)])
+        mikrotik_client.download(files=["nauto_daily.backup"], local_dir=str(tmp_path / "dl"))
+        mikrotik_client.backup("daily", download_dir=str(tmp_path))
+
+    fake_conn.remote_conn_pre.open_sftp.assert_called_once()
+    assert fake_sftp.closed is True
+
+
+def test_reboot_invalidates_sftp_channel(mikrotik_client):
+    first_conn = _fake_conn()
+    mikrotik_client.conn = first_conn
+
+    sftp = mikrotik_client.get_sftp()
+    assert mikrotik_client.get_sftp() is sftp
+
+    mikrotik_client.reboot()
+
+    sftp.close.assert_called_once()
+
+    second_conn = _fake_conn()
+    mikrotik_client.conn = second_conn
+
+    assert mikrotik_client.get_sftp() is second_conn.remote_conn_pre.open_sftp.return_value
+
+
+def test_new_connection_invalidates_sftp_channel(mikrotik_client):
+    first_conn = _fake_conn()
+    mikrotik_client.conn = first_conn
+    sftp = mikrotik_client.get_sftp()
+
+    mikrotik_client.conn = _fake_conn()
+    mikrotik_client.get_sftp()
+
+    sftp.close.assert_called_once()
@@ -0,0 +1,167 @@
+# network_automation/tests/mikrotik_routeros/test_simulator.py
+
+"""
+Integration tests: the real client (Netmiko + Paramiko SFTP) against
+the in-process RouterOS simulator.
+"""
+
+import time
+
+import pytest
+from netmiko import NetmikoAuthenticationException
+
+from network_automation.backup_store import BackupStore
+from network_automation.platforms.mikrotik_routeros.client import MikrotikRouterOS
+from network_automation.platforms.mikrotik_routeros.simulator import (
+    RouterOSSimulator,
+    SimulatedRouter,
+)
+
+
+@pytest.fixture
+def sim():
+    with RouterOSSimulator(reboot_duration=0.5) as simulator:
+        yield simulator
+
+
+def _client(sim, **params):
+    return MikrotikRouterOS(
+        **sim.client_params(
+            connect_retries=1,
+            connect_delay=0,
+            reconnect_timeout=30,
+            reconnect_delay=0.2,
+            probe_timeout=1,
+            **params,
+        )
+    )
+
+
+def test_info_and_structured_run(sim):
+    client = _client(sim)
+    sim.router.put_file("flash/notes.txt", b"x" * 2048)
+
+    assert client.info() == ("x86_64", "7.14 (stable)")
+
+    result = client.run(
+        ["/system resource print", '/file print detail where name~"notes"'],
+        return_result=True,
+    )
+
+    outputs = [entry["output"] for entry in result.metadata["output"]]
+    assert "architecture-name: x86_64" in outputs[0]
+    assert 'name="flash/notes.txt"' in outputs[1]
+    assert "size=2.0KiB" in outputs[1]
+
+
+def test_batch_run(sim):
+    client = _client(sim)
+
+    result = client.run(
+        ["/system resource print", "/system backup save name=b1"],
+        batch=True,
+        return_result=True,
+    )
+
+    outputs = [entry["output"] for entry in result.metadata["output"]]
+    assert "version: 7.14" in outputs[0]
+    assert outputs[1] == "Configuration backup saved"
+    assert sim.router.get_file("b1.backup") is not None
+
+
+def test_wrong_password(sim):
+    client = _client(sim, password="wrong")
+
+    with pytest.raises(NetmikoAuthenticationException):
+        client.connect()
+
+
+def test_backup_over_sftp(sim, tmp_path):
+    sim.router.put_file("nauto_old.backup", b"old")
+    client = _client(sim)
+
+    result = client.backup(
+        "nightly",
+        download_dir=str(tmp_path),
+        export=True,
+        export_compression=None,
+        return_result=True,
+    )
+
+    assert result.success is True
+    assert (tmp_path / "nightly.backup").read_bytes() == sim.router.get_file("nauto_nightly.backup")
+    assert sim.router.get_file("nauto_old.backup") is None
+
+    export = (tmp_path / "nightly.rsc").read_text()
+    assert "by RouterOS" not in export
+    assert "set name=MikroTik" in export
+
+
+def test_incremental_backup_skips_binary_when_export_unchanged(sim, tmp_path):
+    client = _client(sim)
+    store = BackupStore(tmp_path / "repo")
+
+    def backup(**kwargs):
+        return client.backup("nightly", export=True, store=store, return_result=True, **kwargs)
+
+    # Every save is freshly salted: binaries never deduplicate
+    plain = [backup(), backup()]
+    assert [r.metadata["store"]["backup"]["stored"] for r in plain] == [True, True]
+    assert [r.metadata["store"]["export"]["stored"] for r in plain] == [True, False]
+
+    sim.router.remove_file("nauto_nightly.backup")
+    unchanged = backup(incremental=True)
+
+    assert unchanged.metadata["skipped"] is True
+    assert unchanged.metadata["local_path"] == plain[1].metadata["local_path"]
+    assert sim.router.get_file("nauto_nightly.backup") is None
+    assert len(store.history("127.0.0.1", "backup")) == 3
+
+    sim.router.identity = "R2"
+    changed = backup(incremental=True)
+
+    assert "skipped" not in changed.metadata
+    assert changed.metadata["store"]["backup"]["stored"] is True
+
+
+def test_sftp_bandwidth_and_latency(tmp_path):
+    router = SimulatedRouter(files={"big.bin": bytes(200_000)})
+    local = tmp_path / "up.bin"
+    local.write_bytes(b"u" * 100_000)
+
+    with RouterOSSimulator(router, latency=0.05, bandwidth=1_000_000) as sim:
+        client = _client(sim)
+
+        with client:
+            started = time.monotonic()
+            client.run(["/system resource print"] * 3)
+            assert time.monotonic() - started >= 0.15
+
+            client.download(files=["big.bin"], local_dir=str(tmp_path / "down"))
+            result = client.upload(files=[local], return_result=True)
+
+    assert (tmp_path / "down" / "big.bin").read_bytes() == bytes(200_000)
+    assert router.get_file("up.bin") == b"u" * 100_000
+    assert result.metadata["transfer"]["duration_seconds"] >= 0.1
+
+
+def test_upgrade_with_reboot(sim, tmp_path):
+    repo = tmp_path / "repo" / "7.15"
+    repo.mkdir(parents=True)
+    (repo / "routeros-7.15.npk").write_bytes(b"npk" * 1000)
+
+    client = _client(
+        sim,
+        firmware_version="7.15",
+        firmware_delivery="upload",
+        repo_path=str(tmp_path / "repo"),
+    )
+
+    result = client.upgrade(return_result=True)
+
+    assert result.success is True
+    assert result.metadata["final_version"] == "7.15 (stable)"
+    assert sim.router.version == "7.15"
+    assert sim.router.reboots == 1
+    assert sim.router.get_file("routeros-7.15.npk") is None
+    assert "reconnect_wait" in result.phase_totals()
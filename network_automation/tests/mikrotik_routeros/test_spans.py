@@ -0,0 +1,48 @@
+# network_automation/tests/mikrotik_routeros/test_spans.py
+
+from unittest.mock import MagicMock
+
+from network_automation.results import OperationResult
+from network_automation.spans import NULL_SPAN
+
+
+def test_span_is_noop_without_recorder(mikrotik_client):
+    assert mikrotik_client.span("connect") is NULL_SPAN
+
+
+def test_backup_records_phase_breakdown(monkeypatch, mikrotik_client, tmp_path, fake_sftp, sftp_conn):
+    monkeypatch.setattr(
+        "network_automation.base_client.ConnectHandler",
+        MagicMock(return_value=sftp_conn),
+    )
+    fake_sftp.files["nauto_nightly.backup"] = b"backup-data"
+
+    result = mikrotik_client.backup(
+        "nightly",
+        return_result=True,
+        download_dir=str(tmp_path),
+    )
+
+    names = [phase["name"] for phase in result.phases]
+    assert names == ["connect", "command", "cleanup", "command", "transfer"]
+
+    transfer = result.phases[-1]
+    assert transfer["target"] == "nauto_nightly.backup"
+    assert transfer["seconds"] >= 0
+
+    assert set(result.phase_totals()) == {"connect", "command", "cleanup", "transfer"}
+
+    # Spans stop once the workflow returned
+    assert mikrotik_client.span("command") is NULL_SPAN
+
+
+def test_result_span_records_phase():
+    result = OperationResult(success=True)
+
+    with result.span("reboot"):
+        pass
+
+    [phase] = result.phases
+    assert phase["name"] == "reboot"
+    assert "target" not in phase
+    assert result.to_dict()["phases"] == [phase]
@@ -0,0 +1,75 @@
+# network_automation/tests/mikrotik_routeros/test_stream.py
+
+import pytest
+
+from network_automation.platforms.mikrotik_routeros import stream
+
+
+class FakeChannel:
+    """Delivers a canned CLI transcript in small, unaligned chunks."""
+
+    RETURN = "\r\n"
+
+    def __init__(self, transcript, chunk=7):
+        self.chunks = [
+            transcript[i:i + chunk] for i in range(0, len(transcript), chunk)
+        ]
+        self.writes = []
+
+    def write_channel(self, data):
+        self.writes.append(data)
+
+    def read_channel(self):
+        return self.chunks.pop(0) if self.chunks else ""
+
+
+EXPORT = [
+    "# 2025-12-26 20:00:00 by RouterOS 7.14",
+    "/interface bridge",
+    "add name=bridge1 comment=\"Büro – Zürich\"",
+    "",
+    "/ip address",
+    "add address=10.0.0.1/24 interface=bridge1",
+]
+
+
+def _transcript(command, lines):
+    return (
+        f"[admin@R1] > {command}\r\n"
+        + "".join(f"{line}\r\n" for line in lines)
+        + "\r\n[admin@R1] > "
+    )
+
+
+@pytest.fixture
+def streaming_client(monkeypatch, mikrotik_client):
+    monkeypatch.setattr(mikrotik_client, "connect", lambda: None)
+    monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
+    mikrotik_client.conn = FakeChannel(_transcript("/export", EXPORT))
+    return mikrotik_client
+
+
+def test_stream_yields_lines(streaming_client):
+    lines = list(streaming_client.stream("/export"))
+
+    assert lines == EXPORT
+    assert streaming_client.conn.writes == ["/export\r\n"]
+
+
+def test_stream_to_file_sink(tmp_path, streaming_client):
+    path = tmp_path / "export.rsc"
+
+    result = streaming_client.stream("/export", sink=path, return_result=True)
+
+    assert result.success is True
+    assert result.metadata["lines"] == len(EXPORT)
+    assert path.read_text(encoding="utf-8") == "\n".join(EXPORT) + "\n"
+    assert result.metadata["bytes"] == path.stat().st_size
+
+
+def test_stream_times_out_without_prompt(monkeypatch, mikrotik_client):
+    monkeypatch.setattr(stream, "STREAM_POLL_INTERVAL", 0)
+    mikrotik_client.conn = FakeChannel("[admin@R1] > /log print\r\nline\r\n")
+
+    with pytest.raises(TimeoutError):
+        list(stream.stream_command(mikrotik_client, "/log print", read_timeout=0.01))
@@ -1,5 +1,11 @@
 # network_automation/tests/mikrotik_routeros/test_upgrade_result.py
 
+from unittest.mock import MagicMock
+
+import pytest
+
+from network_automation.metrics import MetricsRegistry
+from network_automation.platforms.mikrotik_routeros.upgrade import fail_upgrade, start_upgrade
 from network_automation.results import OperationResult
 
 def test_upgrade_returns_result(monkeypatch, mikrotik_client):
@@ -42,3 +48,40 @@ def test_upgrade_returns_result(monkeypatch, mikrotik_client):
     assert isinstance(result, OperationResult)
     assert result.success is True
     assert result.operation == "upgrade"
+
+
+def test_upgrade_outcome_counted(monkeypatch, mikrotik_client):
+    metrics = MetricsRegistry()
+    mikrotik_client.context.metrics = metrics
+
+    monkeypatch.setattr(mikrotik_client, "connect", lambda: None)
+    monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
+    monkeypatch.setattr(
+        "network_automation.platforms.mikrotik_routeros.upgrade.get_info",
+        lambda client: ("x86_64", "7.14"),
+    )
+
+    mikrotik_client.upgrade()
+
+    monkeypatch.setattr(
+        "network_automation.platforms.mikrotik_routeros.upgrade.get_info",
+        MagicMock(side_effect=OSError("lost")),
+    )
+
+    with pytest.raises(OSError):
+        mikrotik_client.upgrade()
+
+    upgrades = metrics.get("nauto_upgrades_total")
+    assert upgrades.value(outcome="skipped") == 1
+    assert upgrades.value(outcome="failed") == 1
+
+
+def test_fail_upgrade_counts_failure(mikrotik_client):
+    metrics = MetricsRegistry()
+    mikrotik_client.context.metrics = metrics
+
+    state = start_upgrade(mikrotik_client)
+    fail_upgrade(mikrotik_client, state, OSError("lost"))
+
+    assert state.error == "lost"
+    assert metrics.get("nauto_upgrades_total").value(outcome="failed") == 1
@@ -2,41 +2,15 @@
 
 from pathlib import Path
 from network_automation.results import OperationResult
-
-
-# -------------------------------------------------------
-# Fake SFTP stack (jak w test_backup)
-# -------------------------------------------------------
-
-class FakeSFTP:
-    def __init__(self):
-        self.uploads = []
-
-    def put(self, local, remote):
-        self.uploads.append((local, remote))
-
-    def close(self):
-        pass
-
-
-class FakeRemoteConnPre:
-    def __init__(self, sftp):
-        self._sftp = sftp
-
-    def open_sftp(self):
-        return self._sftp
-
-
-class FakeConn:
-    def __init__(self, sftp):
-        self.remote_conn_pre = FakeRemoteConnPre(sftp)
+from network_automation.platforms.mikrotik_routeros.upload import upload_files
+from network_automation.platforms.mikrotik_routeros.upgrade import upload_firmware
 
 
 # -------------------------------------------------------
 # Tests
 # -------------------------------------------------------
 
-def test_upload_files_success(monkeypatch, mikrotik_client, tmp_path):
+def test_upload_files_success(monkeypatch, mikrotik_client, tmp_path, fake_sftp, sftp_conn):
     """
     Upload single file via SFTP.
     """
@@ -50,8 +24,7 @@ def test_upload_files_success(monkeypatch, mikrotik_client, tmp_path):
     monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
 
     # ---- fake SFTP ----
-    fake_sftp = FakeSFTP()
-    mikrotik_client.conn = FakeConn(fake_sftp)
+    mikrotik_client.conn = sftp_conn
 
     # ---- run upload ----
     result = mikrotik_client.upload(
@@ -68,8 +41,114 @@ def test_upload_files_success(monkeypatch, mikrotik_client, tmp_path):
     # ---- metadata ----
     assert result.metadata["files"] == ["test.txt"]
     assert result.metadata["remote_dir"] == "/"
+    assert result.metadata["transfer"]["bytes"] == 5
+    assert result.metadata["transfer"]["files"] == 1
 
     # ---- SFTP interaction ----
-    assert fake_sftp.uploads == [
-        (str(local_file), "/test.txt")
-    ]
+    assert fake_sftp.files == {
+        "/test.txt": b"hello",
+    }
+
+
+def test_upload_resumes_partial_file(monkeypatch, mikrotik_client, tmp_path, fake_sftp, sftp_conn):
+    local_file = tmp_path / "routeros.npk"
+    local_file.write_bytes(b"0123456789")
+
+    monkeypatch.setattr(mikrotik_client, "connect", lambda: None)
+    monkeypatch.setattr(mikrotik_client, "disconnect", lambda: None)
+
+    fake_sftp.files["/routeros.npk"] = b"012345"
+    mikrotik_client.conn = sftp_conn
+
+    result = mikrotik_client.upload(
+        files=[str(local_file)],
+        resume=True,
+        verify_checksum=True,
+        return_result=True,
+    )
+
+    assert fake_sftp.files["/routeros.npk"] == b"0123456789"
+    assert result.metadata["transfer"]["bytes"] == 4
+    assert ("/routeros.npk", "r+b") in fake_sftp.opened
+
+
+def test_upload_resume_restarts_on_corrupt_prefix(mikrotik_client, tmp_path, fake_sftp, sftp_conn):
+    local_file = tmp_path / "routeros.npk"
+    local_file.write_bytes(b"0123456789")
+
+    fake_sftp.files["/routeros.npk"] = b"XXXXXX"
+    mikrotik_client.conn = sftp_conn
+
+    stats = upload_files(
+        mikrotik_client,
+        files=[local_file],
+        resume=True,
+        verify_checksum=True,
+    )
+
+    assert fake_sftp.files["/routeros.npk"] == b"0123456789"
+    assert stats.bytes == 4 + 10
+
+
+def test_upload_resume_verifies_without_verify_checksum(mikrotik_client, tmp_path, fake_sftp, sftp_conn):
+    local_file = tmp_path / "routeros.npk"
+    local_file.write_bytes(b"0123456789")
+
+    fake_sftp.files["/routeros.npk"] = b"XXXXXX"
+    mikrotik_client.conn = sftp_conn
+
+    stats = upload_files(mikrotik_client, files=[local_file], resume=True)
+
+    assert fake_sftp.files["/routeros.npk"] == b"0123456789"
+    assert stats.bytes == 4 + 10
+
+
+def test_upload_resume_restarts_when_remote_larger(mikrotik_client, tmp_path, fake_sftp, sftp_conn):
+    local_file = tmp_path / "routeros.npk"
+    local_file.write_bytes(b"0123")
+
+    fake_sftp.files["/routeros.npk"] = b"0123456789"
+    mikrotik_client.conn = sftp_conn
+
+    stats = upload_files(mikrotik_client, files=[local_file], resume=True)
+
+    assert fake_sftp.files["/routeros.npk"] == b"0123"
+    assert stats.bytes == 4
+
+
+def test_upload_firmware_skips_identical_file(mikrotik_client, tmp_path, fake_sftp, sftp_conn):
+    repo = tmp_path / "7.14"
+    repo.mkdir()
+    firmware = repo / "routeros-7.14-arm64.npk"
+    firmware.write_bytes(b"npk-content")
+
+    mikrotik_client.repo_path = str(tmp_path)
+    mikrotik_client.arch = "arm64"
+    mikrotik_client.verify_checksum = True
+    mikrotik_client.conn = sftp_conn
+
+    fake_sftp.files["/routeros-7.14-arm64.npk"] = b"npk-content"
+
+    stats = upload_firmware(mikrotik_client)
+
+    assert stats.skipped == 1
+    assert stats.bytes == 0
+    assert all(mode == "rb" for _, mode in fake_sftp.opened)
+
+
+def test_upload_firmware_replaces_different_file(mikrotik_client, tmp_path, fake_sftp, sftp_conn):
+    repo = tmp_path / "7.14"
+    repo.mkdir()
+    firmware = repo / "routeros-7.14-arm64.npk"
+    firmware.write_bytes(b"npk-content")
+
+    mikrotik_client.repo_path = str(tmp_path)
+    mikrotik_client.arch = "arm64"
+    mikrotik_client.conn = sftp_conn
+
+    fake_sftp.files["/routeros-7.14-arm64.npk"] = b"old"
+
+    stats = upload_firmware(mikrotik_client)
+
+    assert stats.skipped == 0
+    assert fake_sftp.files["/routeros-7.14-arm64.npk"] == b"npk-content"
@@ -0,0 +1,112 @@
+# network_automation/tests/test_backup_store.py
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from network_automation.backup_store import BackupStore
+
+
+def _commit(store, host, content, *, kind="backup", days_ago=0):
+    temp = store.temp_path()
+    temp.write_bytes(content)
+    return store.commit(
+        host,
+        kind,
+        temp,
+        timestamp=datetime.now(timezone.utc) - timedelta(days=days_ago),
+    )
+
+
+def test_identical_content_is_stored_once(tmp_path):
+    store = BackupStore(tmp_path)
+
+    first = _commit(store, "10.0.0.1", b"config-a", days_ago=1)
+    second = _commit(store, "10.0.0.1", b"config-a")
+    other = _commit(store, "10.0.0.2", b"config-a")
+
+    assert first["stored"] is True
+    assert second["stored"] is False
+    assert other["stored"] is False
+    assert first["hash"] == second["hash"]
+
+    assert len(list((tmp_path / "objects").glob("*/*"))) == 1
+    assert not list((tmp_path / "tmp").iterdir())
+    assert len(store.history("10.0.0.1")) == 2
+    assert store.object_path(first["hash"]).read_bytes() == b"config-a"
+
+
+def test_retention_and_gc(tmp_path):
+    store = BackupStore(tmp_path)
+
+    for days_ago, content in [(30, b"v1"), (20, b"v2"), (10, b"v3"), (1, b"v3")]:
+        _commit(store, "10.0.0.1", content, days_ago=days_ago)
+    _commit(store, "10.0.0.1", b"export", kind="export", days_ago=30)
+
+    removed = store.apply_retention("10.0.0.1", keep_last=1, keep_days=15)
+
+    assert removed == 2
+    assert [e["hash"] for e in store.history("10.0.0.1", "backup")] == [
+        store.latest("10.0.0.1", "backup")["hash"]
+    ] * 2
+    assert store.latest("10.0.0.1", "export") is not None
+
+    assert store.gc() == 2
+    assert len(list((tmp_path / "objects").glob("*/*"))) == 2
+
+
+def test_concurrent_commits_survive_retention_and_gc(tmp_path):
+    store = BackupStore(tmp_path)
+    stop = threading.Event()
+
+    def maintenance():
+        while not stop.is_set():
+            store.apply_retention("r1", keep_days=1)
+            store.gc()
+
+    worker = threading.Thread(target=maintenance)
+    worker.start()
+    try:
+        for i in range(50):
+            _commit(store, "r1", f"config {i}".encode())
+    finally:
+        stop.set()
+        worker.join()
+
+    history = store.history("r1")
+    assert len(history) == 50
+    assert all(store.object_path(e["hash"]).exists() for e in history)
+
+
+def test_gc_removes_stale_temp_files(tmp_path):
+    store = BackupStore(tmp_path)
+
+    stale = store.temp_path()
+    stale.write_bytes(b"crashed download")
+    old = time.time() - 2 * 86400
+    os.utime(stale, (old, old))
+
+    fresh = store.temp_path()
+    fresh.write_bytes(b"in flight")
+
+    store.gc()
+
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def test_index_names_cannot_escape_index_dir(tmp_path):
+    store = BackupStore(tmp_path / "repo")
+    hosts = ["../../evil", "fe80::1", "a/b", ".."]
+
+    for host in hosts:
+        _commit(store, host, host.encode())
+
+    index = tmp_path / "repo" / "index"
+    assert sorted(p.parent for p in (tmp_path / "repo").rglob("*.jsonl")) == [index] * 4
+
+    for host in hosts:
+        assert len(store.history(host)) == 1
+
+    assert store.gc() == 0
@@ -0,0 +1,33 @@
+# network_automation/tests/test_cache.py
+
+from network_automation.cache import CommandCache
+
+
+def test_command_cache_hit_and_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("network_automation.cache.time.monotonic", lambda: now[0])
+
+    cache = CommandCache(ttl=5)
+    cache.put("/system resource print", "OUT")
+
+    assert cache.get("/system resource print") == "OUT"
+
+    now[0] += 6
+    assert cache.get("/system resource print") is None
+
+    assert cache.stats() == {
+        "entries": 0,
+        "hits": 1,
+        "misses": 1,
+        "invalidations": 0,
+    }
+
+
+def test_command_cache_invalidate():
+    cache = CommandCache()
+    cache.put("/file print", "OUT")
+
+    cache.invalidate()
+
+    assert cache.get("/file print") is None
+    assert cache.invalidations == 1
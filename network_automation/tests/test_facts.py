@@ -0,0 +1,82 @@
+# network_automation/tests/test_facts.py
+
+import time
+from unittest.mock import MagicMock
+
+from network_automation.facts import FactsStore
+from network_automation.platforms.mikrotik_routeros.client import MikrotikRouterOS
+from network_automation.rollout import filter_current
+
+
+def _device(host, version="7.14"):
+    return {
+        "device_type": "mikrotik_routeros",
+        "host": host,
+        "username": "admin",
+        "firmware_version": version,
+    }
+
+
+def test_facts_store_roundtrip_and_freshness(tmp_path):
+    store = FactsStore(str(tmp_path / "facts.sqlite3"))
+
+    store.update("10.0.0.1", arch="arm64", version="7.14")
+    store.update("10.0.0.2", arch="mipsbe", version="7.12", seen_at=time.time() - 7200)
+
+    assert store.get("10.0.0.1")["version"] == "7.14"
+    assert store.get("10.0.0.2", max_age=3600) is None
+    assert store.get("10.0.0.3") is None
+    assert set(store.all(max_age=3600)) == {"10.0.0.1"}
+
+    store.close()
+
+    # Persisted across instances
+    reopened = FactsStore(str(tmp_path / "facts.sqlite3"))
+    assert reopened.get("10.0.0.2")["arch"] == "mipsbe"
+
+
+def test_filter_current_skips_up_to_date_hosts(tmp_path):
+    store = FactsStore(str(tmp_path / "facts.sqlite3"))
+    store.update("10.0.0.1", arch="arm64", version="7.15")
+    store.update("10.0.0.2", arch="arm64", version="7.13")
+    store.update("10.0.0.3", arch="arm64", version="7.14", seen_at=time.time() - 7200)
+
+    devices = [_device(f"10.0.0.{i}") for i in range(1, 5)]
+
+    pending, current = filter_current(devices, store, max_age=3600)
+
+    assert [d["host"] for d in current] == ["10.0.0.1"]
+    assert [d["host"] for d in pending] == ["10.0.0.2", "10.0.0.3", "10.0.0.4"]
+
+
+def test_filter_current_treats_unparseable_versions_as_pending(tmp_path, caplog):
+    store = FactsStore(str(tmp_path / "facts.sqlite3"))
+    store.update("10.0.0.1", arch="arm64", version="unknown")
+    store.update("10.0.0.2", arch="arm64", version="7.15")
+
+    pending, current = filter_current([_device("10.0.0.1"), _device("10.0.0.2")], store)
+
+    assert [d["host"] for d in pending] == ["10.0.0.1"]
+    assert [d["host"] for d in current] == ["10.0.0.2"]
+    assert "unknown" in caplog.text
+
+
+def test_get_info_updates_facts_store(tmp_path):
+    store = FactsStore(str(tmp_path / "facts.sqlite3"))
+
+    client = MikrotikRouterOS(
+        host="10.0.0.1",
+        username="admin",
+        facts_store=store,
+    )
+    client.conn = MagicMock()
+    client.conn.send_command.return_value = (
+        "architecture-name: arm64\n"
+        "version: 7.14 (stable)\n"
+    )
+
+    client.get_info()
+
+    fact = store.get("10.0.0.1")
+    assert fact["arch"] == "arm64"
+    assert fact["version"] == "7.14 (stable)"
@@ -0,0 +1,95 @@
+# network_automation/tests/test_fleet.py
+
+import time
+
+import pytest
+
+from network_automation.fleet import run_fleet
+from network_automation.results import OperationResult
+
+
+def _devices(*hosts):
+    return [
+        {
+            "device_type": "mikrotik_routeros",
+            "host": host,
+            "username": "admin",
+            "password": "secret",
+        }
+        for host in hosts
+    ]
+
+
+def test_run_fleet_returns_result_per_device(mocker):
+    def fake_read_info(client, *, return_result=False):
+        result = OperationResult(success=True, operation="info")
+        result.metadata["version"] = "7.14"
+        return result
+
+    mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.read_info",
+        side_effect=fake_read_info,
+    )
+
+    results = run_fleet(
+        _devices("10.0.0.1", "10.0.0.2", "10.0.0.3"),
+        "info",
+        max_workers=2,
+    )
+
+    assert len(results) == 3
+    assert all(r.success for r in results)
+    assert sorted(r.metadata["host"] for r in results) == [
+        "10.0.0.1",
+        "10.0.0.2",
+        "10.0.0.3",
+    ]
+
+
+def test_run_fleet_records_failures_without_aborting(mocker):
+    def fake_run(client, commands, **kwargs):
+        if client.host == "10.0.0.2":
+            raise RuntimeError("connection refused")
+        return OperationResult(success=True, operation="run")
+
+    mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.run_helper",
+        side_effect=fake_run,
+    )
+
+    devices = _devices("10.0.0.1", "10.0.0.2")
+    devices.append({"device_type": "unknown", "host": "10.0.0.3"})
+
+    results = run_fleet(devices, "run", "/system resource print")
+
+    by_host = {r.metadata["host"]: r for r in results}
+
+    assert by_host["10.0.0.1"].success is True
+
+    assert by_host["10.0.0.2"].success is False
+    assert by_host["10.0.0.2"].operation == "run"
+    assert by_host["10.0.0.2"].errors == ["connection refused"]
+
+    assert by_host["10.0.0.3"].success is False
+    assert "Unsupported device_type" in by_host["10.0.0.3"].errors[0]
+
+
+def test_failed_device_reports_time_until_failure(mocker):
+    def slow_failure(client, commands, **kwargs):
+        time.sleep(0.05)
+        raise TimeoutError("no response")
+
+    mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.run_helper",
+        side_effect=slow_failure,
+    )
+
+    [result] = run_fleet(_devices("10.0.0.1"), "run", "/system resource print")
+
+    assert result.success is False
+    assert result.duration_seconds >= 0.05
+
+
+def test_run_fleet_rejects_unknown_operation():
+    with pytest.raises(ValueError):
+        run_fleet(_devices("10.0.0.1"), "reboot")
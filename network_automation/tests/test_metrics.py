@@ -0,0 +1,124 @@
+# network_automation/tests/test_metrics.py
+
+import urllib.request
+from unittest.mock import MagicMock
+
+import pytest
+from netmiko import NetmikoAuthenticationException, NetmikoTimeoutException
+
+from network_automation.context import ExecutionContext
+from network_automation.metrics import CONTENT_TYPE, MetricsRegistry
+from network_automation.platforms.mikrotik_routeros.client import MikrotikRouterOS
+
+
+def _client(metrics, **kwargs):
+    kwargs.setdefault("connect_delay", 0)
+    return MikrotikRouterOS(
+        host="10.0.0.1",
+        username="admin",
+        context=ExecutionContext(metrics=metrics),
+        **kwargs,
+    )
+
+
+def test_histogram_render():
+    metrics = MetricsRegistry(buckets=(0.1, 1.0))
+    metrics.observe("nauto_command_seconds", 0.05)
+    metrics.observe("nauto_command_seconds", 0.5)
+    metrics.inc("nauto_transfer_bytes_total", 1024, direction="upload")
+
+    text = metrics.render()
+
+    assert "# TYPE nauto_command_seconds histogram" in text
+    assert 'nauto_command_seconds_bucket{le="0.1"} 1' in text
+    assert 'nauto_command_seconds_bucket{le="1"} 2' in text
+    assert 'nauto_command_seconds_bucket{le="+Inf"} 2' in text
+    assert "nauto_command_seconds_sum 0.55" in text
+    assert "nauto_command_seconds_count 2" in text
+    assert 'nauto_transfer_bytes_total{direction="upload"} 1024' in text
+
+
+def test_render_special_values():
+    metrics = MetricsRegistry(buckets=(1.0,))
+    metrics.observe("nauto_command_seconds", float("inf"))
+    metrics.inc("nauto_transfer_bytes_total", float("nan"), direction="upload")
+    metrics.inc("nauto_transfer_bytes_total", float("-inf"), direction="download")
+
+    text = metrics.render()
+
+    assert "nauto_command_seconds_sum +Inf" in text
+    assert 'nauto_command_seconds_bucket{le="1"} 0' in text
+    assert 'nauto_transfer_bytes_total{direction="upload"} NaN' in text
+    assert 'nauto_transfer_bytes_total{direction="download"} -Inf' in text
+
+
+def test_labels_are_checked():
+    metrics = MetricsRegistry()
+
+    with pytest.raises(ValueError):
+        metrics.inc("nauto_upgrades_total")
+
+    with pytest.raises(ValueError):
+        metrics.histogram("nauto_upgrades_total")
+
+
+def test_connect_and_command_metrics(monkeypatch):
+    conn = MagicMock()
+    conn.send_command.return_value = "OK"
+    attempts = iter([NetmikoTimeoutException("t"), conn])
+
+    def connect_handler(**kwargs):
+        outcome = next(attempts)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(
+        "network_automation.base_client.ConnectHandler",
+        connect_handler,
+    )
+
+    metrics = MetricsRegistry()
+    _client(metrics, connect_retries=2, connect_delay=0.2).run("/system resource print")
+
+    attempts_total = metrics.get("nauto_connect_attempts_total")
+    assert attempts_total.value(outcome="timeout") == 1
+    assert attempts_total.value(outcome="success") == 1
+    # Latency of the successful attempt only, not the retry backoff
+    connect_seconds = metrics.get("nauto_connect_seconds")
+    assert connect_seconds.count() == 1
+    assert connect_seconds.sum() < 0.2
+    assert metrics.get("nauto_command_seconds").count() == 1
+
+
+def test_auth_failure_counted(monkeypatch):
+    monkeypatch.setattr(
+        "network_automation.base_client.ConnectHandler",
+        MagicMock(side_effect=NetmikoAuthenticationException("denied")),
+    )
+
+    metrics = MetricsRegistry()
+    with pytest.raises(NetmikoAuthenticationException):
+        _client(metrics).connect()
+
+    assert metrics.get("nauto_connect_attempts_total").value(outcome="auth") == 1
+
+
+def test_textfile_and_http(tmp_path):
+    metrics = MetricsRegistry()
+    metrics.inc("nauto_upgrades_total", outcome="success")
+
+    path = tmp_path / "nauto.prom"
+    metrics.write_textfile(str(path))
+    assert 'nauto_upgrades_total{outcome="success"} 1' in path.read_text()
+
+    server = metrics.serve()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+
+    assert body == metrics.render()
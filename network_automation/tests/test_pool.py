@@ -0,0 +1,98 @@
+# network_automation/tests/test_pool.py
+
+from unittest.mock import MagicMock
+
+from network_automation.factory import get_client
+from network_automation.pool import ConnectionPool
+
+
+def _conn(alive=True):
+    conn = MagicMock()
+    conn.is_alive.return_value = alive
+    return conn
+
+
+def test_pool_hit_and_miss():
+    pool = ConnectionPool()
+    conn = _conn()
+
+    assert pool.acquire("a") is None
+
+    pool.release("a", conn)
+
+    assert pool.acquire("b") is None
+    assert pool.acquire("a") is conn
+    assert pool.stats() == {"hits": 1, "misses": 2, "evictions": 0, "idle": 0}
+
+
+def test_pool_drops_dead_connections():
+    pool = ConnectionPool()
+    dead = _conn(alive=False)
+
+    pool.release("a", dead)
+
+    assert pool.acquire("a") is None
+    dead.disconnect.assert_called_once()
+    assert pool.evictions == 1
+
+
+def test_pool_evicts_oldest_over_max_size():
+    pool = ConnectionPool(max_size=1)
+    first, second = _conn(), _conn()
+
+    pool.release("a", first)
+    pool.release("b", second)
+
+    first.disconnect.assert_called_once()
+    assert len(pool) == 1
+    assert pool.acquire("b") is second
+
+
+def test_pool_evicts_idle_connections():
+    pool = ConnectionPool(idle_ttl=0)
+    conn = _conn()
+
+    pool.release("a", conn)
+
+    assert pool.acquire("a") is None
+    conn.disconnect.assert_called_once()
+
+
+def test_client_reuses_pooled_connection(mocker):
+    pool = ConnectionPool()
+    fake_conn = _conn()
+    fake_conn.send_command.return_value = "OK"
+
+    connect_handler = mocker.patch(
+        "network_automation.base_client.ConnectHandler",
+        return_value=fake_conn,
+    )
+
+    for _ in range(3):
+        client = get_client(
+            device_type="mikrotik_routeros",
+            host="1.1.1.1",
+            username="admin",
+            password="secret",
+            pool=pool,
+        )
+        client.run("/system resource print")
+
+    connect_handler.assert_called_once()
+    fake_conn.disconnect.assert_not_called()
+    assert pool.hits == 2
+    assert pool.misses == 1
+
+
+def test_pool_key_separates_passwords():
+    def client(password):
+        return get_client(
+            device_type="mikrotik_routeros",
+            host="1.1.1.1",
+            username="admin",
+            password=password,
+        )
+
+    assert client("secret").pool_key == client("secret").pool_key
+    assert client("secret").pool_key != client("other").pool_key
+    assert "secret" not in repr(client("secret").pool_key)
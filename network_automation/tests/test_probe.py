@@ -0,0 +1,57 @@
+# network_automation/tests/test_probe.py
+
+import socket
+import threading
+
+from network_automation.probe import (
+    PROBE_DOWN,
+    PROBE_SSH,
+    PROBE_TCP,
+    next_delay,
+    probe_ssh,
+)
+
+
+def _serve_once(payload: bytes):
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+
+    def handle():
+        conn, _ = server.accept()
+        conn.sendall(payload)
+        conn.close()
+        server.close()
+
+    threading.Thread(target=handle, daemon=True).start()
+    return server.getsockname()[1]
+
+
+def test_probe_ssh_banner():
+    port = _serve_once(b"SSH-2.0-ROSSSH\r\n")
+    assert probe_ssh("127.0.0.1", port, timeout=2) == PROBE_SSH
+
+
+def test_probe_tcp_without_banner():
+    port = _serve_once(b"")
+    assert probe_ssh("127.0.0.1", port, timeout=2) == PROBE_TCP
+
+
+def test_probe_down():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+
+    assert probe_ssh("127.0.0.1", port, timeout=1) == PROBE_DOWN
+
+
+def test_next_delay_backs_off_while_down():
+    delay = 0.0
+    delays = []
+    for _ in range(5):
+        delay = next_delay(PROBE_DOWN, delay, min_delay=1, max_delay=10)
+        delays.append(delay)
+
+    assert delays == [1, 2, 4, 8, 10]
+    assert next_delay(PROBE_TCP, 10, min_delay=1, max_delay=10) == 1
@@ -1,6 +1,12 @@
 # network_automation/tests/test_results.py
 
-from network_automation.results import OperationResult
+import dataclasses
+import json
+import tracemalloc
+from datetime import datetime, timedelta
+
+from network_automation.results import OperationResult, to_columns, write_jsonl
+
 
 def test_operation_result_timing():
     result = OperationResult(success=True)
@@ -10,3 +16,101 @@ def test_operation_result_timing():
 
     assert result.duration_seconds is not None
     assert result.duration_seconds >= 0
+
+
+def test_operation_result_is_slotted_dataclass():
+    result = OperationResult(success=True, operation="info")
+
+    assert not hasattr(result, "__dict__")
+
+    result.errors.append("boom")
+    result.metadata["host"] = "10.0.0.1"
+
+    assert result == OperationResult(
+        success=True,
+        operation="info",
+        errors=["boom"],
+        metadata={"host": "10.0.0.1"},
+    )
+    assert dataclasses.asdict(result)["errors"] == ["boom"]
+    assert dataclasses.replace(result, success=False).success is False
+    assert "phases" in {f.name for f in dataclasses.fields(result)}
+
+
+def _bytes_per_result(make, count=5000) -> float:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        results = [make() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert len(results) == count
+    return (after - before) / count
+
+
+def test_operation_result_memory_stays_small():
+    def populated():
+        result = OperationResult(success=True, operation="backup")
+        result.mark_started()
+        result.metadata["host"] = "10.0.0.1"
+        result.mark_finished()
+        return result
+
+    # Unused containers are not allocated (eager ones cost ~230 bytes)
+    assert _bytes_per_result(lambda: OperationResult(success=True)) < 160
+    assert _bytes_per_result(populated) < 450
+
+
+def test_lazy_containers_are_created_on_access():
+    result = OperationResult(success=True)
+
+    assert result.to_dict()["errors"] == []
+    assert to_columns([result])["errors"] == [None]
+
+    result.warnings.append("slow")
+    result.phases.append({"name": "connect", "seconds": 1.0})
+
+    assert result.warnings == ["slow"]
+    assert result.to_dict()["phases"] == [{"name": "connect", "seconds": 1.0}]
+    assert dataclasses.asdict(result)["metadata"] == {}
+
+
+def test_naive_datetimes_are_kept():
+    started = datetime(2026, 1, 1, 12, 0, 0)
+    result = OperationResult(
+        success=True,
+        started_at=started,
+        finished_at=started + timedelta(seconds=5),
+    )
+
+    assert result.started_at == started
+    assert result.started_at.tzinfo is None
+    assert result.duration_seconds == 5.0
+
+
+def test_to_columns_and_jsonl(tmp_path):
+    ok = OperationResult(success=True, operation="backup", metadata={"host": "a"})
+    ok.mark_started()
+    ok.mark_finished()
+
+    failed = OperationResult(success=False, operation="backup", errors=["x", "y"])
+    failed.metadata["host"] = "b"
+    failed.metadata["nested"] = OperationResult(success=True)
+
+    columns = to_columns([ok, failed])
+
+    assert columns["host"] == ["a", "b"]
+    assert columns["success"] == [True, False]
+    assert columns["errors"] == [None, "x; y"]
+    assert columns["duration_seconds"][0] >= 0
+    assert columns["duration_seconds"][1] is None
+
+    path = tmp_path / "results.jsonl"
+    assert write_jsonl([ok, failed], path) == 2
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert rows[0]["metadata"] == {"host": "a"}
+    assert rows[0]["started_at"].endswith("+00:00")
+    assert rows[1]["metadata"]["nested"]["success"] is True
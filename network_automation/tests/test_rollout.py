@@ -0,0 +1,78 @@
+# network_automation/tests/test_rollout.py
+
+from network_automation.results import OperationResult
+from network_automation.rollout import plan_waves, run_rollout
+
+
+def _devices(count):
+    return [
+        {
+            "device_type": "mikrotik_routeros",
+            "host": f"10.0.0.{i}",
+            "username": "admin",
+            "password": "secret",
+            "firmware_version": "7.18.2",
+            "firmware_delivery": "download",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def test_plan_waves_canary_then_growing_batches():
+    waves = plan_waves(range(20), canary=1, growth=2.0, max_wave_size=6)
+
+    assert [len(w) for w in waves] == [1, 2, 4, 6, 6, 1]
+    assert [d for w in waves for d in w] == list(range(20))
+
+
+def test_plan_waves_growth_one_keeps_constant_waves():
+    waves = plan_waves(range(7), canary=2, growth=1.0)
+
+    assert [len(w) for w in waves] == [2, 2, 2, 1]
+
+
+def test_run_rollout_completes_all_waves(mocker):
+    mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.upgrade_helper",
+        side_effect=lambda client, return_result=False: OperationResult(
+            success=True,
+            operation="upgrade",
+        ),
+    )
+
+    waves = run_rollout(_devices(7), canary=1, growth=2.0, max_parallel=2)
+
+    assert [w.metadata["devices"] for w in waves] == [1, 2, 4]
+    assert all(w.success for w in waves)
+    assert sum(w.metadata["succeeded"] for w in waves) == 7
+
+
+def test_run_rollout_halts_on_failure_rate(mocker):
+    def fake_upgrade(client, return_result=False):
+        if client.host in ("10.0.0.2", "10.0.0.3"):
+            raise RuntimeError("version mismatch")
+        return OperationResult(success=True, operation="upgrade")
+
+    upgrade = mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.upgrade_helper",
+        side_effect=fake_upgrade,
+    )
+
+    waves = run_rollout(
+        _devices(10),
+        canary=1,
+        growth=2.0,
+        max_failure_rate=0.5,
+    )
+
+    assert len(waves) == 2
+    assert waves[0].success is True
+
+    halted = waves[1]
+    assert halted.success is False
+    assert halted.metadata["failure_rate"] == 1.0
+    assert halted.metadata["halted"] is True
+    assert halted.metadata["remaining"] == 7
+    assert len(halted.errors) == 2
+
+    assert upgrade.call_count == 3
@@ -0,0 +1,190 @@
+# network_automation/tests/test_scheduler.py
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from network_automation.platforms.mikrotik_routeros.client import MikrotikRouterOS
+from network_automation.platforms.mikrotik_routeros.upgrade import (
+    PHASE_AWAIT_ONLINE,
+    PHASE_DONE,
+    PHASE_VERIFY,
+    UpgradeState,
+)
+from network_automation.probe import PROBE_DOWN, PROBE_READY
+from network_automation.scheduler import _advance, iter_upgrades, run_upgrades
+
+UPGRADE = "network_automation.platforms.mikrotik_routeros.upgrade"
+
+
+def _devices(*hosts):
+    return [
+        {
+            "device_type": "mikrotik_routeros",
+            "host": host,
+            "username": "admin",
+            "password": "secret",
+            "firmware_version": "7.14",
+            "firmware_delivery": "download",
+            "reconnect_delay": 0,
+        }
+        for host in hosts
+    ]
+
+
+@pytest.fixture
+def fake_device(mocker):
+    """Patch the client so that devices upgrade without a network."""
+
+    versions = {}
+
+    def fake_connect(self):
+        self.conn = MagicMock()
+
+    def fake_reboot(self):
+        versions[self.host] = self.version
+        self.conn = None
+
+    def fake_get_info(client):
+        return "arm64", versions.get(client.host, "7.13")
+
+    mocker.patch.object(MikrotikRouterOS, "connect", fake_connect)
+    mocker.patch.object(MikrotikRouterOS, "reboot", fake_reboot)
+    mocker.patch(f"{UPGRADE}.get_info", side_effect=fake_get_info)
+    mocker.patch(f"{UPGRADE}.download_firmware")
+
+    return versions
+
+
+def test_run_upgrades_parks_and_resumes_devices(mocker, fake_device):
+    probes = {"10.0.0.1": [PROBE_DOWN, PROBE_DOWN], "10.0.0.2": []}
+
+    def fake_probe(self):
+        if probes[self.host]:
+            return probes[self.host].pop(0)
+        self.conn = MagicMock()
+        return PROBE_READY
+
+    mocker.patch.object(MikrotikRouterOS, "probe_reconnect", fake_probe)
+
+    seen = []
+    results = run_upgrades(
+        _devices("10.0.0.1", "10.0.0.2"),
+        max_workers=1,
+        on_state=lambda state: seen.append((state.host, state.phase)),
+    )
+
+    assert len(results) == 2
+    assert all(r.success for r in results)
+    assert {r.metadata["final_version"] for r in results} == {"7.14"}
+    assert seen.count(("10.0.0.1", PHASE_AWAIT_ONLINE)) == 3
+
+
+def test_run_upgrades_records_failures(mocker, fake_device):
+    mocker.patch.object(
+        MikrotikRouterOS,
+        "probe_reconnect",
+        side_effect=RuntimeError("probe exploded"),
+    )
+
+    [result] = run_upgrades(_devices("10.0.0.1"))
+
+    assert result.success is False
+    assert result.errors == ["probe exploded"]
+    assert result.metadata["failed_phase"] == PHASE_AWAIT_ONLINE
+
+
+def test_failing_on_state_callback_does_not_stop_upgrades(mocker, fake_device):
+    def fake_probe(self):
+        self.conn = MagicMock()
+        return PROBE_READY
+
+    mocker.patch.object(MikrotikRouterOS, "probe_reconnect", fake_probe)
+
+    def on_state(state):
+        raise OSError("state store unavailable")
+
+    results = run_upgrades(
+        _devices("10.0.0.1", "10.0.0.2"),
+        max_workers=1,
+        on_state=on_state,
+    )
+
+    assert len(results) == 2
+    assert all(r.success for r in results)
+
+
+def test_advance_detaches_state_when_step_escapes(fake_device):
+    client = MikrotikRouterOS(host="10.0.0.9", username="admin")
+    client.upgrade_step = MagicMock(side_effect=RuntimeError("boom"))
+    client.fail_upgrade = MagicMock(side_effect=KeyboardInterrupt)
+    state = UpgradeState(host="10.0.0.9", target_version="7.14")
+
+    with pytest.raises(KeyboardInterrupt):
+        _advance(client, state, None)
+
+    assert client._recorder is None
+
+
+def test_upgrade_step_resumes_from_serialized_state(fake_device):
+    client = MikrotikRouterOS(
+        host="10.0.0.9",
+        username="admin",
+        firmware_version="7.14",
+        reconnect_delay=0,
+    )
+
+    state = client.start_upgrade()
+    state.phase = PHASE_VERIFY
+    fake_device["10.0.0.9"] = "7.14"
+
+    restored = client.resume_upgrade(state.to_dict())
+    assert isinstance(restored, UpgradeState)
+
+    client.upgrade_step(restored)
+
+    assert restored.phase == PHASE_DONE
+    assert restored.final_version == "7.14"
+    assert client.upgrade_result(restored).success is True
+
+
+def test_run_upgrades_reports_phase_timings(mocker, fake_device):
+    def fake_probe(self):
+        self.conn = MagicMock()
+        return PROBE_READY
+
+    mocker.patch.object(MikrotikRouterOS, "probe_reconnect", fake_probe)
+
+    [result] = run_upgrades(_devices("10.0.0.1"))
+
+    assert [p["name"] for p in result.phases] == [
+        "preflight",
+        "provide_firmware",
+        "reboot",
+        "await_online",
+        "verify",
+    ]
+
+
+def test_iter_upgrades_pulls_devices_in_a_bounded_window(mocker, fake_device):
+    def fake_probe(self):
+        self.conn = MagicMock()
+        return PROBE_READY
+
+    mocker.patch.object(MikrotikRouterOS, "probe_reconnect", fake_probe)
+
+    pulled = []
+
+    def devices():
+        for params in _devices(*(f"10.0.0.{i}" for i in range(1, 11))):
+            pulled.append(params["host"])
+            yield params
+
+    results = iter_upgrades(devices(), max_workers=1)
+    first = next(results)
+
+    assert first.success is True
+    assert len(pulled) <= 3
+
+    assert len([first, *results]) == 10
+    assert len(pulled) == 10
@@ -0,0 +1,124 @@
+# network_automation/tests/test_sinks.py
+
+import json
+import sqlite3
+import time
+
+import pytest
+
+from network_automation.fleet import run_fleet_to_sink
+from network_automation.results import OperationResult
+from network_automation.sinks import JsonlSink, ResultSink, SqliteSink
+
+
+def _result(host, success=True):
+    result = OperationResult(success=success, operation="info")
+    result.mark_started()
+    result.mark_finished()
+    result.metadata["host"] = host
+    if not success:
+        result.errors.append("timeout")
+    return result
+
+
+def test_jsonl_sink_writes_batches(tmp_path):
+    path = tmp_path / "results.jsonl"
+
+    with JsonlSink(str(path), batch_size=2, flush_interval=0.01) as sink:
+        for i in range(5):
+            sink.put(_result(f"10.0.0.{i}"))
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["metadata"]["host"] for r in rows] == [f"10.0.0.{i}" for i in range(5)]
+    assert sink.written == 5
+
+    with pytest.raises(RuntimeError):
+        sink.put(_result("late"))
+
+
+def test_sqlite_sink(tmp_path):
+    path = tmp_path / "results.sqlite3"
+
+    with SqliteSink(str(path)) as sink:
+        sink.put(_result("a"))
+        sink.put(_result("b", success=False))
+
+    db = sqlite3.connect(path)
+    rows = db.execute("SELECT host, success, errors FROM results ORDER BY id").fetchall()
+
+    assert rows == [("a", 1, None), ("b", 0, '["timeout"]')]
+
+
+def test_write_errors_surface_on_close():
+    class BrokenSink(ResultSink):
+        def _write_batch(self, results):
+            raise OSError("disk full")
+
+    sink = BrokenSink(flush_interval=0.01)
+    sink.put(_result("a"))
+
+    with pytest.raises(OSError, match="disk full"):
+        sink.close()
+
+
+def test_write_error_surfaces_on_put():
+    class BrokenSink(ResultSink):
+        def _write_batch(self, results):
+            raise OSError("disk full")
+
+    sink = BrokenSink(batch_size=1)
+    sink.put(_result("a"))
+
+    deadline = time.monotonic() + 5
+    while sink.error is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    with pytest.raises(OSError, match="disk full"):
+        sink.put(_result("b"))
+
+
+def test_flush_interval_under_steady_load(tmp_path):
+    path = tmp_path / "results.jsonl"
+
+    with JsonlSink(str(path), batch_size=10_000, flush_interval=0.05) as sink:
+        # Results keep arriving faster than the interval; the batch
+        # must still be written before batch_size is reached
+        deadline = time.monotonic() + 5
+        while sink.written == 0 and time.monotonic() < deadline:
+            sink.put(_result("a"))
+            time.sleep(0.005)
+
+        assert sink.written > 0
+
+
+def test_result_sink_is_abstract():
+    with pytest.raises(TypeError):
+        ResultSink()
+
+
+def test_run_fleet_to_sink_returns_summary(mocker, tmp_path):
+    def fake_info(client, return_result=False):
+        return OperationResult(success=client.host != "10.0.0.2", operation="info")
+
+    mocker.patch(
+        "network_automation.platforms.mikrotik_routeros.client.read_info",
+        side_effect=fake_info,
+    )
+
+    devices = [
+        {
+            "device_type": "mikrotik_routeros",
+            "host": f"10.0.0.{i}",
+            "username": "admin",
+        }
+        for i in range(1, 4)
+    ]
+
+    path = tmp_path / "fleet.jsonl"
+    with JsonlSink(str(path)) as sink:
+        summary = run_fleet_to_sink(devices, "info", sink)
+
+    assert summary.operation == "info_fleet"
+    assert summary.success is False
+    assert summary.metadata == {"devices": 3, "succeeded": 2, "failed": 1}
+    assert len(path.read_text().splitlines()) == 3
@@ -0,0 +1,117 @@
+# network_automation/tests/test_tracing.py
+
+import json
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from network_automation.context import ExecutionContext
+from network_automation.platforms.mikrotik_routeros.client import MikrotikRouterOS
+from network_automation.tracing import (
+    ChromeTraceTracer,
+    OpenTelemetryTracer,
+    RecordingTracer,
+    Tracer,
+)
+
+
+def _client(monkeypatch, tracer):
+    conn = MagicMock()
+    conn.send_command.return_value = "OK"
+    monkeypatch.setattr(
+        "network_automation.base_client.ConnectHandler",
+        MagicMock(return_value=conn),
+    )
+
+    return MikrotikRouterOS(
+        host="10.0.0.1",
+        username="admin",
+        context=ExecutionContext(tracer=tracer, job_id="job-1"),
+    )
+
+
+def test_run_emits_spans(monkeypatch):
+    tracer = RecordingTracer()
+    client = _client(monkeypatch, tracer)
+
+    client.run(["/system resource print", "/ip address print"])
+
+    assert [s["name"] for s in tracer.spans] == [
+        "connect",
+        "command",
+        "command",
+        "run_commands",
+    ]
+    command = tracer.spans[1]
+    assert command["attributes"] == {
+        "host": "10.0.0.1",
+        "job_id": "job-1",
+        "target": "/system resource print",
+    }
+    assert command["error"] is None
+
+
+def test_span_records_error(monkeypatch):
+    tracer = RecordingTracer()
+    client = _client(monkeypatch, tracer)
+    client.connect()
+    client.conn.send_command.side_effect = OSError("socket closed")
+
+    with pytest.raises(OSError):
+        client.run("/log print")
+
+    assert tracer.spans[-1]["name"] == "run_commands"
+    assert tracer.spans[-1]["error"] == "socket closed"
+
+
+def test_chrome_trace_file(monkeypatch, tmp_path):
+    path = tmp_path / "trace.json"
+    tracer = ChromeTraceTracer(str(path))
+    client = _client(monkeypatch, tracer)
+
+    client.run("/system resource print")
+    tracer.write()
+
+    events = json.loads(path.read_text())["traceEvents"]
+    assert {e["name"] for e in events} == {"connect", "command", "run_commands"}
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+
+
+def test_opentelemetry_adapter():
+    calls = []
+
+    class FakeOtelTracer:
+        @contextmanager
+        def start_as_current_span(self, name, attributes=None, **kwargs):
+            calls.append(("start", name, attributes))
+            try:
+                yield
+            except Exception as exc:
+                calls.append(("error", name, str(exc)))
+                raise
+            calls.append(("end", name, None))
+
+    tracer = OpenTelemetryTracer(FakeOtelTracer())
+
+    span = tracer.start_span("connect", {"host": "h"})
+    tracer.end_span(span)
+
+    span = tracer.start_span("command", {})
+    tracer.end_span(span, ValueError("boom"))
+
+    assert calls == [
+        ("start", "connect", {"host": "h"}),
+        ("end", "connect", None),
+        ("start", "command", {}),
+        ("error", "command", "boom"),
+    ]
+
+
+def test_tracer_requires_span_methods():
+    class Partial(Tracer):
+        def start_span(self, name, attributes):
+            return name
+
+    with pytest.raises(TypeError):
+        Partial()
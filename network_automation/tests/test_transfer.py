@@ -0,0 +1,22 @@
+# network_automation/tests/test_transfer.py
+
+from network_automation.transfer import TransferStats
+
+
+def test_transfer_stats_aggregate():
+    stats = TransferStats()
+
+    stats.add(TransferStats(bytes=3_000_000, duration_seconds=1.0, files=1))
+    stats.add(TransferStats(bytes=1_000_000, duration_seconds=1.0, files=1))
+
+    assert stats.as_dict() == {
+        "bytes": 4_000_000,
+        "duration_seconds": 2.0,
+        "mb_per_second": 2.0,
+        "files": 2,
+        "skipped": 0,
+    }
+
+
+def test_transfer_stats_empty_rate():
+    assert TransferStats().mb_per_second == 0.0
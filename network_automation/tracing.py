@@ -0,0 +1,125 @@
+# network_automation/tracing.py
+
+"""
+Pluggable tracing.
+
+A tracer is set on ExecutionContext.tracer and receives every client
+span (connect, commands, transfers, reconnect wait, ...). The interface
+follows the OpenTelemetry shape: start a span with a name and
+attributes, end it (optionally with the exception that ended it).
+
+Without a tracer nothing is called at all (see BaseClient.span()).
+"""
+
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+
+
+class Tracer(ABC):
+    """
+    Tracer interface.
+
+    start_span() returns an opaque handle that is passed back to
+    end_span(). Implementations must be thread-safe.
+    """
+
+    @abstractmethod
+    def start_span(self, name: str, attributes: dict):
+        ...
+
+    @abstractmethod
+    def end_span(self, span, error: BaseException | None = None):
+        ...
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Adapter for an OpenTelemetry tracer.
+
+    tracer: e.g. opentelemetry.trace.get_tracer("network_automation").
+    Spans are started as current spans, so nested client spans
+    (command inside run_commands) keep their parent.
+    """
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    def start_span(self, name: str, attributes: dict):
+        manager = self.tracer.start_as_current_span(
+            name,
+            attributes=attributes,
+            record_exception=True,
+            set_status_on_exception=True,
+        )
+        manager.__enter__()
+        return manager
+
+    def end_span(self, span, error: BaseException | None = None):
+        if error is None:
+            span.__exit__(None, None, None)
+        else:
+            span.__exit__(type(error), error, error.__traceback__)
+
+
+class RecordingTracer(Tracer):
+    """Keep finished spans in memory (tests, ad-hoc analysis)."""
+
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, attributes: dict):
+        return {
+            "name": name,
+            "attributes": attributes,
+            "start": time.time(),
+            "thread": threading.get_ident(),
+        }
+
+    def end_span(self, span, error: BaseException | None = None):
+        span["end"] = time.time()
+        span["error"] = str(error) if error is not None else None
+        with self._lock:
+            self.spans.append(span)
+
+
+class ChromeTraceTracer(RecordingTracer):
+    """
+    Collect spans and write them in Chrome trace-event format.
+
+    The file opens in chrome://tracing or https://ui.perfetto.dev;
+    every worker thread is one track, so slow devices stand out.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+
+    def write(self):
+        """Write all finished spans to path (atomically)."""
+        pid = os.getpid()
+
+        with self._lock:
+            events = [
+                {
+                    "name": span["name"],
+                    "ph": "X",
+                    "ts": span["start"] * 1_000_000,
+                    "dur": (span["end"] - span["start"]) * 1_000_000,
+                    "pid": pid,
+                    "tid": span["thread"],
+                    "args": {
+                        **span["attributes"],
+                        **({"error": span["error"]} if span["error"] else {}),
+                    },
+                }
+                for span in self.spans
+            ]
+
+        temp = f"{self.path}.tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events}, f)
+        os.replace(temp, self.path)
@@ -0,0 +1,264 @@
+# network_automation/transfer.py
+
+"""
+SFTP transfer engine.
+
+Block-wise, pipelined file transfers on top of a Paramiko SFTP handle,
+with throughput statistics. Used by the platform transfer helpers.
+"""
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from paramiko import SFTPError
+
+# Paramiko splits writes/reads into requests of at most 32 KiB
+DEFAULT_BLOCK_SIZE = 32768
+
+# Maximum number of outstanding read requests during prefetch
+DEFAULT_MAX_REQUESTS = 64
+
+# Per-directory record of downloaded files (incremental downloads)
+MANIFEST_NAME = ".nauto_manifest.json"
+
+
+@dataclass
+class TransferStats:
+    """Bytes moved and time spent by one or more transfers."""
+
+    bytes: int = 0
+    duration_seconds: float = 0.0
+    files: int = 0
+    skipped: int = 0
+
+    @property
+    def mb_per_second(self) -> float:
+        if not self.duration_seconds:
+            return 0.0
+        return self.bytes / self.duration_seconds / 1_000_000
+
+    def add(self, other: "TransferStats"):
+        self.bytes += other.bytes
+        self.duration_seconds += other.duration_seconds
+        self.files += other.files
+        self.skipped += other.skipped
+
+    def as_dict(self) -> dict:
+        return {
+            "bytes": self.bytes,
+            "duration_seconds": round(self.duration_seconds, 6),
+            "mb_per_second": round(self.mb_per_second, 3),
+            "files": self.files,
+            "skipped": self.skipped,
+        }
+
+
+def put_file(
+    sftp,
+    local_path: str | Path,
+    remote_path: str,
+    *,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    offset: int = 0,
+) -> TransferStats:
+    """
+    Upload a local file using pipelined writes.
+
+    Writes are sent without waiting for each server acknowledgement;
+    acknowledgements are collected as they arrive and at close.
+
+    With offset > 0 the remote file is kept and only the bytes from
+    offset onwards are sent (resume of a partial upload).
+    Raises IOError if the remote size does not match afterwards.
+    """
+
+    started = time.monotonic()
+    sent = 0
+
+    with open(local_path, "rb") as src:
+        if offset:
+            src.seek(offset)
+            dst = sftp.open(remote_path, "r+b", bufsize=block_size)
+            dst.seek(offset)
+        else:
+            dst = sftp.open(remote_path, "wb", bufsize=block_size)
+
+        with dst:
+            dst.set_pipelined(True)
+
+            while True:
+                block = src.read(block_size)
+                if not block:
+                    break
+                dst.write(block)
+                sent += len(block)
+
+    expected = offset + sent
+    remote_size = remote_file_size(sftp, remote_path)
+    if remote_size != expected:
+        raise IOError(
+            f"Size mismatch after upload of {remote_path}: "
+            f"{remote_size} != {expected}"
+        )
+
+    return TransferStats(
+        bytes=sent,
+        duration_seconds=time.monotonic() - started,
+        files=1,
+    )
+
+
+def get_file(
+    sftp,
+    remote_path: str,
+    local_path: str | Path,
+    *,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_requests: int = DEFAULT_MAX_REQUESTS,
+    digest=None,
+) -> TransferStats:
+    """
+    Download a remote file using read-ahead prefetch.
+
+    Up to max_requests read requests are kept in flight while
+    blocks of block_size are written to the local file.
+    An optional hashlib object (digest) is updated with every block.
+    """
+
+    started = time.monotonic()
+    received = 0
+
+    file_size = sftp.stat(remote_path).st_size
+
+    with sftp.open(remote_path, "rb", bufsize=block_size) as src:
+        src.prefetch(file_size, max_requests)
+
+        with open(local_path, "wb") as dst:
+            while received < file_size:
+                block = src.read(block_size)
+                if not block:
+                    break
+                dst.write(block)
+                if digest is not None:
+                    digest.update(block)
+                received += len(block)
+
+    if received != file_size:
+        raise IOError(
+            f"Short read while downloading {remote_path}: "
+            f"{received} != {file_size}"
+        )
+
+    return TransferStats(
+        bytes=received,
+        duration_seconds=time.monotonic() - started,
+        files=1,
+    )
+
+
+# -------------------------------------------------------
+# Verification helpers
+# -------------------------------------------------------
+
+def remote_file_size(sftp, remote_path: str) -> int | None:
+    """Return remote file size, or None if the file does not exist."""
+    try:
+        return sftp.stat(remote_path).st_size
+    except FileNotFoundError:
+        return None
+
+
+def file_checksum(local_path: str | Path, algorithm: str = "sha256") -> str:
+    """Return hex digest of a local file."""
+    digest = hashlib.new(algorithm)
+
+    with open(local_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def remote_checksum(
+    sftp,
+    remote_path: str,
+    algorithm: str = "sha256",
+    *,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_requests: int = DEFAULT_MAX_REQUESTS,
+) -> str:
+    """
+    Return hex digest of a remote file.
+
+    Uses the server-side "check-file" extension when available.
+    Otherwise the file is read back (prefetched) and hashed locally,
+    which costs one full download.
+    """
+
+    with sftp.open(remote_path, "rb", bufsize=block_size) as f:
+        try:
+            return f.check(algorithm).hex()
+        except (OSError, SFTPError):
+            pass
+
+        digest = hashlib.new(algorithm)
+        f.prefetch(None, max_requests)
+
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+# -------------------------------------------------------
+# Incremental downloads
+# -------------------------------------------------------
+
+def load_manifest(local_dir: str | Path) -> dict:
+    """
+    Return the download record of local_dir.
+
+    Maps remote path -> {"size", "mtime"} of the last successful pull.
+    A missing or unreadable manifest is treated as empty.
+    """
+    try:
+        with open(Path(local_dir) / MANIFEST_NAME, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(local_dir: str | Path, manifest: dict):
+    """Write the download record atomically."""
+    path = Path(local_dir) / MANIFEST_NAME
+    temp = path.with_suffix(".tmp")
+
+    with open(temp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    os.replace(temp, path)
+
+
+def remote_unchanged(entry: dict | None, attrs, local_path: str | Path) -> bool:
+    """
+    True if the remote file still matches the recorded pull.
+
+    Size and mtime (from SFTP stat) must equal the record, and the
+    local copy must still exist with the same size.
+    """
+    if not entry:
+        return False
+
+    try:
+        local_size = os.path.getsize(local_path)
+    except OSError:
+        return False
+
+    return (
+        entry.get("size") == attrs.st_size == local_size
+        and entry.get("mtime") == attrs.st_mtime
+    )
@@ -0,0 +1,26 @@
+# network_automation/versions.py
+
+"""
+Firmware version comparison.
+
+Platform-neutral, so fleet planners (see rollout.filter_current) can
+compare versions without importing a platform package.
+"""
+
+import re
+
+
+def normalize_version(v):
+    """Normalize a dotted version string (e.g. "7.14.1 (stable)") to tuple."""
+    v = v.strip().lower()
+    m = re.search(r"\d+(?:\.\d+){0,2}", v)
+    if not m:
+        raise ValueError(f"Cannot extract numeric version from: {v}")
+    parts = m.group(0).split(".")
+    parts += ["0"] * (3 - len(parts))
+    return tuple(int(p) for p in parts)
+
+
+def is_newer_version(current_version, new_version):
+    """Return True if new_version > current_version."""
+    return normalize_version(new_version) > normalize_version(current_version)